@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Import time of the modules behind the ``cwl-utils`` console scripts.
+
+Each module is imported in a fresh interpreter, several times; the best
+wall-clock time of the ``import`` statement itself (excluding interpreter
+start-up) is reported, together with the generated parser modules
+(``cwl_utils.parser.cwl_v1_*``) that the import pulled in.
+
+Run it from the root of the repository::
+
+    python benchmarks/import_time.py
+"""
+
+import argparse
+import json
+import subprocess  # nosec
+import sys
+from importlib.metadata import entry_points
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+parsers = sorted(
+    name.rpartition(".")[2]
+    for name in sys.modules
+    if name.startswith("cwl_utils.parser.cwl_v1_") and not name.endswith("_utils")
+)
+print(json.dumps([elapsed, parsers]))
+"""
+
+
+def _entry_point_modules() -> dict[str, str]:
+    """Map the console scripts of cwl-utils to the modules that provide them."""
+    return {
+        ep.name: ep.value.partition(":")[0]
+        for ep in entry_points(group="console_scripts")
+        if ep.value.startswith("cwl_utils.")
+    }
+
+
+def _time_import(module: str, repeat: int) -> tuple[float, list[str]]:
+    best, parsers = float("inf"), []
+    for _ in range(repeat):
+        out = subprocess.run(  # nosec
+            [sys.executable, "-c", _PROBE.format(module=module)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        elapsed, parsers = json.loads(out.splitlines()[-1])
+        best = min(best, elapsed)
+    return best, parsers
+
+
+def main() -> int:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module")
+    args = parser.parse_args()
+
+    modules = _entry_point_modules()
+    if not modules:
+        print("cwl-utils is not installed, no console scripts found", file=sys.stderr)
+        return 1
+    for script, module in sorted(modules.items()):
+        best, parsers = _time_import(module, args.repeat)
+        print(
+            f"{script:>22}: {best * 1000:8.1f} ms  "
+            f"parsers: {', '.join(parsers) or '-'}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
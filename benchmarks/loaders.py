@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Micro-benchmark of the generated loaders over the ``testdata`` corpus.
+
+Every ``*.cwl`` file below ``src/cwl_utils/testdata`` is parsed once; the
+benchmark then times only the loaders (``load_document_by_yaml``) on fresh
+copies of the parsed documents, separately for the documents that load and
+for those that are rejected, and counts the schema-salad exceptions that are
+constructed along the way.
+
+Run it from the root of the repository::
+
+    python benchmarks/loaders.py
+"""
+
+import argparse
+import copy
+import sys
+import timeit
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from schema_salad.exceptions import SchemaSaladException
+from schema_salad.utils import yaml_no_ts
+
+from cwl_utils.parser import load_document_by_yaml
+
+TESTDATA = Path(__file__).resolve().parent.parent / "src" / "cwl_utils" / "testdata"
+
+
+def _corpus() -> tuple[list[tuple[Any, str]], list[tuple[Any, str]]]:
+    """Split the parsed test documents into the valid and the invalid ones."""
+    valid, invalid = [], []
+    for path in sorted(TESTDATA.rglob("*.cwl")):
+        try:
+            yaml = yaml_no_ts().load(path.read_text(encoding="utf-8"))
+        except Exception:  # nosec
+            continue
+        if not isinstance(yaml, dict):
+            continue
+        entry = (yaml, path.as_uri())
+        try:
+            load_document_by_yaml(copy.deepcopy(yaml), entry[1])
+            valid.append(entry)
+        except Exception:
+            invalid.append(entry)
+    return valid, invalid
+
+
+def _loader(docs: list[tuple[Any, str]]) -> Callable[[], None]:
+    def load() -> None:
+        for yaml, uri in docs:
+            try:
+                load_document_by_yaml(copy.deepcopy(yaml), uri)
+            except Exception:  # nosec
+                pass
+
+    return load
+
+
+def _copy_only(docs: list[tuple[Any, str]]) -> Callable[[], None]:
+    def load() -> None:
+        for yaml, _ in docs:
+            copy.deepcopy(yaml)
+
+    return load
+
+
+def _count_exceptions(load: Callable[[], None]) -> int:
+    count = 0
+    init = SchemaSaladException.__init__
+
+    def counting_init(self: SchemaSaladException, *args: Any, **kwargs: Any) -> None:
+        nonlocal count
+        count += 1
+        init(self, *args, **kwargs)
+
+    SchemaSaladException.__init__ = counting_init  # type: ignore[method-assign]
+    try:
+        load()
+    finally:
+        SchemaSaladException.__init__ = init  # type: ignore[method-assign]
+    return count
+
+
+def main() -> int:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=5, help="loads per timing")
+    parser.add_argument("--repeat", type=int, default=5, help="timings per set")
+    args = parser.parse_args()
+
+    valid, invalid = _corpus()
+    for name, docs in (("valid", valid), ("invalid", invalid)):
+        overhead = min(
+            timeit.repeat(_copy_only(docs), number=args.number, repeat=args.repeat)
+        )
+        best = min(timeit.repeat(_loader(docs), number=args.number, repeat=args.repeat))
+        per_pass = (best - overhead) / args.number
+        print(
+            f"{name:>8}: {len(docs):4d} documents, "
+            f"{per_pass * 1000:8.2f} ms per pass, "
+            f"{_count_exceptions(_loader(docs)):7d} exceptions constructed"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
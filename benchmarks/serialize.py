@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Streaming JSON output compared with ``json.dump(save(obj))``.
+
+A packed workflow with many steps, each running its own tool with many
+parameters, is generated and loaded once; it is then written to
+``os.devnull`` with ``json.dump(save(obj))`` and with ``dump_json(obj)``.
+The best wall-clock time of each and their peak memory (measured with
+tracemalloc in a separate run) are reported.
+
+Run it from the root of the repository::
+
+    python benchmarks/serialize.py [--steps N]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cwl_utils.parser import dump_json, load_document_by_uri, save
+
+
+def _packed_workflow(steps: int, parameters: int) -> dict[str, Any]:
+    tools = [
+        {
+            "class": "CommandLineTool",
+            "id": f"#tool{n}",
+            "baseCommand": "echo",
+            "inputs": [
+                {
+                    "id": f"#tool{n}/in{i}",
+                    "type": "string",
+                    "inputBinding": {"prefix": f"--in{i}"},
+                }
+                for i in range(parameters)
+            ],
+            "outputs": [{"id": f"#tool{n}/out", "type": "stdout"}],
+        }
+        for n in range(steps)
+    ]
+    main = {
+        "class": "Workflow",
+        "id": "#main",
+        "inputs": [{"id": "#main/x", "type": "string"}],
+        "outputs": [],
+        "steps": [
+            {
+                "id": f"#main/step{n}",
+                "run": f"#tool{n}",
+                "in": [{"id": f"#main/step{n}/in0", "source": "#main/x"}],
+                "out": [f"#main/step{n}/out"],
+            }
+            for n in range(steps)
+        ],
+    }
+    return {"cwlVersion": "v1.2", "$graph": [main, *tools]}
+
+
+def _measure(function: Callable[[], None], repeat: int) -> tuple[float, float]:
+    best = min(_elapsed(function) for _ in range(repeat))
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return best, peak
+
+
+def _elapsed(function: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--steps", type=int, default=200, help="steps and tools")
+    parser.add_argument("--parameters", type=int, default=30, help="tool inputs")
+    parser.add_argument("--repeat", type=int, default=3, help="timings per writer")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "packed.cwl"
+        path.write_text(json.dumps(_packed_workflow(args.steps, args.parameters)))
+        obj = load_document_by_uri(path, load_all=True, track_source_lines=False)
+
+    with open(os.devnull, "w") as devnull:
+        for name, function in (
+            ("json.dump(save())", lambda: json.dump(save(obj), devnull)),
+            ("dump_json()", lambda: dump_json(obj, devnull)),
+        ):
+            best, peak = _measure(function, args.repeat)
+            print(f"{name:>18}: {best:8.3f} s, {peak:8.1f} MiB peak")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Validating CWL documents compared with loading them.
+
+Every ``*.cwl`` file below a directory (by default ``src/cwl_utils/testdata``)
+is checked three ways: loaded with ``load_document_by_uri``, keeping the
+results as a program that loads them all would; checked one after the other
+with ``validate_documents``; and checked with ``validate_documents`` in a
+process pool. The wall-clock time of each and the peak memory (measured in
+a separate run) of the first two are reported.
+
+Run it from the root of the repository::
+
+    python benchmarks/validate.py [DIRECTORY]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from cwl_utils.parser import load_document_by_uri, preload, validate_documents
+
+TESTDATA = Path(__file__).resolve().parent.parent / "src" / "cwl_utils" / "testdata"
+
+
+def _load_all(uris: list[str]) -> Callable[[], Any]:
+    def load() -> Any:
+        loaded = []
+        for uri in uris:
+            try:
+                loaded.append(load_document_by_uri(uri, load_all=True))
+            except Exception:  # nosec
+                pass
+        return loaded
+
+    return load
+
+
+def _measure(function: Callable[[], Any], memory: bool) -> tuple[float, float | None]:
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = None
+    if memory:
+        tracemalloc.start()
+        function()
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> int:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("directory", nargs="?", type=Path, default=TESTDATA)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="processes to use"
+    )
+    args = parser.parse_args()
+
+    uris = [path.as_uri() for path in sorted(args.directory.rglob("*.cwl"))]
+    preload()
+    invalid = sum(bool(d) for d in validate_documents(uris).values())
+    print(f"{len(uris)} documents, {invalid} invalid")
+    for name, function, memory in (
+        ("load", _load_all(uris), True),
+        ("validate", lambda: validate_documents(uris), True),
+        (
+            f"validate, {args.workers} processes",
+            lambda: validate_documents(uris, workers=args.workers),
+            False,
+        ),
+    ):
+        elapsed, peak = _measure(function, memory)
+        line = f"{name:>24}: {elapsed:8.2f} s"
+        if peak is not None:
+            line += f", {peak:8.1f} MiB peak"
+        print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
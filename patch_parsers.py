@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+"""
+Patch a parser generated by ``schema-salad-tool --codegen python``.
+
+The generated parsers (``src/cwl_utils/parser/cwl_v1_*.py``) are made to use
+the helpers of :py:mod:`cwl_utils.parser.codegen_support`, where the logic
+lives, by the mechanical edits below. The ``regen_parsers`` target of the
+Makefile runs this on the output of the code generator, so regenerating the
+parsers keeps them::
+
+    python3 patch_parsers.py generated.py > src/cwl_utils/parser/cwl_v1_2.py
+
+Every edit checks that the code it changes was found, so that a change of
+the code generator is noticed instead of silently dropping the edit.
+"""
+
+import re
+import sys
+from collections.abc import Callable
+
+HEADER = """\
+# subject to the license of the original schema.
+# It was then patched with patch_parsers.py to use cwl_utils.parser.codegen_support.
+"""
+
+IMPORTS = """\
+    save,
+)
+
+from cwl_utils.parser.anonymous import anonymous_id as _anonymous_id
+from cwl_utils.parser.codegen_support import ExpandMemos as _ExpandMemos
+from cwl_utils.parser.codegen_support import LazyExtensionFields as _LazyExtensionFields
+from cwl_utils.parser.codegen_support import expand_url as _expand_url_memoized
+from cwl_utils.parser.codegen_support import extension_fields as _extension_fields
+from cwl_utils.parser.codegen_support import intern as _intern
+from cwl_utils.parser.codegen_support import load_union as _load_union
+from cwl_utils.parser.codegen_support import save_relative_uri
+from cwl_utils.parser.codegen_support import speculative as _speculative
+from cwl_utils.parser.codegen_support import union_candidates as _union_candidates
+"""
+
+UNION_LOAD = '''\
+        self._dispatch: Final[dict[tuple[type, str | None], tuple[Loader, ...]]] = {}
+
+    def add_loaders(self, loaders: Sequence[Loader]) -> None:
+        self.alternates = tuple(loader for loader in chain(self.alternates, loaders))
+        self._dispatch.clear()
+
+    def _candidates(self, doc: Any) -> tuple[Loader, ...]:
+        """Select, in order, the alternates that may accept ``doc``."""
+        return cast(tuple[Loader, ...], _union_candidates(self, doc, _vocab))
+
+    def load(
+        self,
+        doc: Any,
+        baseuri: str,
+        loadingOptions: LoadingOptions,
+        docRoot: str | None = None,
+        lc: Any | None = None,
+    ) -> Any:
+        return _load_union(self, doc, baseuri, loadingOptions, docRoot, lc)
+
+    def _diagnose(
+'''
+
+EXPAND_URL = """\
+_expand_memo: Final = _ExpandMemos(_vocab, _rvocab)
+
+
+def _expand_url(
+    url: str,
+    base_url: str,
+    loadingOptions: LoadingOptions,
+    scoped_id: bool = False,
+    vocab_term: bool = False,
+    scoped_ref: int | None = None,
+) -> str:
+    return _expand_url_memoized(
+        url,
+        base_url,
+        loadingOptions,
+        _expand_memo(loadingOptions),
+        scoped_id,
+        vocab_term,
+        scoped_ref,
+    )
+
+
+def _load_field(
+"""
+
+SPECULATIVE = r"\g<1>\g<2>    if _speculative():\n\g<2>        raise\n"
+
+SAVE_EXTENSION_FIELDS = (
+    """\
+        if relative_uris:
+            for ef in self.extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+        else:
+            for ef in self.extension_fields:
+                r[ef] = self.extension_fields[ef]
+""",
+    """\
+        extension_fields = _extension_fields(self)
+        if relative_uris:
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
+        else:
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
+""",
+)
+
+INIT_EXTENSION_FIELDS = """\
+        if extension_fields:
+            self.extension_fields = extension_fields
+        else:
+            self.extension_fields = CommentedMap()
+"""
+
+
+def replace(text: str, old: str, new: str, count: int | None = 1) -> str:
+    """Replace ``old`` by ``new``, checking how often it was found."""
+    found = text.count(old)
+    if found == 0 or (count is not None and found != count):
+        raise SystemExit(f"Expected {count or 'some'} of {old!r}, found {found}")
+    return text.replace(old, new)
+
+
+def sub(text: str, pattern: str, new: str | Callable[[re.Match[str]], str]) -> str:
+    """Substitute ``pattern`` with ``new``, checking that it was found."""
+    result, found = re.subn(pattern, new, text)
+    if not found:
+        raise SystemExit(f"Expected some of {pattern!r}")
+    return result
+
+
+def patch_runtime(text: str) -> str:
+    """Patch the loaders and helpers that precede the generated classes."""
+    text = replace(
+        text,
+        "class _ArrayLoader(Loader):\n"
+        "    def __init__(self, items: Loader) -> None:\n"
+        "        self.items: Final = items\n",
+        "class _ArrayLoader(Loader):\n"
+        "    def __init__(self, items: Loader) -> None:\n"
+        "        self.items: Final = items\n"
+        "        self._item_loader: Final = _UnionLoader([self, items])\n",
+    )
+    text = replace(
+        text,
+        "                lf = _load_field(\n"
+        "                    doc[i], _UnionLoader([self, self.items]), baseuri, loadingOptions, lc=lc\n"
+        "                )\n",
+        "                lf = _load_field(doc[i], self._item_loader, baseuri, loadingOptions, lc=lc)\n",
+    )
+    text = sub(
+        text,
+        r"(\n( +)except ValidationException as e:\n)"
+        r"(?=\s+(?:e = ValidationException\(\s+\"array item|errors\.append\(e\.with_sourceline))",
+        SPECULATIVE,
+    )
+    text = replace(
+        text,
+        "            return cast(str, doc)\n",
+        "            return _intern(cast(str, doc))\n",
+    )
+    start = text.index("class _UnionLoader(Loader):")
+    end = text.index("\nclass ", start + 1)
+    union = text[start:end]
+    union = replace(
+        union,
+        """\
+        self.name: Final = name
+
+    def add_loaders(self, loaders: Sequence[Loader]) -> None:
+        self.alternates = tuple(loader for loader in chain(self.alternates, loaders))
+
+    def load(
+""",
+        "        self.name: Final = name\n" + UNION_LOAD,
+    )
+    text = text[:start] + union + text[end:]
+    return sub(
+        text,
+        r"(?s)def _expand_url\(.*?\n\n\ndef _load_field\(\n",
+        lambda match: EXPAND_URL,
+    )
+
+
+def patch_classes(text: str) -> str:
+    """Patch the generated classes."""
+    text = sub(
+        text,
+        r"(\n( +)except ValidationException as e:\n)(?=\s+error_message, to_print, verb_tensage)",
+        SPECULATIVE,
+    )
+    text = replace(text, *SAVE_EXTENSION_FIELDS, count=None)
+    text = replace(
+        text,
+        "_vocab | loadingOptions.vocab",
+        "_expand_memo(loadingOptions).vocab",
+        None,
+    )
+    text = replace(
+        text,
+        "_vocab | self.loadingOptions.vocab",
+        "_expand_memo(self.loadingOptions).vocab",
+        None,
+    )
+    text = replace(
+        text,
+        "_rvocab | self.loadingOptions.rvocab",
+        "_expand_memo(self.loadingOptions).rvocab",
+        None,
+    )
+    classes = re.split(r"(?m)^(?=class )", text)
+    for i, body in enumerate(classes):
+        if INIT_EXTENSION_FIELDS in body:
+            body = replace(
+                body,
+                "\n    def __init__(",
+                "\n    extension_fields = _LazyExtensionFields()\n\n    def __init__(",
+            )
+            classes[i] = body.replace(
+                INIT_EXTENSION_FIELDS,
+                "\n".join(INIT_EXTENSION_FIELDS.split("\n")[:2]) + "\n",
+            )
+    return "".join(classes)
+
+
+def patch(text: str) -> str:
+    """Patch the source of a generated parser."""
+    text = replace(text, "# subject to the license of the original schema.\n", HEADER)
+    text = replace(text, "import uuid as _uuid__\n", "")
+    text = replace(text, "    save,\n    save_relative_uri,\n)\n", IMPORTS)
+    text = replace(text, '"_:" + str(_uuid__.uuid4())', "_anonymous_id()", None)
+    split = text.index("\ndef parser_info()")
+    return patch_runtime(text[:split]) + patch_classes(text[split:])
+
+
+def main() -> None:
+    """Patch the generated parser named on the command line to stdout."""
+    with open(sys.argv[1], encoding="utf-8") as handle:
+        sys.stdout.write(patch(handle.read()))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,10 @@ def arg_parser() -> argparse.ArgumentParser:
 
 def run(args: argparse.Namespace) -> int:
     """Extract the software requirements."""
-    for req in traverse(cwl.load_document_by_uri(args.input)):
+    top = cwl.load_document_by_uri(
+        args.input, lazy=True, fields=("requirements", "hints", "steps")
+    )
+    for req in traverse(top):
         process_software_requirement(req)
     return 0
 
@@ -65,6 +68,8 @@ def traverse(process: cwl.Process) -> Iterator[cwl.SoftwareRequirement]:
 
 def get_process_from_step(step: cwl.WorkflowStep) -> cwl.Process:
     """Return the process for this step, loading it if needed."""
+    if isinstance(step.run, cwl.LazyProcess):
+        return cast(cwl.Process, step.run.resolve())
     if isinstance(step.run, str):
         return cast(cwl.Process, cwl.load_document_by_uri(step.run))
     return cast(cwl.Process, step.run)
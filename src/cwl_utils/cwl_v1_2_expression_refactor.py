@@ -5,7 +5,6 @@
 
 import copy
 import hashlib
-import uuid
 from collections.abc import Mapping, MutableSequence, Sequence
 from contextlib import suppress
 from typing import Any, cast, Final
@@ -22,6 +21,8 @@ import cwl_utils.parser.cwl_v1_2 as cwl
 import cwl_utils.parser.cwl_v1_2_utils as utils
 from cwl_utils.errors import JavascriptException, WorkflowException
 from cwl_utils.expression import do_eval, interpolate
+from cwl_utils.parser.anonymous import anonymous_id
+from cwl_utils.parser.cloning import clone, replace
 from cwl_utils.parser.utils import param_for_source_id
 from cwl_utils.types import (
     CWLDirectoryType,
@@ -43,7 +44,7 @@ def expand_stream_shortcuts(process: cwl.CommandLineTool) -> cwl.CommandLineTool
     for index, output in enumerate(process.outputs):
         if output.type_ == "stdout":  # TODO: add 'stdin' for CWL v1.1
             if not result:
-                result = copy.deepcopy(process)
+                result = clone(process)
             stdout_path = process.stdout
             if not stdout_path:
                 stdout_path = hashlib.sha1(  # nosec
@@ -66,7 +67,7 @@ def clean_type_ids(
     cwltype: ArraySchema | cwl.InputRecordSchema,
 ) -> ArraySchema | cwl.InputRecordSchema:
     """Simplify type identifiers."""
-    result = copy.deepcopy(cwltype)
+    result = clone(cwltype)
     if isinstance(result, ArraySchema):
         if isinstance(result.items, MutableSequence):
             for item in result.items:
@@ -292,7 +293,7 @@ def traverse(
                 id="#main",
                 in_=step_inputs,
                 out=step_outputs,
-                run=copy.deepcopy(process),
+                run=clone(process),
             )
             workflow = cwl.Workflow(
                 inputs=wf_inputs,
@@ -312,8 +313,7 @@ def traverse(
             # Why call get_expression on an ExpressionTool?
             # It normalizes the form of $() CWL expressions into the ${} style
             if expression:
-                process2 = copy.deepcopy(process)
-                process2.expression = expression
+                process2 = replace(process, expression=expression)
             else:
                 process2 = process
             return etool_to_cltool(process2), True
@@ -408,7 +408,7 @@ def generate_etool_from_expr(
         else None
     )
     return cwl.ExpressionTool(
-        id="_:" + str(uuid.uuid4()),
+        id=anonymous_id(),
         inputs=inputs,
         outputs=outputs,
         expression=expression,
@@ -706,7 +706,7 @@ def process_workflow_inputs_and_outputs(
                 etool_id = "_pickValue_workflow_step_{}".format(
                     param2.id.split("#")[-1]
                 )
-                target_type = copy.deepcopy(param2.type_)
+                target_type = clone(param2.type_)
                 if isinstance(target_type, cwl.OutputArraySchema):
                     target_type.name = ""
                 target = cwl.WorkflowInputParameter(id=None, type_=target_type)
@@ -803,9 +803,9 @@ def process_workflow_reqs_and_hints(
                                     replace_etool,
                                 )
                                 if envVarReq is None:
-                                    envVarReq = copy.deepcopy(req)
+                                    envVarReq = clone(req)
                                     prop_reqs += (cwl.EnvVarRequirement,)
-                                newEnvDef = copy.deepcopy(envDef)
+                                newEnvDef = clone(envDef)
                                 newEnvDef.envValue = f"$(inputs._envDef{index})"
                                 envVarReq.envDef[index] = newEnvDef
                                 generated_envVar_reqs.append((etool_id, index))
@@ -863,7 +863,7 @@ def process_workflow_reqs_and_hints(
                             )
                             prop_reqs += (cwl.InitialWorkDirRequirement,)
                     else:
-                        iwdr = copy.deepcopy(req)
+                        iwdr = clone(req)
                         for index, entry in enumerate(req.listing):
                             expression = get_expression(entry, inputs, None)
                             if expression:
@@ -1533,7 +1533,7 @@ def traverse_CommandLineTool(
                             clt, _DEFAULT_CWL_VERSION
                         )
                     )
-                    orig_step_inputs = copy.deepcopy(step.in_)
+                    orig_step_inputs = clone(step.in_)
                     for orig_step_input in orig_step_inputs:
                         orig_step_input.id = orig_step_input.id.split("/")[-1]
                         if isinstance(orig_step_input.source, MutableSequence):
@@ -1580,7 +1580,7 @@ def traverse_CommandLineTool(
                     cwl_utils.expression_refactor.process_CommandLineTool_output(
                         new_clt_step.run, _DEFAULT_CWL_VERSION, outp_id
                     )
-                    new_clt_step.in_ = copy.deepcopy(step.in_)
+                    new_clt_step.in_ = clone(step.in_)
                     for inp in new_clt_step.in_:
                         inp.id = inp.id.split("/")[-1]
                         inp.source = inp.id
@@ -1685,7 +1685,7 @@ def replace_step_clt_expr_with_etool(
         )
     else:
         etool = temp_etool
-    wf_step_inputs = copy.deepcopy(step.in_)
+    wf_step_inputs = clone(step.in_)
     for wf_step_input in wf_step_inputs:
         wf_step_input.id = wf_step_input.id.split("/")[-1]
     wf_step_inputs[:] = [x for x in wf_step_inputs if not x.id.startswith("_")]
@@ -1732,7 +1732,7 @@ def replace_clt_hintreq_expr_with_etool(
         )
     else:
         etool = temp_etool
-    wf_step_inputs = copy.deepcopy(step.in_)
+    wf_step_inputs = clone(step.in_)
     for wf_step_input in wf_step_inputs:
         wf_step_input.id = wf_step_input.id.split("/")[-1]
     wf_step_inputs[:] = [x for x in wf_step_inputs if not x.id.startswith("_")]
@@ -1851,7 +1851,7 @@ def generate_etool_from_expr2(
  }"""
     )
     return cwl.ExpressionTool(
-        id="_:" + str(uuid.uuid4()),
+        id=anonymous_id(),
         inputs=inputs,
         outputs=outputs,
         expression=expression,
@@ -1874,8 +1874,8 @@ def traverse_step(
     if not step.id:
         return False
     step_id = step.id.split("#")[-1]
-    original_process = copy.deepcopy(step.run)
-    original_step_ins = copy.deepcopy(step.in_)
+    original_process = clone(step.run)
+    original_step_ins = clone(step.in_)
     for inp in step.in_:
         if inp.valueFrom:
             if not inp.source:
@@ -2025,7 +2025,7 @@ def workflow_step_to_WorkflowInputParameters(
             continue
         inp_id = inp.id.split("#")[-1].split("/")[-1]
         if inp.source and inp_id != except_in_id:
-            param = copy.deepcopy(param_for_source_id(parent, sourcenames=inp.source))
+            param = clone(param_for_source_id(parent, sourcenames=inp.source))
             if isinstance(param, MutableSequence):
                 for p in param:
                     p.id = inp_id
@@ -2093,7 +2093,7 @@ def replace_step_valueFrom_expr_with_etool(
         )
     else:
         etool = temp_etool
-    wf_step_inputs = copy.deepcopy(original_step_ins)
+    wf_step_inputs = clone(original_step_ins)
     if source:
         wf_step_inputs.append(cwl.WorkflowStepInput(id="self", source=step_inp.source))
     for wf_step_input in wf_step_inputs:
@@ -2113,7 +2113,7 @@ def replace_step_valueFrom_expr_with_etool(
         for x in wf_step_inputs
         if x.id and not (x.id.startswith("_") or x.id.endswith(step_inp_id))
     ]
-    scatter = copy.deepcopy(step.scatter)
+    scatter = clone(step.scatter)
     if isinstance(scatter, str):
         scatter = [scatter]
     if isinstance(scatter, MutableSequence):
@@ -2174,7 +2174,7 @@ def replace_step_when_expr_with_etool(
         )
     else:
         etool = temp_etool
-    wf_step_inputs = copy.deepcopy(original_step_ins)
+    wf_step_inputs = clone(original_step_ins)
     for wf_step_input in wf_step_inputs:
         if not wf_step_input.id:
             continue
@@ -2186,7 +2186,7 @@ def replace_step_when_expr_with_etool(
             else:
                 wf_step_input.source = wf_step_input.source.split("#")[-1]
     wf_step_inputs[:] = [x for x in wf_step_inputs if x.id and not x.id.startswith("_")]
-    scatter = copy.deepcopy(step.scatter)
+    scatter = clone(step.scatter)
     if isinstance(scatter, str):
         scatter = [scatter]
     if isinstance(scatter, MutableSequence):
@@ -53,7 +53,9 @@ def run(args: argparse.Namespace) -> list[cwl.DockerRequirement]:
     if args.dir:
         Path(args.dir).mkdir(parents=True, exist_ok=True)
 
-    top = cwl.load_document_by_uri(args.input)
+    top = cwl.load_document_by_uri(
+        args.input, lazy=True, fields=("requirements", "hints", "steps")
+    )
     reqs: list[cwl.DockerRequirement] = []
 
     for req in traverse(top):
@@ -123,6 +125,8 @@ def traverse(process: cwl.Process) -> Iterator[cwl.DockerRequirement]:
 
 def get_process_from_step(step: cwl.WorkflowStep) -> cwl.Process:
     """Return the process for this step, loading it if necessary."""
+    if isinstance(step.run, cwl.LazyProcess):
+        return cast(cwl.Process, step.run.resolve())
     if isinstance(step.run, str):
         return cast(cwl.Process, cwl.load_document_by_uri(step.run))
     return cast(cwl.Process, step.run)
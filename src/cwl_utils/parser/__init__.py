@@ -1,18 +1,49 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+import importlib
 import os
+import pickle  # nosec
+import sys
 from abc import ABC
-from collections.abc import MutableMapping, MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+)
 from pathlib import Path
-from typing import Any, TypeAlias, cast
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, TypeAlias, cast
 from urllib.parse import unquote_plus, urlparse
 
 import schema_salad.metaschema
 import schema_salad.runtime
 from schema_salad.exceptions import ValidationException
-from schema_salad.utils import yaml_no_ts
 
-from . import cwl_v1_0, cwl_v1_1, cwl_v1_2
+from .anonymous import CountingIds as CountingIds  # noqa: F401
+from .anonymous import anonymous_ids as anonymous_ids  # noqa: F401
+from .cache import ParseCache
+from .catalog import Catalog as Catalog  # noqa: F401
+from .cloning import clone as clone  # noqa: F401
+from .cloning import replace as replace  # noqa: F401
+from .hashing import ContentHasher as ContentHasher  # noqa: F401
+from .hashing import content_hash as content_hash  # noqa: F401
+from .index import IdIndex as IdIndex  # noqa: F401
+from .ingest import parse_document
+from .lazy import LazyProcess as LazyProcess  # noqa: F401
+from .lazy import make_runs_lazy
+from .prefetch import prefetch_references
+from .projection import project
+from .serialize import dump_json as dump_json  # noqa: F401
+from .serialize import dump_yaml as dump_yaml  # noqa: F401
+from .validate import Diagnostic as Diagnostic  # noqa: F401
+from .validate import validate_document as validate_document  # noqa: F401
+from .validate import validate_documents as validate_documents  # noqa: F401
+from .workspace import Workspace as Workspace  # noqa: F401
 from ..errors import GraphTargetMissingException
 
 
@@ -20,6 +51,71 @@ class NoType(ABC):
     pass
 
 
+_VERSION_MODULES = {"v1.0": "cwl_v1_0", "v1.1": "cwl_v1_1", "v1.2": "cwl_v1_2"}
+
+
+def _version_module(version: str) -> ModuleType:
+    """Import (on first use) the generated parser for a cwlVersion."""
+    return importlib.import_module(f"{__name__}.{_VERSION_MODULES[version]}")
+
+
+class _DeferredClass(type):
+    """
+    Metaclass of the stand-ins for the classes of the generated parsers.
+
+    The type unions below are built from these stand-ins instead of the real
+    classes, so that ``cwl_utils.parser`` can be imported without importing
+    all the generated parsers. ``isinstance()`` and ``issubclass()`` checks
+    are forwarded to the real class once its module has been imported; until
+    then no object can be an instance of it.
+    """
+
+    _module: str
+    _target: type | None
+
+    def _resolve(cls) -> type | None:
+        if cls._target is None:
+            module = sys.modules.get(cls._module)
+            if module is not None:
+                cls._target = getattr(module, cls.__name__, None)
+        return cls._target
+
+    def __instancecheck__(cls, instance: Any) -> bool:
+        target = cls._resolve()
+        return target is not None and isinstance(instance, target)
+
+    def __subclasscheck__(cls, subclass: type) -> bool:
+        target = cls._resolve()
+        return target is not None and issubclass(subclass, target)
+
+
+class _DeferredModule:
+    """Hand out :py:class:`_DeferredClass` stand-ins for a generated parser."""
+
+    def __init__(self, name: str) -> None:
+        self._name = f"{__name__}.{name}"
+        self._classes: dict[str, type] = {}
+
+    def __getattr__(self, name: str) -> type:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._classes:
+            self._classes[name] = _DeferredClass(
+                name,
+                (),
+                {"__module__": self._name, "_module": self._name, "_target": None},
+            )
+        return self._classes[name]
+
+
+if TYPE_CHECKING:
+    from . import cwl_v1_0, cwl_v1_1, cwl_v1_2
+else:
+    cwl_v1_0 = _DeferredModule("cwl_v1_0")
+    cwl_v1_1 = _DeferredModule("cwl_v1_1")
+    cwl_v1_2 = _DeferredModule("cwl_v1_2")
+
+
 LoadingOptions: TypeAlias = schema_salad.runtime.LoadingOptions
 """Type union for a CWL v1.x LoadingOptions object."""
 Saveable: TypeAlias = schema_salad.runtime.Saveable
@@ -290,6 +386,17 @@ ResourceRequirement: TypeAlias = (
 Loader: TypeAlias = schema_salad.runtime.Loader
 """Type union for a CWL v1.x Loader."""
 
+_ProcessTypes = (cwl_v1_0.Process, cwl_v1_1.Process, cwl_v1_2.Process)
+
+if not TYPE_CHECKING:
+    # The generated parsers themselves are only imported on first use.
+    del cwl_v1_0, cwl_v1_1, cwl_v1_2
+
+    def __getattr__(name: str) -> Any:
+        if name in _VERSION_MODULES.values():
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def _get_id_from_graph(yaml: MutableMapping[str, Any], id_: str | None) -> Any:
     if id_ is None:
@@ -318,12 +425,31 @@ def cwl_version(yaml: Any) -> str | None:
     return cast(str, yaml["cwlVersion"])
 
 
-def load_document_by_uri(
-    path: str | Path,
-    loadingOptions: LoadingOptions | None = None,
-    load_all: bool = False,
-) -> Any:
-    """Load a CWL object from a URI or a path."""
+def preload(versions: Iterable[str] | None = None) -> None:
+    """
+    Import the generated parsers now instead of on first use.
+
+    The parsers (and their tables of loaders) are otherwise only built by the
+    first load of a document of that cwlVersion, in every process that does
+    one. Call this before starting worker processes with ``fork`` so that the
+    workers inherit the parsers from the parent instead of each importing
+    them again.
+
+    :param versions: The cwlVersions to import the parsers of, all of them by
+        default.
+
+    :raises ValidationException: If one of the `versions` is not known.
+    """
+    for version in _VERSION_MODULES if versions is None else versions:
+        if version not in _VERSION_MODULES:
+            raise ValidationException(
+                f"Version error. Did not recognise {version} as a CWL version"
+            )
+        _version_module(version)
+
+
+def _split_uri(path: str | Path) -> tuple[str, str, str | None]:
+    """Get the document URI, its base URI and the fragment of ``path``."""
     if isinstance(path, str):
         uri = urlparse(path)
         id_ = uri.fragment or None
@@ -337,17 +463,85 @@ def load_document_by_uri(
         real_uri = path.resolve().as_uri()
         base_uri = path.resolve().parent.as_uri()
         id_ = path.resolve().name.split("#")[1] if "#" in path.resolve().name else None
+    return real_uri, base_uri, id_
+
 
+def load_document_by_uri(
+    path: str | Path,
+    loadingOptions: LoadingOptions | None = None,
+    load_all: bool = False,
+    cache: ParseCache | None = None,
+    workers: int | None = None,
+    lazy: bool = False,
+    track_source_lines: bool = True,
+    index: IdIndex | None = None,
+    fields: Collection[str] | None = None,
+) -> Any:
+    """
+    Load a CWL object from a URI or a path.
+
+    :param cache: Optional persistent parse cache; on a hit the loaded object is
+        restored from disk instead of being parsed again.
+    :param workers: If greater than one, first fetch, parse and load all the
+        ``run``, ``$import`` and ``$include`` references reachable from the
+        document using that many threads, and store the loaded processes in
+        ``loadingOptions.idx``.
+    :param lazy: Replace the external ``run`` references of workflow steps with
+        :py:class:`LazyProcess` proxies that load the referenced process on
+        first attribute access.
+    :param track_source_lines: Set to ``False`` to parse the document with a
+        plain JSON/YAML loader instead of the ruamel round-trip loader. This is
+        much faster, especially for packed JSON documents, but validation
+        errors will not include line and column numbers.
+    :param index: Optional :py:class:`IdIndex` to add the loaded object, and
+        every identified object in it, to.
+    :param fields: Only load (and validate) these fields of the processes and
+        workflow steps, as described in
+        :py:func:`cwl_utils.parser.projection.project`. Processes loaded
+        later for ``run`` references (with ``workers`` or ``lazy``) are
+        projected too. The ``cache`` is not used for projected loads, but
+        the projected processes are indexed in ``loadingOptions`` like any
+        other, so do not share those with loads that need every field.
+    """
+    real_uri, base_uri, id_ = _split_uri(path)
     loadingOptions = LoadingOptions(
         fileuri=real_uri, baseuri=base_uri, copyfrom=loadingOptions
     )
-    return load_document_by_string(
-        loadingOptions.fetcher.fetch_text(real_uri),
-        real_uri,
-        loadingOptions,
-        id_,
-        load_all,
-    )
+    text = loadingOptions.fetcher.fetch_text(real_uri)
+    if fields is not None:
+        cache = None
+    if cache is not None:
+        cached = cache.get(real_uri, text, id_, load_all, loadingOptions)
+        if cached is not None:
+            if index is not None:
+                index.add(cached)
+            return make_runs_lazy(cached) if lazy else cached
+    if workers is not None and workers > 1:
+        result = load_document_by_yaml(
+            prefetch_references(
+                real_uri, text, loadingOptions, workers, track_source_lines, fields
+            ),
+            real_uri,
+            loadingOptions,
+            id_,
+            load_all,
+            fields,
+        )
+    else:
+        result = load_document_by_string(
+            text,
+            real_uri,
+            loadingOptions,
+            id_,
+            load_all,
+            track_source_lines,
+            fields,
+        )
+    if cache is not None:
+        cache.put(real_uri, text, id_, load_all, loadingOptions, result)
+    if index is not None:
+        index.add(result)
+    return make_runs_lazy(result, fields) if lazy else result
 
 
 def load_document(
@@ -356,13 +550,27 @@ def load_document(
     loadingOptions: LoadingOptions | None = None,
     id_: str | None = None,
     load_all: bool = False,
+    track_source_lines: bool = True,
+    fields: Collection[str] | None = None,
 ) -> Any:
-    """Load a CWL object from a serialized YAML string or a YAML object."""
+    """
+    Load a CWL object from a serialized YAML string or a YAML object.
+
+    :param track_source_lines: See :py:func:`load_document_by_uri`.
+    :param fields: See :py:func:`load_document_by_uri`.
+    """
     if baseuri is None:
         baseuri = schema_salad.runtime.file_uri(str(Path.cwd())) + "/"
     if isinstance(doc, str):
-        return load_document_by_string(doc, baseuri, loadingOptions, id_)
-    return load_document_by_yaml(doc, baseuri, loadingOptions, id_, load_all)
+        return load_document_by_string(
+            doc,
+            baseuri,
+            loadingOptions,
+            id_,
+            track_source_lines=track_source_lines,
+            fields=fields,
+        )
+    return load_document_by_yaml(doc, baseuri, loadingOptions, id_, load_all, fields)
 
 
 def load_document_by_string(
@@ -371,10 +579,17 @@ def load_document_by_string(
     loadingOptions: LoadingOptions | None = None,
     id_: str | None = None,
     load_all: bool = False,
+    track_source_lines: bool = True,
+    fields: Collection[str] | None = None,
 ) -> Any:
-    """Load a CWL object from a serialized YAML string."""
-    result = yaml_no_ts().load(string)
-    return load_document_by_yaml(result, uri, loadingOptions, id_, load_all)
+    """
+    Load a CWL object from a serialized YAML string.
+
+    :param track_source_lines: See :py:func:`load_document_by_uri`.
+    :param fields: See :py:func:`load_document_by_uri`.
+    """
+    result = parse_document(string, track_source_lines)
+    return load_document_by_yaml(result, uri, loadingOptions, id_, load_all, fields)
 
 
 def load_document_by_yaml(
@@ -383,19 +598,25 @@ def load_document_by_yaml(
     loadingOptions: LoadingOptions | None = None,
     id_: str | None = None,
     load_all: bool = False,
+    fields: Collection[str] | None = None,
 ) -> Any:
-    """Load a CWL object from a YAML object."""
+    """
+    Load a CWL object from a YAML object.
+
+    :param fields: See :py:func:`load_document_by_uri`. The YAML object is
+        changed in place.
+    """
     version = cwl_version(yaml)
     if "$graph" in yaml and not load_all:
         yaml = _get_id_from_graph(yaml, id_)
         yaml["cwlVersion"] = version
+    if fields is not None:
+        project(yaml, fields)
     match version:
-        case "v1.0":
-            result = cwl_v1_0.load_document_by_yaml(yaml, uri, loadingOptions)
-        case "v1.1":
-            result = cwl_v1_1.load_document_by_yaml(yaml, uri, loadingOptions)
-        case "v1.2":
-            result = cwl_v1_2.load_document_by_yaml(yaml, uri, loadingOptions)
+        case "v1.0" | "v1.1" | "v1.2":
+            result = _version_module(version).load_document_by_yaml(
+                yaml, uri, loadingOptions
+            )
         case None:
             raise ValidationException("could not get the cwlVersion")
         case _:
@@ -413,6 +634,145 @@ def load_document_by_yaml(
     return result
 
 
+def iter_graph(
+    path: str | Path,
+    predicate: Callable[[str], bool] | None = None,
+    loadingOptions: LoadingOptions | None = None,
+    track_source_lines: bool = True,
+) -> Iterator[Any]:
+    """
+    Load the processes of a packed (``$graph``) CWL document one at a time.
+
+    Unlike ``load_document_by_uri(path, load_all=True)``, the processes are
+    loaded lazily, in document order, and each one gets its own index of
+    loaded objects. Only the process being loaded and the parsed entries not
+    yet reached are kept alive by the iterator, so peak memory stays
+    proportional to one process (plus the parsed text) as long as the caller
+    does not keep the yielded objects. A document without ``$graph`` is
+    treated as a graph of one process.
+
+    :param predicate: Only load the entries whose ``id`` (without the leading
+        ``#``) it accepts.
+    :param track_source_lines: See :py:func:`load_document_by_uri`.
+    """
+    real_uri, base_uri, _ = _split_uri(path)
+    loadingOptions = LoadingOptions(
+        fileuri=real_uri, baseuri=base_uri, copyfrom=loadingOptions
+    )
+    yaml = parse_document(
+        loadingOptions.fetcher.fetch_text(real_uri), track_source_lines
+    )
+    version = cwl_version(yaml)
+    graph = yaml.pop("$graph") if "$graph" in yaml else [yaml]
+    for i, entry in enumerate(graph):
+        graph[i] = None  # release the parsed entry once it is loaded
+        if predicate is not None and not predicate(
+            str(entry.get("id", "")).lstrip("#")
+        ):
+            continue
+        if entry is not yaml:
+            for key in ("$namespaces", "$schemas", "$base"):
+                if key in yaml:
+                    entry[key] = yaml[key]
+        entry["cwlVersion"] = version
+        yield load_document_by_yaml(
+            entry,
+            real_uri,
+            LoadingOptions(copyfrom=loadingOptions, idx={}),
+        )
+
+
+def _init_batch_worker() -> None:
+    """Prepare a worker process of :py:func:`load_documents`."""
+    from .pickling import register
+
+    preload()
+    register()
+
+
+def _load_for_batch(
+    uri: str, saved: bool, load_all: bool, track_source_lines: bool
+) -> Any:
+    """Load one document of :py:func:`load_documents` in a worker process."""
+    try:
+        result = load_document_by_uri(
+            uri, load_all=load_all, track_source_lines=track_source_lines
+        )
+        return save(result) if saved else result
+    except Exception as e:
+        try:
+            return pickle.loads(pickle.dumps(e))  # nosec
+        except Exception:
+            # the source lines of schema-salad errors can not be unpickled
+            return ValidationException(str(e))
+
+
+def load_documents(
+    paths: Iterable[str | Path],
+    workers: int | None = None,
+    saved: bool = False,
+    load_all: bool = False,
+    track_source_lines: bool = True,
+) -> dict[str, Any]:
+    """
+    Load many independent documents, each on its own.
+
+    A document that fails to load does not stop the others; the exception
+    it raised, of any type (a :py:class:`ValidationException`, but also the
+    errors of the YAML parser or of the fetcher), is returned in its place
+    instead.
+
+    :param paths: The documents to load, as URIs or paths.
+    :param workers: If greater than one, load the documents in that many
+        processes. The loaded objects are then sent back to this process with
+        the compact protocol of :py:mod:`cwl_utils.parser.pickling`, and the
+        exceptions as they are, except those that can not be unpickled (such
+        as schema-salad errors with source lines): these are returned as a
+        :py:class:`ValidationException` with the same message.
+    :param saved: Return the :py:func:`save` form of each document (plain
+        dicts and lists, which are much cheaper to pickle) instead of the
+        loaded objects.
+    :param load_all: See :py:func:`load_document_by_uri`.
+    :param track_source_lines: See :py:func:`load_document_by_uri`.
+
+    :returns: The loaded object (or its saved form) or the exception of each
+        document, by URI, in the order of ``paths``.
+    """
+    uris = [_split_uri(path)[0] for path in paths]
+    if workers is None or workers <= 1:
+        results: dict[str, Any] = {}
+        for uri in uris:
+            try:
+                result = load_document_by_uri(
+                    uri, load_all=load_all, track_source_lines=track_source_lines
+                )
+                results[uri] = save(result) if saved else result
+            except Exception as e:
+                results[uri] = e
+        return results
+    from .pickling import reset
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker
+    ) as pool:
+        chunksize = max(1, len(uris) // (workers * 4))
+        loaded = pool.map(
+            functools.partial(
+                _load_for_batch,
+                saved=saved,
+                load_all=load_all,
+                track_source_lines=track_source_lines,
+            ),
+            uris,
+            chunksize=chunksize,
+        )
+        try:
+            return dict(zip(uris, loaded))
+        finally:
+            # the results of the next batch get options of their own
+            reset()
+
+
 def save(
     val: Saveable | MutableSequence[Saveable] | None,
     top: bool = True,
@@ -449,7 +809,7 @@ def save(
 
 def is_process(v: Any) -> bool:
     """Test to see if the object is a CWL v1.x Python Process object."""
-    return isinstance(v, cwl_v1_0.Process | cwl_v1_1.Process | cwl_v1_2.Process)
+    return isinstance(v, _ProcessTypes)
 
 
 def version_split(version: str) -> MutableSequence[int]:
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Identifiers of anonymous objects.
+
+Objects that have an identifier field (``id`` or ``name``) but were not
+given one, such as anonymous record schemas or processes created in code,
+get a blank node identifier (``_:...``) when they are loaded or created.
+By default it is made from a random UUID, so it differs from run to run.
+Within :py:func:`anonymous_ids`, a different strategy is used instead, for
+example a :py:class:`CountingIds`, which gives the same identifiers every
+time the same documents are loaded in the same order::
+
+    with anonymous_ids(CountingIds()):
+        process = load_document_by_uri(path)
+
+The strategy applies to the current thread (or asyncio task), and to the
+threads that :py:func:`cwl_utils.parser.load_document_by_uri` and
+:py:class:`cwl_utils.parser.workspace.Workspace` load documents in when
+given ``workers=N``, but not to the worker processes of
+:py:func:`cwl_utils.parser.load_documents`. Those threads share the
+strategy: a :py:class:`CountingIds` still gives every object a distinct
+identifier, but which object gets which depends on the order the threads
+run in, so the identifiers are only the same from run to run without
+``workers``.
+"""
+
+import itertools
+import threading
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_strategy: ContextVar[Callable[[], str] | None] = ContextVar("_strategy", default=None)
+
+
+def uuid_ids() -> str:
+    """Make a blank node identifier from a random UUID (the default)."""
+    return "_:" + str(uuid.uuid4())
+
+
+class CountingIds:
+    """
+    Make blank node identifiers from a counter: ``_:1``, ``_:2``...
+
+    Objects that are used together (such as the documents loaded into one
+    index) should get their identifiers from the same counter, or from
+    counters with different prefixes, so that they are all distinct.
+    """
+
+    def __init__(self, prefix: str = "", start: int = 1) -> None:
+        """
+        Create a counter.
+
+        :param prefix: Written between ``_:`` and the count.
+        :param start: The first count.
+        """
+        self.prefix = "_:" + prefix
+        self._counter = itertools.count(start)
+        self._lock = threading.Lock()
+
+    def __call__(self) -> str:
+        with self._lock:
+            count = next(self._counter)
+        return self.prefix + str(count)
+
+
+@contextmanager
+def anonymous_ids(strategy: Callable[[], str]) -> Iterator[None]:
+    """
+    Make the identifiers of anonymous objects with ``strategy``.
+
+    :param strategy: Called with no arguments for each identifier; it must
+        return a distinct string starting with ``_:`` every time.
+    """
+    token = _strategy.set(strategy)
+    try:
+        yield
+    finally:
+        _strategy.reset(token)
+
+
+def anonymous_id() -> str:
+    """Make an identifier for an object that was not given one."""
+    if (strategy := _strategy.get()) is None:
+        return uuid_ids()
+    return strategy()
@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Persistent on-disk cache of fully loaded CWL documents.
+
+Entries are keyed by the document URI, the SHA-256 of its text and the
+cwl-utils version, and hold the loaded object tree in pickled form so that a
+cache hit skips YAML parsing and the generated loaders entirely. Every other
+document that was read while loading (``$import``, ``$include``) is recorded
+together with its content hash and re-checked before an entry is reused.
+
+The objects are pickled with the compact protocol of
+:py:mod:`cwl_utils.parser.pickling`: only the per-document loading options
+are stored, and a cache hit is attached to the fetcher and index of the
+options it is loaded with. As with that protocol, the restored objects carry
+no source line data.
+"""
+
+import hashlib
+import os
+import pickle  # nosec
+import tempfile
+from collections.abc import MutableSequence
+from pathlib import Path
+from typing import Any, Final, TypedDict
+from urllib.parse import urldefrag
+
+from schema_salad.exceptions import ValidationException
+from schema_salad.fetcher import Fetcher
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.__meta__ import __version__
+from cwl_utils.loghandler import _logger
+from cwl_utils.parser import pickling
+
+DEFAULT_MAX_SIZE: Final = 512 * 1024 * 1024
+"""Default upper bound, in bytes, for the total size of a parse cache."""
+
+_SUFFIX: Final = ".pickle"
+
+
+class CacheStats(TypedDict):
+    """Counters reported by :py:meth:`ParseCache.stats`."""
+
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    errors: int
+    entries: int
+    size: int
+
+
+def default_cache_dir() -> Path:
+    """Return the default location of the persistent parse cache."""
+    if xdg_cache := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache) / "cwl-utils" / "parse"
+    return Path.home() / ".cache" / "cwl-utils" / "parse"
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    A size-bounded, persistent cache of loaded CWL documents.
+
+    Pass an instance as the ``cache`` argument of
+    :py:func:`cwl_utils.parser.load_document_by_uri` to enable it. Least
+    recently used entries are evicted once the total size of the cache
+    directory exceeds ``max_size`` bytes.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+    ) -> None:
+        """Create a ParseCache stored in ``directory``."""
+        self.directory: Final = (
+            Path(directory) if directory is not None else default_cache_dir()
+        )
+        self.max_size: Final = max_size
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+        self._errors = 0
+
+    def key(self, uri: str, text: str, id_: str | None, load_all: bool) -> str:
+        """Compute the cache key for a document."""
+        h = hashlib.sha256()
+        for part in (__version__, uri, id_ or "", str(load_all), _sha256(text)):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
+
+    def get(
+        self,
+        uri: str,
+        text: str,
+        id_: str | None,
+        load_all: bool,
+        loadingOptions: LoadingOptions,
+    ) -> Any | None:
+        """Return the cached object for this document, or ``None`` on a miss."""
+        path = self._path(self.key(uri, text, id_, load_all))
+        try:
+            with path.open("rb") as handle:
+                header = pickle.load(handle)  # nosec
+                if header["cwl_utils"] != __version__ or not self._deps_unchanged(
+                    header["deps"], loadingOptions.fetcher
+                ):
+                    self._misses += 1
+                    return None
+                result = pickling.loads(handle.read(), loadingOptions)
+        except FileNotFoundError:
+            self._misses += 1
+            return None
+        except Exception as e:
+            _logger.warning("Discarding unreadable parse cache entry %s: %s", path, e)
+            self._errors += 1
+            self._misses += 1
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        self._hits += 1
+        return result
+
+    def put(
+        self,
+        uri: str,
+        text: str,
+        id_: str | None,
+        load_all: bool,
+        loadingOptions: LoadingOptions,
+        result: Any,
+    ) -> None:
+        """Store a freshly loaded object."""
+        header = {
+            "cwl_utils": __version__,
+            "cwlVersion": _cwl_version_of(result),
+            "deps": self._collect_deps(uri, loadingOptions),
+        }
+        path = self._path(self.key(uri, text, id_, load_all))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(header, handle, protocol=pickle.HIGHEST_PROTOCOL)
+                handle.write(pickling.dumps(result))
+            os.replace(tmpname, path)
+        except Exception as e:
+            _logger.warning("Unable to store %s in the parse cache: %s", uri, e)
+            self._errors += 1
+            Path(tmpname).unlink(missing_ok=True)
+            return
+        self._stores += 1
+        self._evict()
+
+    def _collect_deps(self, uri: str, loadingOptions: LoadingOptions) -> dict[str, str]:
+        docuri = urldefrag(uri)[0]
+        urls = {urldefrag(u)[0] for u in loadingOptions.idx}
+        urls.update(urldefrag(u)[0] for u in loadingOptions.imports)
+        urls.update(urldefrag(u)[0] for u in loadingOptions.includes)
+        urls.discard(docuri)
+        deps = {}
+        for url in sorted(urls):
+            try:
+                deps[url] = _sha256(loadingOptions.fetcher.fetch_text(url))
+            except ValidationException:
+                continue
+        return deps
+
+    @staticmethod
+    def _deps_unchanged(deps: dict[str, str], fetcher: Fetcher) -> bool:
+        for url, digest in deps.items():
+            try:
+                if _sha256(fetcher.fetch_text(url)) != digest:
+                    return False
+            except ValidationException:
+                return False
+        return True
+
+    def _entries(self) -> list[os.DirEntry[str]]:
+        try:
+            return [
+                e
+                for e in os.scandir(self.directory)
+                if e.name.endswith(_SUFFIX) and e.is_file()
+            ]
+        except FileNotFoundError:
+            return []
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(e.stat().st_size for e in entries)
+        if total <= self.max_size:
+            return
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime_ns):
+            if total <= self.max_size:
+                break
+            size = entry.stat().st_size
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                continue
+            total -= size
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove every entry from the cache directory."""
+        for entry in self._entries():
+            Path(entry.path).unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        """Report hit/miss counters for this instance and the on-disk usage."""
+        entries = self._entries()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            stores=self._stores,
+            evictions=self._evictions,
+            errors=self._errors,
+            entries=len(entries),
+            size=sum(e.stat().st_size for e in entries),
+        )
+
+
+def _cwl_version_of(result: Any) -> str | None:
+    if isinstance(result, MutableSequence):
+        return next((_cwl_version_of(r) for r in result), None)
+    return getattr(result, "cwlVersion", None)
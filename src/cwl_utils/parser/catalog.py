@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Persistent index of what the processes of a directory tree use.
+
+For every process of every document (inline step processes included) the
+catalog records its class, the classes of its requirements and hints, the
+container images it names and the processes its steps ``run``. Queries such
+as "which workflows run this tool" or "which tools need
+InlineJavascriptRequirement" are then answered from the catalog, without
+loading any document.
+
+The catalog is stored as JSON. :py:meth:`Catalog.refresh` only loads the
+documents that are new or whose text, or the text of a document they refer
+to, changed since they were indexed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator, MutableMapping, MutableSequence
+from pathlib import Path
+from typing import Any, TypedDict, cast
+from urllib.parse import urldefrag, urlparse
+from urllib.request import url2pathname
+
+from schema_salad.exceptions import ValidationException
+from schema_salad.runtime import Saveable
+
+from cwl_utils.__meta__ import __version__
+from cwl_utils.loghandler import _logger
+from cwl_utils.parser.lazy import LazyProcess
+from cwl_utils.parser.workspace import Workspace
+
+
+class ProcessRecord(TypedDict):
+    """What the catalog knows about one process."""
+
+    id: str
+    class_: str
+    requirements: list[str]
+    hints: list[str]
+    images: list[str]
+    runs: list[str]
+
+
+class DocumentRecord(TypedDict):
+    """What the catalog knows about one document."""
+
+    sha256: str
+    dependencies: dict[str, str | None]
+    processes: list[ProcessRecord]
+    error: str | None
+
+
+def _sha256(uri: str) -> str | None:
+    """Hash a local document; other documents are assumed not to change."""
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    try:
+        with open(url2pathname(parsed.path), "rb") as handle:
+            return hashlib.sha256(handle.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _class_of(requirement: Any) -> str | None:
+    if isinstance(requirement, Saveable):
+        return cast(str | None, getattr(requirement, "class_", None))
+    if isinstance(requirement, MutableMapping):
+        return cast(str | None, requirement.get("class"))
+    return None
+
+
+def _images_of(requirement: Any) -> Iterator[str]:
+    if _class_of(requirement) != "DockerRequirement":
+        return
+    for key in ("dockerPull", "dockerImageId"):
+        if isinstance(requirement, MutableMapping):
+            value = requirement.get(key)
+        else:
+            value = getattr(requirement, key, None)
+        if isinstance(value, str):
+            yield value
+
+
+def _records(process: Any, uri: str) -> Iterator[ProcessRecord]:
+    """Describe a loaded process and the processes inline in its steps."""
+    requirements = list(getattr(process, "requirements", None) or [])
+    hints = list(getattr(process, "hints", None) or [])
+    runs: list[str] = []
+    inline: list[Any] = []
+    for step in getattr(process, "steps", None) or []:
+        if isinstance(step.run, str):
+            runs.append(
+                str(step.run)
+                if isinstance(step.run, LazyProcess)
+                else step.loadingOptions.fetcher.urljoin(
+                    cast(str, step.loadingOptions.fileuri), step.run
+                )
+            )
+        elif step.run is not None:
+            runs.append(str(step.run.id))
+            inline.append(step.run)
+    yield ProcessRecord(
+        id=str(getattr(process, "id", None) or uri),
+        class_=str(process.class_),
+        requirements=[c for r in requirements if (c := _class_of(r)) is not None],
+        hints=[c for h in hints if (c := _class_of(h)) is not None],
+        images=[i for r in requirements + hints for i in _images_of(r)],
+        runs=runs,
+    )
+    for child in inline:
+        yield from _records(child, uri)
+
+
+class Catalog:
+    """
+    Query the processes of a directory tree without loading them.
+
+    Document URIs in the results are those of the files; process identifiers
+    are the ``id`` of the processes.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        """
+        Create an empty catalog, or open the one stored at ``path``.
+
+        A stored catalog written by another version of cwl-utils, or that can
+        not be read, is ignored and will be rebuilt.
+
+        :param path: Where the catalog is stored by :py:meth:`save` and
+            :py:meth:`refresh`.
+        """
+        self.path = Path(path) if path is not None else None
+        self.documents: dict[str, DocumentRecord] = {}
+        """The record of each indexed document, by URI."""
+        self._lookups: dict[str, dict[str, set[str]]] | None = None
+        if self.path is not None and self.path.exists():
+            try:
+                with self.path.open(encoding="utf-8") as handle:
+                    stored = json.load(handle)
+                if stored.get("version") == __version__:
+                    self.documents = stored["documents"]
+            except (OSError, ValueError, KeyError) as e:
+                _logger.warning("Ignoring the unreadable catalog %s: %s", path, e)
+
+    def save(self) -> None:
+        """Store the catalog at its path, if it has one."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmpname = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"version": __version__, "documents": self.documents}, handle)
+            os.replace(tmpname, self.path)
+        except BaseException:
+            Path(tmpname).unlink(missing_ok=True)
+            raise
+
+    def _is_current(self, uri: str, sha256: str | None) -> bool:
+        record = self.documents.get(uri)
+        return (
+            record is not None
+            and record["sha256"] == sha256
+            and all(_sha256(dep) == h for dep, h in record["dependencies"].items())
+        )
+
+    def refresh(
+        self,
+        root: str | Path,
+        pattern: str = "**/*.cwl",
+        workers: int | None = None,
+    ) -> list[str]:
+        """
+        Bring the catalog up to date with the documents below ``root``.
+
+        New and changed documents are (re)loaded, together, with a
+        :py:class:`~cwl_utils.parser.Workspace`; documents that no longer
+        exist below ``root`` are dropped. The catalog is then saved.
+
+        :param workers: See :py:meth:`cwl_utils.parser.Workspace.load`.
+
+        :returns: The URIs of the documents that were (re)indexed.
+        """
+        workspace = Workspace(root, pattern, fields=("requirements", "hints", "steps"))
+        found = {uri: _sha256(uri) for uri in workspace.uris()}
+        prefix = workspace.root.as_uri() + "/"
+        for uri in [u for u in self.documents if u.startswith(prefix)]:
+            if uri not in found:
+                del self.documents[uri]
+        stale = [uri for uri, sha in found.items() if not self._is_current(uri, sha)]
+        if stale:
+            workspace.load(workers, stale)
+        for uri in stale:
+            # a change to a process that is run does not change this document
+            dependencies = {
+                dep: _sha256(dep)
+                for kind, dep in workspace.references(uri)
+                if kind != "run"
+            }
+            record = DocumentRecord(
+                sha256=found[uri] or "",
+                dependencies=dependencies,
+                processes=[],
+                error=None,
+            )
+            if uri in workspace.processes:
+                loaded = workspace.processes[uri]
+                for process in (
+                    loaded if isinstance(loaded, MutableSequence) else [loaded]
+                ):
+                    record["processes"].extend(_records(process, uri))
+            else:
+                record["error"] = str(workspace.errors.get(uri, "not loaded"))
+            self.documents[uri] = record
+        self._lookups = None
+        self.save()
+        return stale
+
+    def processes(self) -> Iterator[tuple[str, ProcessRecord]]:
+        """Iterate over the document URI and record of every process."""
+        for uri, document in self.documents.items():
+            for process in document["processes"]:
+                yield uri, process
+
+    def _lookup(self, kind: str, key: str) -> set[str]:
+        if self._lookups is None:
+            self._lookups = {
+                field: {} for field in ("runs", "requirements", "hints", "images")
+            }
+            for _, process in self.processes():
+                values = {
+                    "runs": process["runs"]
+                    + [urldefrag(run)[0] for run in process["runs"] if "#" in run],
+                    "requirements": process["requirements"],
+                    "hints": process["hints"],
+                    "images": process["images"],
+                }
+                for field, lookup in self._lookups.items():
+                    for value in values[field]:
+                        lookup.setdefault(value, set()).add(process["id"])
+        return self._lookups[kind].get(key, set())
+
+    def users(self, target: str, recursive: bool = False) -> set[str]:
+        """
+        Get the identifiers of the workflows that run a process.
+
+        :param target: The URI of a document, or the identifier of a process.
+        :param recursive: Also include the workflows that run those
+            workflows, and so on.
+        """
+        found: set[str] = set()
+        targets = {target}
+        while targets:
+            users = set().union(*(self._lookup("runs", t) for t in targets))
+            targets = users - found if recursive else set()
+            found |= users
+        return found
+
+    def with_requirement(self, class_: str, hints: bool = True) -> set[str]:
+        """
+        Get the identifiers of the processes that declare a requirement.
+
+        :param class_: The requirement class, like ``DockerRequirement``.
+        :param hints: Also include the processes that only list it as a hint.
+        """
+        found = set(self._lookup("requirements", class_))
+        if hints:
+            found |= self._lookup("hints", class_)
+        return found
+
+    def with_image(self, image: str) -> set[str]:
+        """Get the identifiers of the processes that use a container image."""
+        return set(self._lookup("images", image))
+
+    def images(self) -> set[str]:
+        """Get all the container images named by the indexed processes."""
+        return {image for _, process in self.processes() for image in process["images"]}
+
+    def get(self, identifier: str) -> ProcessRecord:
+        """
+        Get the record of a process.
+
+        :raises ValidationException: If no indexed process has that identifier.
+        """
+        for _, process in self.processes():
+            if process["id"] == identifier:
+                return process
+        raise ValidationException(f"No process {identifier!r} in the catalog")
@@ -0,0 +1,115 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Copies of loaded CWL objects that share what does not need copying.
+
+:py:func:`copy.deepcopy` of a loaded object also copies its
+:py:class:`LoadingOptions`, and with them the fetcher and its cache of
+document texts, the index of every object loaded with those options and
+the original YAML of the documents, as well as the comments and line
+numbers of every ruamel.yaml mapping and sequence in its fields. For a
+step of a large workflow, that is the whole workflow and then some.
+
+:py:func:`clone` copies only the objects, lists and mappings, which is all
+that can be changed through the fields of the copy, and shares everything
+else with the original. :py:func:`replace` goes further and copies only
+the object itself, with some of its fields set to new values: the copy
+shares all its other fields with the original, so nothing reachable
+through them should be changed in place.
+"""
+
+import copy
+import inspect
+from typing import Any, Final, TypeVar, cast
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from schema_salad.runtime import LoadingOptions, Saveable
+
+from cwl_utils.parser.lazy import LazyProcess
+
+_T = TypeVar("_T")
+
+_IMMUTABLE: Final = frozenset({str, int, float, bool, type(None)})
+
+
+def clone(obj: _T) -> _T:
+    """
+    Copy a loaded CWL object and every object, list and mapping in its fields.
+
+    Unlike :py:func:`copy.deepcopy`, the copy shares the
+    :py:class:`LoadingOptions` of the original (and so its fetcher and
+    index), its strings and numbers, and the comments and source line data
+    of its ruamel.yaml mappings and sequences. Objects found more than once
+    in the original are copied once, as :py:func:`copy.deepcopy` does.
+
+    :param obj: A loaded object, a list of them, or any value found in
+        their fields.
+    """
+    return cast(_T, _clone(obj, {}))
+
+
+def _clone(value: Any, memo: dict[int, Any]) -> Any:
+    cls: Any = type(value)
+    if cls in _IMMUTABLE or cls is LoadingOptions:
+        return value
+    if issubclass(cls, str) and cls is not LazyProcess:
+        # such as the scalar strings of ruamel.yaml
+        return value
+    if (copied := memo.get(id(value))) is not None:
+        return copied
+    if cls is list:
+        result: Any = []
+        memo[id(value)] = result
+        result.extend(_clone(item, memo) for item in value)
+    elif cls is dict:
+        result = {}
+        memo[id(value)] = result
+        for key, item in value.items():
+            result[key] = _clone(item, memo)
+    elif isinstance(value, Saveable):
+        result = cls.__new__(cls)
+        memo[id(value)] = result
+        fields = result.__dict__
+        for name, field in vars(value).items():
+            fields[name] = field if name == "loadingOptions" else _clone(field, memo)
+    elif isinstance(value, CommentedMap):
+        result = cls()
+        memo[id(value)] = result
+        for key, item in value.items():
+            result[key] = _clone(item, memo)
+        value.copy_attributes(result)
+    elif isinstance(value, CommentedSeq):
+        result = cls()
+        memo[id(value)] = result
+        result.extend(_clone(item, memo) for item in value)
+        value.copy_attributes(result)
+    else:
+        # references to processes not loaded yet, and anything else unusual
+        result = copy.deepcopy(value, memo)
+    return result
+
+
+def _is_field(cls: type[Any], name: str) -> bool:
+    """Tell if ``name`` is a field of ``cls`` kept by a data descriptor."""
+    return hasattr(inspect.getattr_static(cls, name, None), "__set__")
+
+
+def replace(obj: _T, **changes: Any) -> _T:
+    """
+    Copy a loaded CWL object with some of its fields set to new values.
+
+    The other fields of the copy are those of the original: the objects,
+    lists and mappings in them are shared, not copied.
+
+    :param obj: A loaded object.
+    :param changes: The new field values, by attribute name (such as
+        ``type_`` or ``in_``).
+    :raises TypeError: If ``obj`` has no such field.
+    """
+    fields = vars(obj)
+    for name in changes:
+        # fields such as extension_fields are only in vars() once set
+        if name not in fields and not _is_field(type(obj), name):
+            raise TypeError(f"{type(obj).__name__} has no field {name!r}")
+    result = copy.copy(obj)
+    vars(result).update(changes)
+    return result
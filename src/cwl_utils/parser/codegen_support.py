@@ -0,0 +1,412 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Support code for the generated parsers.
+
+The modules ``cwl_v1_0``, ``cwl_v1_1`` and ``cwl_v1_2`` are generated by
+``schema-salad-tool --codegen python`` and then patched by
+``patch_parsers.py`` (see the ``regen_parsers`` target of the Makefile) to
+use the helpers here instead of some of the generated code. The logic lives
+here, so that regenerating the parsers keeps it; the patches only make the
+generated code call it. Nothing here is meant to be used by other modules.
+"""
+
+import functools
+import sys
+import threading
+import weakref
+from collections.abc import Mapping, MutableMapping, MutableSequence
+from typing import Any, Final, cast
+from urllib.parse import urlsplit, urlunsplit
+
+from ruamel.yaml.comments import CommentedMap
+from schema_salad.exceptions import ValidationException
+from schema_salad.runtime import LoadingOptions, Saveable
+from schema_salad.runtime import save_relative_uri as _save_relative_uri
+
+
+class LazyExtensionFields:
+    """
+    Descriptor for the ``extension_fields`` attribute of the generated classes.
+
+    Few objects carry extension fields, so the mapping is only allocated when
+    it is first read (or assigned) instead of once per object.
+    """
+
+    def __get__(self, obj: Any, objtype: Any = None) -> MutableMapping[str, Any]:
+        try:
+            return cast(MutableMapping[str, Any], obj.__dict__["extension_fields"])
+        except KeyError:
+            fields: Final[MutableMapping[str, Any]] = CommentedMap()
+            obj.__dict__["extension_fields"] = fields
+            return fields
+
+    def __set__(self, obj: Any, value: MutableMapping[str, Any]) -> None:
+        obj.__dict__["extension_fields"] = value
+
+
+_NO_EXTENSION_FIELDS: Final[Mapping[str, Any]] = {}
+
+
+def extension_fields(obj: Saveable) -> Mapping[str, Any]:
+    """Return the extension fields of ``obj`` without allocating them."""
+    return cast(
+        Mapping[str, Any], obj.__dict__.get("extension_fields", _NO_EXTENSION_FIELDS)
+    )
+
+
+def intern(value: str) -> str:
+    """Share one copy of frequent strings (type names, vocabulary terms)."""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+_diagnostics: Final = threading.local()
+_SPECULATE: Final = 1
+_DIAGNOSE: Final = 2
+
+
+def load_state() -> int:
+    """Tell how union loaders currently try their alternates (0 if not loading)."""
+    return cast(int, getattr(_diagnostics, "state", 0))
+
+
+def speculative() -> bool:
+    """
+    Tell whether the current load attempt is only speculative.
+
+    While :py:func:`load_union` tries the alternates of a union, a failure
+    only means "try the next one", so loaders raise the first error they meet
+    instead of building the full, source-annotated error report. If every
+    alternate fails, the union tries them again with diagnostics enabled.
+    """
+    return load_state() == _SPECULATE
+
+
+def may_accept(loader: Any, doc_type: type, class_: str | None) -> bool:
+    """
+    Tell whether ``loader`` could load a document of type ``doc_type``.
+
+    ``False`` means that ``loader.load`` is certain to raise a
+    ValidationException, ``True`` that it has to be tried. ``class_`` is the
+    plain vocabulary term found in the ``class`` field of a mapping, if any.
+    The loader classes are defined anew by every generated module, so they
+    are told apart by name.
+    """
+    kind: Final = type(loader).__name__
+    if kind == "_PrimitiveLoader":
+        return issubclass(doc_type, loader.tp)
+    if kind in ("_EnumLoader", "_ExpressionLoader"):
+        return issubclass(doc_type, str)
+    if kind == "_ArrayLoader":
+        return issubclass(doc_type, MutableSequence)
+    if kind == "_MapLoader":
+        return issubclass(doc_type, MutableMapping)
+    if kind == "_RecordLoader":
+        if not issubclass(doc_type, MutableMapping):
+            return False
+        if class_ is not None and "class" in getattr(loader.classtype, "attrs", ()):
+            return bool(class_ == loader.classtype.__name__)
+        return True
+    if kind == "_AnyLoader":
+        return doc_type is not type(None)
+    return True
+
+
+def union_candidates(union: Any, doc: Any, vocab: Mapping[str, str]) -> Any:
+    """
+    Select, in order, the alternates of ``union`` that may accept ``doc``.
+
+    :param vocab: The vocabulary of the generated module of ``union``.
+    """
+    class_ = doc.get("class") if isinstance(doc, MutableMapping) else None
+    if not (isinstance(class_, str) and ":" not in class_ and class_ in vocab):
+        class_ = None
+    key: Final = (type(doc), class_)
+    try:
+        return union._dispatch[key]
+    except KeyError:
+        candidates: Final = tuple(
+            t for t in union.alternates if may_accept(t, key[0], class_)
+        )
+        union._dispatch[key] = candidates
+        return candidates
+
+
+def load_union(
+    union: Any,
+    doc: Any,
+    baseuri: str,
+    loadingOptions: LoadingOptions,
+    docRoot: str | None,
+    lc: Any | None,
+) -> Any:
+    """
+    Load ``doc`` with the first alternate of ``union`` that accepts it.
+
+    Only the alternates that can match the type (and ``class``) of the
+    document are tried, without building error reports for the misses. If
+    they all fail, ``union._diagnose()`` tries every alternate again to
+    report why each one failed.
+    """
+    if lc is None:
+        lc = []
+
+    state: Final = load_state()
+    if state == _DIAGNOSE:
+        return union._diagnose(doc, baseuri, loadingOptions, docRoot, lc)
+
+    rejection: ValidationException | None = None
+    _diagnostics.state = _SPECULATE
+    try:
+        for t in union._candidates(doc):
+            try:
+                return t.load(doc, baseuri, loadingOptions, docRoot=docRoot, lc=lc)
+            except ValidationException as e:
+                rejection = e
+    finally:
+        _diagnostics.state = state
+    if state == _SPECULATE:
+        raise rejection or ValidationException("no alternate matched")
+
+    _diagnostics.state = _DIAGNOSE
+    try:
+        return union._diagnose(doc, baseuri, loadingOptions, docRoot, lc)
+    finally:
+        _diagnostics.state = state
+
+
+_EXPAND_MEMO_SIZE: Final = 4096
+
+
+class ExpandMemo:
+    """State reused by :py:func:`expand_url` for one LoadingOptions."""
+
+    def __init__(
+        self,
+        loadingOptions: LoadingOptions,
+        vocab: dict[str, str],
+        rvocab: dict[str, str],
+    ) -> None:
+        """Merge the vocabulary of a generated module with ``loadingOptions``."""
+        self.namespaces: Final = dict(loadingOptions.vocab)
+        self.vocab: Final = vocab | loadingOptions.vocab
+        self.rvocab: Final = rvocab | loadingOptions.rvocab
+        self.schemes: Final = loadingOptions.fetcher.supported_schemes()
+        self.expanded: Final[dict[tuple[str, str, bool, int | None], str]] = {}
+
+
+class ExpandMemos:
+    """
+    The :py:class:`ExpandMemo` of each LoadingOptions, for one generated module.
+
+    Copies of a LoadingOptions (same fetcher and namespaces) share one memo.
+    """
+
+    def __init__(self, vocab: dict[str, str], rvocab: dict[str, str]) -> None:
+        """
+        Create the memos of a generated module.
+
+        :param vocab: The vocabulary of the module, which may still be filled in
+            later.
+        :param rvocab: The reverse vocabulary of the module.
+        """
+        self.vocab: Final = vocab
+        self.rvocab: Final = rvocab
+        self._memos: Final[weakref.WeakKeyDictionary[LoadingOptions, ExpandMemo]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # the last options are weakly referenced, so that neither they nor
+        # their fetcher and index are kept alive by it (their memo is held
+        # directly: compiled with mypyc, it can not be weakly referenced)
+        self._recent: tuple[weakref.ref[LoadingOptions], ExpandMemo] | None = None
+
+    def __call__(self, loadingOptions: LoadingOptions) -> ExpandMemo:
+        """Get the memo of ``loadingOptions``, rebuilt if its namespaces changed."""
+        options: LoadingOptions | None = None
+        recent: ExpandMemo | None = None
+        if (last := self._recent) is not None:
+            options, recent = last[0](), last[1]
+            if options is loadingOptions and recent.namespaces == loadingOptions.vocab:
+                return recent
+        found = self._memos.get(loadingOptions)
+        if found is None or found.namespaces != loadingOptions.vocab:
+            if (
+                options is not None
+                and recent is not None
+                and options.fetcher is loadingOptions.fetcher
+                and recent.namespaces == loadingOptions.vocab
+            ):
+                found = recent
+            else:
+                found = ExpandMemo(loadingOptions, self.vocab, self.rvocab)
+            self._memos[loadingOptions] = found
+        self._recent = (weakref.ref(loadingOptions), found)
+        return found
+
+
+def expand_url(
+    url: str,
+    base_url: str,
+    loadingOptions: LoadingOptions,
+    memo: ExpandMemo,
+    scoped_id: bool,
+    vocab_term: bool,
+    scoped_ref: int | None,
+) -> str:
+    """
+    Expand ``url`` as the generated ``_expand_url`` does, remembering results.
+
+    :param memo: The memo of ``loadingOptions``.
+    """
+    if url in ("@id", "@type"):
+        return url
+
+    if vocab_term and url in memo.vocab:
+        return intern(url)
+
+    # Identifiers are unique, so only references are worth remembering.
+    if scoped_id or type(url) is not str:
+        return _resolve_url(
+            url, base_url, loadingOptions, memo, scoped_id, vocab_term, scoped_ref
+        )
+    key: Final = (url, base_url, vocab_term, scoped_ref)
+    try:
+        return memo.expanded[key]
+    except KeyError:
+        pass
+    expanded: Final = _resolve_url(
+        url, base_url, loadingOptions, memo, scoped_id, vocab_term, scoped_ref
+    )
+    if len(memo.expanded) >= _EXPAND_MEMO_SIZE:
+        memo.expanded.clear()
+    memo.expanded[key] = expanded
+    return expanded
+
+
+def _resolve_url(
+    url: str,
+    base_url: str,
+    loadingOptions: LoadingOptions,
+    memo: ExpandMemo,
+    scoped_id: bool,
+    vocab_term: bool,
+    scoped_ref: int | None,
+) -> str:
+    vocab: Final = memo.vocab
+    if bool(vocab) and ":" in url:
+        prefix: Final = url.split(":")[0]
+        if prefix in vocab:
+            url = vocab[prefix] + url[len(prefix) + 1 :]
+
+    split1: Final = urlsplit(url)
+
+    if (
+        (bool(split1.scheme) and split1.scheme in memo.schemes)
+        or url.startswith("$(")
+        or url.startswith("${")
+    ):
+        pass
+    elif scoped_id and not bool(split1.fragment):
+        splitbase1: Final = urlsplit(base_url)
+        frg: str
+        if bool(splitbase1.fragment):
+            frg = splitbase1.fragment + "/" + split1.path
+        else:
+            frg = split1.path
+        pt: Final = splitbase1.path if splitbase1.path != "" else "/"
+        url = urlunsplit(
+            (splitbase1.scheme, splitbase1.netloc, pt, splitbase1.query, frg)
+        )
+    elif scoped_ref is not None and not bool(split1.fragment):
+        splitbase2: Final = urlsplit(base_url)
+        sp = splitbase2.fragment.split("/")
+        n = scoped_ref
+        while n > 0 and len(sp) > 0:
+            sp.pop()
+            n -= 1
+        sp.append(url)
+        url = urlunsplit(
+            (
+                splitbase2.scheme,
+                splitbase2.netloc,
+                splitbase2.path,
+                splitbase2.query,
+                "/".join(sp),
+            )
+        )
+    else:
+        url = loadingOptions.fetcher.urljoin(base_url, url)
+
+    if vocab_term:
+        split2: Final = urlsplit(url)
+        if bool(split2.scheme):
+            if url in memo.rvocab:
+                return memo.rvocab[url]
+        else:
+            raise ValidationException(f"Term {url!r} not in vocabulary")
+
+    return url
+
+
+@functools.lru_cache(maxsize=1024)
+def _same_document(base_url: str) -> tuple[str, str] | None:
+    """
+    Get the prefix of the URIs in the document of ``base_url``, and its fragment.
+
+    Only for URLs that ``urlsplit`` takes apart at the first ``#`` as is:
+    without a query, and without characters that it strips.
+    """
+    document, _, fragment = base_url.partition("#")
+    if "?" in document or not base_url.isprintable():
+        return None
+    return document + "#", fragment
+
+
+@functools.lru_cache(maxsize=4096)
+def _relative_uri(
+    uri: str, base_url: str, scoped_id: bool, ref_scope: int | None
+) -> Any:
+    return _save_relative_uri(uri, base_url, scoped_id, ref_scope, True)
+
+
+def save_relative_uri(
+    uri: Any,
+    base_url: str | None,
+    scoped_id: bool,
+    ref_scope: int | None,
+    relative_uris: bool,
+) -> Any:
+    """
+    Convert any URI to a relative one, obeying the scoping rules.
+
+    Gives the same results as :py:func:`schema_salad.runtime.save_relative_uri`,
+    but identifiers in the same document as ``base_url`` (most of them) are
+    made relative without splitting either URL, and the other string URIs are
+    memoized. Like there, ``base_url`` may be ``None`` (as passed on from
+    ``save(obj, base_url=obj.loadingOptions.fileuri)``).
+    """
+    if type(uri) is str and type(base_url) is str:
+        if not relative_uris or uri == base_url:
+            return uri
+        same = _same_document(base_url)
+        if same is not None and uri.startswith(same[0]) and uri.isprintable():
+            fragment = uri[len(same[0]) :]
+            basefrag = same[1] + "/"
+            if ref_scope:
+                sp = basefrag.split("/")
+                for _ in range(ref_scope):
+                    sp.pop()
+                basefrag = "/".join(sp)
+            if fragment.startswith(basefrag):
+                return fragment[len(basefrag) :]
+            return fragment
+        return _relative_uri(uri, base_url, scoped_id, ref_scope)
+    if isinstance(uri, MutableSequence):
+        return [
+            save_relative_uri(u, base_url, scoped_id, ref_scope, relative_uris)
+            for u in uri
+        ]
+    return _save_relative_uri(
+        uri, cast(Any, base_url), scoped_id, ref_scope, relative_uris
+    )
@@ -2,11 +2,11 @@
 # This file was autogenerated using schema-salad-tool --codegen=python
 # The code itself is released under the Apache 2.0 license and the help text is
 # subject to the license of the original schema.
+# It was then patched with patch_parsers.py to use cwl_utils.parser.codegen_support.
 from __future__ import annotations
 
 import os
 import sys
-import uuid as _uuid__
 from collections.abc import Collection
 from typing import ClassVar
 
@@ -16,9 +16,19 @@ from schema_salad.runtime import (
     parse_errors,
     prefix_url,
     save,
-    save_relative_uri,
 )
 
+from cwl_utils.parser.anonymous import anonymous_id as _anonymous_id
+from cwl_utils.parser.codegen_support import ExpandMemos as _ExpandMemos
+from cwl_utils.parser.codegen_support import LazyExtensionFields as _LazyExtensionFields
+from cwl_utils.parser.codegen_support import expand_url as _expand_url_memoized
+from cwl_utils.parser.codegen_support import extension_fields as _extension_fields
+from cwl_utils.parser.codegen_support import intern as _intern
+from cwl_utils.parser.codegen_support import load_union as _load_union
+from cwl_utils.parser.codegen_support import save_relative_uri
+from cwl_utils.parser.codegen_support import speculative as _speculative
+from cwl_utils.parser.codegen_support import union_candidates as _union_candidates
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -88,6 +98,7 @@ class _PrimitiveLoader(Loader):
 class _ArrayLoader(Loader):
     def __init__(self, items: Loader) -> None:
         self.items: Final = items
+        self._item_loader: Final = _UnionLoader([self, items])
 
     def load(
         self,
@@ -107,9 +118,7 @@ class _ArrayLoader(Loader):
         fields: Final[list[str]] = []
         for i in range(0, len(doc)):
             try:
-                lf = _load_field(
-                    doc[i], _UnionLoader([self, self.items]), baseuri, loadingOptions, lc=lc
-                )
+                lf = _load_field(doc[i], self._item_loader, baseuri, loadingOptions, lc=lc)
                 flatten = loadingOptions.container != "@list"
                 if flatten and isinstance(lf, MutableSequence):
                     r.extend(lf)
@@ -130,6 +139,8 @@ class _ArrayLoader(Loader):
                             fields.append(doc[i].get("id"))
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 e = ValidationException(
                     "array item is invalid because", SourceLine(doc, i, str), [e]
                 )
@@ -176,6 +187,8 @@ class _MapLoader(Loader):
                 lf = _load_field(v, self.values, baseuri, loadingOptions, lc)
                 r[k] = lf
             except ValidationException as e:
+                if _speculative():
+                    raise
                 errors.append(e.with_sourceline(SourceLine(doc, k, str)))
         if errors:
             raise ValidationException("", None, errors)
@@ -199,7 +212,7 @@ class _EnumLoader(Loader):
         lc: Any | None = None,
     ) -> str:
         if doc in self.symbols:
-            return cast(str, doc)
+            return _intern(cast(str, doc))
         raise ValidationException(f"Expected one of {self.symbols}")
 
     def __repr__(self) -> str:
@@ -338,9 +351,15 @@ class _UnionLoader(Loader):
     def __init__(self, alternates: Sequence[Loader], name: str | None = None) -> None:
         self.alternates = alternates
         self.name: Final = name
+        self._dispatch: Final[dict[tuple[type, str | None], tuple[Loader, ...]]] = {}
 
     def add_loaders(self, loaders: Sequence[Loader]) -> None:
         self.alternates = tuple(loader for loader in chain(self.alternates, loaders))
+        self._dispatch.clear()
+
+    def _candidates(self, doc: Any) -> tuple[Loader, ...]:
+        """Select, in order, the alternates that may accept ``doc``."""
+        return cast(tuple[Loader, ...], _union_candidates(self, doc, _vocab))
 
     def load(
         self,
@@ -349,6 +368,16 @@ class _UnionLoader(Loader):
         loadingOptions: LoadingOptions,
         docRoot: str | None = None,
         lc: Any | None = None,
+    ) -> Any:
+        return _load_union(self, doc, baseuri, loadingOptions, docRoot, lc)
+
+    def _diagnose(
+        self,
+        doc: Any,
+        baseuri: str,
+        loadingOptions: LoadingOptions,
+        docRoot: str | None = None,
+        lc: Any | None = None,
     ) -> Any:
         errors: Final = []
 
@@ -753,6 +782,9 @@ def _document_load_by_url(
     return loadingOptions.idx[url]
 
 
+_expand_memo: Final = _ExpandMemos(_vocab, _rvocab)
+
+
 def _expand_url(
     url: str,
     base_url: str,
@@ -761,64 +793,15 @@ def _expand_url(
     vocab_term: bool = False,
     scoped_ref: int | None = None,
 ) -> str:
-    if url in ("@id", "@type"):
-        return url
-
-    vocab = _vocab | loadingOptions.vocab
-    if vocab_term and url in vocab:
-        return url
-
-    if bool(vocab) and ":" in url:
-        prefix: Final = url.split(":")[0]
-        if prefix in vocab:
-            url = vocab[prefix] + url[len(prefix) + 1 :]
-
-    split1: Final = urlsplit(url)
-
-    if (
-        (bool(split1.scheme) and split1.scheme in loadingOptions.fetcher.supported_schemes())
-        or url.startswith("$(")
-        or url.startswith("${")
-    ):
-        pass
-    elif scoped_id and not bool(split1.fragment):
-        splitbase1: Final = urlsplit(base_url)
-        frg: str
-        if bool(splitbase1.fragment):
-            frg = splitbase1.fragment + "/" + split1.path
-        else:
-            frg = split1.path
-        pt: Final = splitbase1.path if splitbase1.path != "" else "/"
-        url = urlunsplit((splitbase1.scheme, splitbase1.netloc, pt, splitbase1.query, frg))
-    elif scoped_ref is not None and not bool(split1.fragment):
-        splitbase2: Final = urlsplit(base_url)
-        sp = splitbase2.fragment.split("/")
-        n = scoped_ref
-        while n > 0 and len(sp) > 0:
-            sp.pop()
-            n -= 1
-        sp.append(url)
-        url = urlunsplit(
-            (
-                splitbase2.scheme,
-                splitbase2.netloc,
-                splitbase2.path,
-                splitbase2.query,
-                "/".join(sp),
-            )
-        )
-    else:
-        url = loadingOptions.fetcher.urljoin(base_url, url)
-
-    if vocab_term:
-        split2: Final = urlsplit(url)
-        if bool(split2.scheme):
-            if url in (rvocab := _rvocab | loadingOptions.rvocab):
-                return rvocab[url]
-        else:
-            raise ValidationException(f"Term {url!r} not in vocabulary")
-
-    return url
+    return _expand_url_memoized(
+        url,
+        base_url,
+        loadingOptions,
+        _expand_memo(loadingOptions),
+        scoped_id,
+        vocab_term,
+        scoped_ref,
+    )
 
 
 def _load_field(
@@ -855,6 +838,8 @@ def parser_info() -> str:
 
 
 class CWLArraySchema(schema_salad.metaschema.ArraySchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -864,8 +849,6 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -908,6 +891,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -956,6 +941,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1028,12 +1015,13 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -1056,6 +1044,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
 class CWLRecordField(schema_salad.metaschema.RecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -1066,14 +1056,12 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
 
     def __eq__(self, other: Any) -> bool:
@@ -1114,6 +1102,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -1170,6 +1160,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -1218,6 +1210,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1292,12 +1286,13 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -1322,6 +1317,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
 
 
 class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -1331,8 +1328,6 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1374,6 +1369,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -1422,6 +1419,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1494,12 +1493,13 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.fields is not None:
             r["fields"] = save(
                 self.fields, top=False, base_url=base_url, relative_uris=relative_uris
@@ -1548,6 +1548,8 @@ class File(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -1566,8 +1568,6 @@ class File(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1647,7 +1647,7 @@ class File(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -1664,6 +1664,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -1711,6 +1713,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -1758,6 +1762,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -1805,6 +1811,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dirname`":
@@ -1852,6 +1860,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameroot`":
@@ -1899,6 +1909,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameext`":
@@ -1946,6 +1958,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `checksum`":
@@ -1993,6 +2007,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `size`":
@@ -2040,6 +2056,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -2087,6 +2105,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -2134,6 +2154,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `contents`":
@@ -2215,15 +2237,16 @@ class File(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2326,6 +2349,8 @@ class Directory(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -2337,8 +2362,6 @@ class Directory(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -2391,7 +2414,7 @@ class Directory(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -2408,6 +2431,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -2455,6 +2480,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -2502,6 +2529,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -2549,6 +2578,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `listing`":
@@ -2623,15 +2654,16 @@ class Directory(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2699,6 +2731,8 @@ class OutputSchema(SchemaBase):
 class InputRecordField(CWLRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -2711,14 +2745,12 @@ class InputRecordField(CWLRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.inputBinding = inputBinding
         self.label = label
@@ -2763,6 +2795,8 @@ class InputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -2819,6 +2853,8 @@ class InputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -2867,6 +2903,8 @@ class InputRecordField(CWLRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -2914,6 +2952,8 @@ class InputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -2961,6 +3001,8 @@ class InputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3037,12 +3079,13 @@ class InputRecordField(CWLRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3082,6 +3125,8 @@ class InputRecordField(CWLRecordField):
 class InputRecordSchema(CWLRecordSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -3093,8 +3138,6 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -3102,7 +3145,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
         self.fields = fields
         self.type_ = type_
         self.label = label
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, InputRecordSchema):
@@ -3143,6 +3186,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3184,7 +3229,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -3199,6 +3244,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -3247,6 +3294,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3294,6 +3343,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3369,12 +3420,13 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3405,6 +3457,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
 class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -3417,13 +3471,11 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -3471,6 +3523,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3512,7 +3566,7 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -3528,6 +3582,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -3576,6 +3632,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3623,6 +3681,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3670,6 +3730,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -3746,12 +3808,13 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3788,6 +3851,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
 
 
 class InputArraySchema(CWLArraySchema, InputSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -3799,8 +3864,6 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -3850,6 +3913,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -3898,6 +3963,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3945,6 +4012,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3992,6 +4061,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -4066,12 +4137,13 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -4107,6 +4179,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
 class OutputRecordField(CWLRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -4118,14 +4192,12 @@ class OutputRecordField(CWLRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.outputBinding = outputBinding
 
@@ -4168,6 +4240,8 @@ class OutputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4224,6 +4298,8 @@ class OutputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4272,6 +4348,8 @@ class OutputRecordField(CWLRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4319,6 +4397,8 @@ class OutputRecordField(CWLRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -4394,12 +4474,13 @@ class OutputRecordField(CWLRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -4433,6 +4514,8 @@ class OutputRecordField(CWLRecordField):
 
 
 class OutputRecordSchema(CWLRecordSchema, OutputSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -4443,8 +4526,6 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -4491,6 +4572,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -4539,6 +4622,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4586,6 +4671,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4659,12 +4746,13 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.fields is not None:
             r["fields"] = save(
                 self.fields, top=False, base_url=base_url, relative_uris=relative_uris
@@ -4692,6 +4780,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
 class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -4704,13 +4794,11 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -4758,6 +4846,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4799,7 +4889,7 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -4815,6 +4905,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -4863,6 +4955,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4910,6 +5004,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4957,6 +5053,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -5033,12 +5131,13 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5075,6 +5174,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
 
 
 class OutputArraySchema(CWLArraySchema, OutputSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -5086,8 +5187,6 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5137,6 +5236,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -5185,6 +5286,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -5232,6 +5335,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5279,6 +5384,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -5353,12 +5460,13 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -5394,6 +5502,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
 class InputParameter(Parameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -5410,8 +5520,6 @@ class InputParameter(Parameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5420,7 +5528,7 @@ class InputParameter(Parameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.inputBinding = inputBinding
         self.default = default
@@ -5482,6 +5590,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -5538,6 +5648,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5585,6 +5697,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -5632,6 +5746,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -5679,6 +5795,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -5726,6 +5844,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -5773,6 +5893,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -5820,6 +5942,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -5867,6 +5991,8 @@ class InputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `type`":
@@ -5947,12 +6073,13 @@ class InputParameter(Parameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -6023,6 +6150,8 @@ class InputParameter(Parameter):
 class OutputParameter(Parameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -6037,8 +6166,6 @@ class OutputParameter(Parameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6047,7 +6174,7 @@ class OutputParameter(Parameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.outputBinding = outputBinding
         self.format = format
 
@@ -6103,6 +6230,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -6159,6 +6288,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -6206,6 +6337,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -6253,6 +6386,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -6300,6 +6435,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -6347,6 +6484,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -6394,6 +6533,8 @@ class OutputParameter(Parameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -6472,12 +6613,13 @@ class OutputParameter(Parameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -6561,6 +6703,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         expressionLib: Any | None = None,
@@ -6569,8 +6713,6 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6615,7 +6757,7 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6632,6 +6774,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `expressionLib`":
@@ -6703,15 +6847,16 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6744,6 +6889,8 @@ class SchemaDefRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         types: Any,
@@ -6752,8 +6899,6 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6795,7 +6940,7 @@ class SchemaDefRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6813,6 +6958,8 @@ class SchemaDefRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `types`":
@@ -6884,15 +7031,16 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6922,6 +7070,8 @@ class EnvironmentDef(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envName: Any,
@@ -6931,8 +7081,6 @@ class EnvironmentDef(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6977,6 +7125,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envName`":
@@ -7025,6 +7175,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envValue`":
@@ -7097,12 +7249,13 @@ class EnvironmentDef(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.envName is not None:
             r["envName"] = save(
                 self.envName, top=False, base_url=base_url, relative_uris=relative_uris
@@ -7147,6 +7300,8 @@ class CommandLineBinding(InputBinding):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -7161,8 +7316,6 @@ class CommandLineBinding(InputBinding):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7227,6 +7380,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7274,6 +7429,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `position`":
@@ -7321,6 +7478,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `prefix`":
@@ -7368,6 +7527,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `separate`":
@@ -7415,6 +7576,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `itemSeparator`":
@@ -7462,6 +7625,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -7509,6 +7674,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `shellQuote`":
@@ -7586,12 +7753,13 @@ class CommandLineBinding(InputBinding):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -7667,6 +7835,8 @@ class CommandOutputBinding(OutputBinding):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         glob: Any | None = None,
@@ -7677,8 +7847,6 @@ class CommandOutputBinding(OutputBinding):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7725,6 +7893,8 @@ class CommandOutputBinding(OutputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `glob`":
@@ -7772,6 +7942,8 @@ class CommandOutputBinding(OutputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7819,6 +7991,8 @@ class CommandOutputBinding(OutputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputEval`":
@@ -7892,12 +8066,13 @@ class CommandOutputBinding(OutputBinding):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.glob is not None:
             r["glob"] = save(
                 self.glob, top=False, base_url=base_url, relative_uris=relative_uris
@@ -7931,6 +8106,8 @@ class CommandOutputBinding(OutputBinding):
 class CommandInputRecordField(InputRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -7943,14 +8120,12 @@ class CommandInputRecordField(InputRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.inputBinding = inputBinding
         self.label = label
@@ -7995,6 +8170,8 @@ class CommandInputRecordField(InputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8051,6 +8228,8 @@ class CommandInputRecordField(InputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -8099,6 +8278,8 @@ class CommandInputRecordField(InputRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -8146,6 +8327,8 @@ class CommandInputRecordField(InputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -8193,6 +8376,8 @@ class CommandInputRecordField(InputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -8269,12 +8454,13 @@ class CommandInputRecordField(InputRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -8314,6 +8500,8 @@ class CommandInputRecordField(InputRecordField):
 class CommandInputRecordSchema(InputRecordSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -8325,8 +8513,6 @@ class CommandInputRecordSchema(InputRecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -8334,7 +8520,7 @@ class CommandInputRecordSchema(InputRecordSchema):
         self.fields = fields
         self.type_ = type_
         self.label = label
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandInputRecordSchema):
@@ -8375,6 +8561,8 @@ class CommandInputRecordSchema(InputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8416,7 +8604,7 @@ class CommandInputRecordSchema(InputRecordSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -8431,6 +8619,8 @@ class CommandInputRecordSchema(InputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -8479,6 +8669,8 @@ class CommandInputRecordSchema(InputRecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -8526,6 +8718,8 @@ class CommandInputRecordSchema(InputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -8601,12 +8795,13 @@ class CommandInputRecordSchema(InputRecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -8637,6 +8832,8 @@ class CommandInputRecordSchema(InputRecordSchema):
 class CommandInputEnumSchema(InputEnumSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -8649,13 +8846,11 @@ class CommandInputEnumSchema(InputEnumSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -8703,6 +8898,8 @@ class CommandInputEnumSchema(InputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8744,7 +8941,7 @@ class CommandInputEnumSchema(InputEnumSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -8760,6 +8957,8 @@ class CommandInputEnumSchema(InputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -8808,6 +9007,8 @@ class CommandInputEnumSchema(InputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -8855,6 +9056,8 @@ class CommandInputEnumSchema(InputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -8902,6 +9105,8 @@ class CommandInputEnumSchema(InputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -8978,12 +9183,13 @@ class CommandInputEnumSchema(InputEnumSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9020,6 +9226,8 @@ class CommandInputEnumSchema(InputEnumSchema):
 
 
 class CommandInputArraySchema(InputArraySchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -9031,8 +9239,6 @@ class CommandInputArraySchema(InputArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -9082,6 +9288,8 @@ class CommandInputArraySchema(InputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -9130,6 +9338,8 @@ class CommandInputArraySchema(InputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9177,6 +9387,8 @@ class CommandInputArraySchema(InputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9224,6 +9436,8 @@ class CommandInputArraySchema(InputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -9298,12 +9512,13 @@ class CommandInputArraySchema(InputArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -9339,6 +9554,8 @@ class CommandInputArraySchema(InputArraySchema):
 class CommandOutputRecordField(OutputRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -9350,14 +9567,12 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.outputBinding = outputBinding
 
@@ -9400,6 +9615,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9456,6 +9673,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -9504,6 +9723,8 @@ class CommandOutputRecordField(OutputRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9551,6 +9772,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -9626,12 +9849,13 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9667,6 +9891,8 @@ class CommandOutputRecordField(OutputRecordField):
 class CommandOutputRecordSchema(OutputRecordSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -9678,8 +9904,6 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -9687,7 +9911,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
         self.fields = fields
         self.type_ = type_
         self.label = label
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandOutputRecordSchema):
@@ -9728,6 +9952,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9769,7 +9995,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -9784,6 +10010,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -9832,6 +10060,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9879,6 +10109,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9954,12 +10186,13 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9990,6 +10223,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
 class CommandOutputEnumSchema(OutputEnumSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -10002,13 +10237,11 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -10056,6 +10289,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -10097,7 +10332,7 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -10113,6 +10348,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -10161,6 +10398,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10208,6 +10447,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10255,6 +10496,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -10331,12 +10574,13 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -10373,6 +10617,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
 
 
 class CommandOutputArraySchema(OutputArraySchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -10384,8 +10630,6 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -10435,6 +10679,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -10483,6 +10729,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10530,6 +10778,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10577,6 +10827,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -10651,12 +10903,13 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -10697,6 +10950,8 @@ class CommandInputParameter(InputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -10713,8 +10968,6 @@ class CommandInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -10723,7 +10976,7 @@ class CommandInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.inputBinding = inputBinding
         self.default = default
@@ -10785,6 +11038,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -10841,6 +11096,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10888,6 +11145,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -10935,6 +11194,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -10982,6 +11243,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11029,6 +11292,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -11076,6 +11341,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -11123,6 +11390,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -11170,6 +11439,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `type`":
@@ -11250,12 +11521,13 @@ class CommandInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -11331,6 +11603,8 @@ class CommandOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -11346,8 +11620,6 @@ class CommandOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -11356,7 +11628,7 @@ class CommandOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.outputBinding = outputBinding
         self.format = format
         self.type_ = type_
@@ -11415,6 +11687,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -11471,6 +11745,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11518,6 +11794,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -11565,6 +11843,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -11612,6 +11892,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11659,6 +11941,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -11706,6 +11990,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -11753,6 +12039,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `type`":
@@ -11832,12 +12120,13 @@ class CommandOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -11908,6 +12197,8 @@ class CommandLineTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -11931,13 +12222,11 @@ class CommandLineTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.inputs = inputs
         self.outputs = outputs
         self.requirements = requirements
@@ -12027,6 +12316,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -12068,7 +12359,7 @@ class CommandLineTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -12083,7 +12374,7 @@ class CommandLineTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -12101,6 +12392,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -12149,6 +12442,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -12196,6 +12491,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -12243,6 +12540,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -12290,6 +12589,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -12337,6 +12638,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -12384,6 +12687,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -12431,6 +12736,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `baseCommand`":
@@ -12478,6 +12785,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `arguments`":
@@ -12525,6 +12834,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdin`":
@@ -12572,6 +12883,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stderr`":
@@ -12619,6 +12932,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdout`":
@@ -12666,6 +12981,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `successCodes`":
@@ -12713,6 +13030,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `temporaryFailCodes`":
@@ -12760,6 +13079,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `permanentFailCodes`":
@@ -12847,18 +13168,19 @@ class CommandLineTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -12993,6 +13315,8 @@ class DockerRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         dockerPull: Any | None = None,
@@ -13006,8 +13330,6 @@ class DockerRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -13072,7 +13394,7 @@ class DockerRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -13089,6 +13411,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerPull`":
@@ -13136,6 +13460,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerLoad`":
@@ -13183,6 +13509,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerFile`":
@@ -13230,6 +13558,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImport`":
@@ -13277,6 +13607,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImageId`":
@@ -13324,6 +13656,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerOutputDirectory`":
@@ -13400,15 +13734,16 @@ class DockerRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -13486,6 +13821,8 @@ class SoftwareRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         packages: Any,
@@ -13494,8 +13831,6 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -13537,7 +13872,7 @@ class SoftwareRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -13555,6 +13890,8 @@ class SoftwareRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `packages`":
@@ -13626,15 +13963,16 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -13659,6 +13997,8 @@ class SoftwareRequirement(ProcessRequirement):
 
 
 class SoftwarePackage(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         package: Any,
@@ -13669,8 +14009,6 @@ class SoftwarePackage(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -13718,6 +14056,8 @@ class SoftwarePackage(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `package`":
@@ -13765,6 +14105,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `version`":
@@ -13812,6 +14154,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `specs`":
@@ -13885,12 +14229,13 @@ class SoftwarePackage(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.package is not None:
             r["package"] = save(
                 self.package, top=False, base_url=base_url, relative_uris=relative_uris
@@ -13920,6 +14265,8 @@ class Dirent(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         entry: Any,
@@ -13930,8 +14277,6 @@ class Dirent(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -13978,6 +14323,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `entryname`":
@@ -14026,6 +14373,8 @@ class Dirent(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `entry`":
@@ -14073,6 +14422,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `writable`":
@@ -14146,12 +14497,13 @@ class Dirent(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.entryname is not None:
             r["entryname"] = save(
                 self.entryname,
@@ -14185,6 +14537,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         listing: Any,
@@ -14193,8 +14547,6 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14236,7 +14588,7 @@ class InitialWorkDirRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14254,6 +14606,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `listing`":
@@ -14325,15 +14679,16 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14363,6 +14718,8 @@ class EnvVarRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envDef: Any,
@@ -14371,8 +14728,6 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14414,7 +14769,7 @@ class EnvVarRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14432,6 +14787,8 @@ class EnvVarRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envDef`":
@@ -14503,15 +14860,16 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14541,6 +14899,8 @@ class ShellCommandRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -14548,8 +14908,6 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14590,7 +14948,7 @@ class ShellCommandRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14628,15 +14986,16 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14674,6 +15033,8 @@ class ResourceRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         coresMin: Any | None = None,
@@ -14689,8 +15050,6 @@ class ResourceRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14761,7 +15120,7 @@ class ResourceRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14778,6 +15137,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMin`":
@@ -14825,6 +15186,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMax`":
@@ -14872,6 +15235,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMin`":
@@ -14919,6 +15284,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMax`":
@@ -14966,6 +15333,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMin`":
@@ -15013,6 +15382,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMax`":
@@ -15060,6 +15431,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMin`":
@@ -15107,6 +15480,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMax`":
@@ -15185,15 +15560,16 @@ class ResourceRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15272,6 +15648,8 @@ class ResourceRequirement(ProcessRequirement):
 class ExpressionToolOutputParameter(OutputParameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -15287,8 +15665,6 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15297,7 +15673,7 @@ class ExpressionToolOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.outputBinding = outputBinding
         self.format = format
         self.type_ = type_
@@ -15356,6 +15732,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -15412,6 +15790,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -15459,6 +15839,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -15506,6 +15888,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -15553,6 +15937,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -15600,6 +15986,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -15647,6 +16035,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -15694,6 +16084,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `type`":
@@ -15773,12 +16165,13 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -15849,6 +16242,8 @@ class ExpressionTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -15865,13 +16260,11 @@ class ExpressionTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.inputs = inputs
         self.outputs = outputs
         self.requirements = requirements
@@ -15940,6 +16333,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -15981,7 +16376,7 @@ class ExpressionTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -15996,7 +16391,7 @@ class ExpressionTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16014,6 +16409,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -16062,6 +16459,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -16109,6 +16508,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -16156,6 +16557,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -16203,6 +16606,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -16250,6 +16655,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -16297,6 +16704,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -16345,6 +16754,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `expression`":
@@ -16425,18 +16836,19 @@ class ExpressionTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16514,6 +16926,8 @@ class WorkflowOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -16531,8 +16945,6 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16541,7 +16953,7 @@ class WorkflowOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.outputBinding = outputBinding
         self.format = format
         self.outputSource = outputSource
@@ -16606,6 +17018,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -16662,6 +17076,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -16709,6 +17125,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -16756,6 +17174,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -16803,6 +17223,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -16850,6 +17272,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -16897,6 +17321,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -16944,6 +17370,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputSource`":
@@ -16991,6 +17419,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -17038,6 +17468,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `type`":
@@ -17119,12 +17551,13 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -17229,6 +17662,8 @@ class WorkflowStepInput(Sink):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17241,15 +17676,13 @@ class WorkflowStepInput(Sink):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.source = source
         self.linkMerge = linkMerge
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.default = default
         self.valueFrom = valueFrom
 
@@ -17295,6 +17728,8 @@ class WorkflowStepInput(Sink):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17351,6 +17786,8 @@ class WorkflowStepInput(Sink):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `source`":
@@ -17398,6 +17835,8 @@ class WorkflowStepInput(Sink):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -17445,6 +17884,8 @@ class WorkflowStepInput(Sink):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -17492,6 +17933,8 @@ class WorkflowStepInput(Sink):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -17568,12 +18011,13 @@ class WorkflowStepInput(Sink):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -17614,6 +18058,8 @@ class WorkflowStepOutput(Saveable):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17622,13 +18068,11 @@ class WorkflowStepOutput(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, WorkflowStepOutput):
@@ -17664,6 +18108,8 @@ class WorkflowStepOutput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17743,12 +18189,13 @@ class WorkflowStepOutput(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -17800,6 +18247,8 @@ class WorkflowStep(Saveable):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17817,13 +18266,11 @@ class WorkflowStep(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.in_ = in_
         self.out = out
         self.requirements = requirements
@@ -17892,6 +18339,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17949,6 +18398,8 @@ class WorkflowStep(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `in`":
@@ -17997,6 +18448,8 @@ class WorkflowStep(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `out`":
@@ -18044,6 +18497,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -18091,6 +18546,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -18138,6 +18595,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18185,6 +18644,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18233,6 +18694,8 @@ class WorkflowStep(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -18280,6 +18743,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatter`":
@@ -18327,6 +18792,8 @@ class WorkflowStep(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatterMethod`":
@@ -18408,12 +18875,13 @@ class WorkflowStep(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -18509,6 +18977,8 @@ class Workflow(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -18525,13 +18995,11 @@ class Workflow(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.inputs = inputs
         self.outputs = outputs
         self.requirements = requirements
@@ -18600,6 +19068,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -18641,7 +19111,7 @@ class Workflow(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -18656,7 +19126,7 @@ class Workflow(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -18674,6 +19144,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -18722,6 +19194,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -18769,6 +19243,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -18816,6 +19292,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -18863,6 +19341,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18910,6 +19390,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18957,6 +19439,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -19005,6 +19489,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `steps`":
@@ -19085,18 +19571,19 @@ class Workflow(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19169,6 +19656,8 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -19176,8 +19665,6 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19218,7 +19705,7 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19256,15 +19743,16 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19290,6 +19778,8 @@ class ScatterFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -19297,8 +19787,6 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19339,7 +19827,7 @@ class ScatterFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19377,15 +19865,16 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19411,6 +19900,8 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -19418,8 +19909,6 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19460,7 +19949,7 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19498,15 +19987,16 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19532,6 +20022,8 @@ class StepInputExpressionRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -19539,8 +20031,6 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19581,7 +20071,7 @@ class StepInputExpressionRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19619,15 +20109,16 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19648,6 +20139,8 @@ class StepInputExpressionRequirement(ProcessRequirement):
 
 
 class LoadListingRequirement(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadListing: Any,
@@ -19656,8 +20149,6 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19701,7 +20192,7 @@ class LoadListingRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19719,6 +20210,8 @@ class LoadListingRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `loadListing`":
@@ -19790,15 +20283,16 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19826,6 +20320,8 @@ class LoadListingRequirement(ProcessRequirement):
 
 
 class InplaceUpdateRequirement(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inplaceUpdate: Any,
@@ -19834,8 +20330,6 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19880,7 +20374,7 @@ class InplaceUpdateRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -19898,6 +20392,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inplaceUpdate`":
@@ -19969,15 +20465,16 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -20005,6 +20502,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
 
 
 class Secrets(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         secrets: Any,
@@ -20013,8 +20512,6 @@ class Secrets(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -20056,7 +20553,7 @@ class Secrets(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -20074,6 +20571,8 @@ class Secrets(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `secrets`":
@@ -20145,15 +20644,16 @@ class Secrets(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -20182,6 +20682,8 @@ class TimeLimit(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         timelimit: Any,
@@ -20190,8 +20692,6 @@ class TimeLimit(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -20235,7 +20735,7 @@ class TimeLimit(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -20253,6 +20753,8 @@ class TimeLimit(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `timelimit`":
@@ -20324,15 +20826,16 @@ class TimeLimit(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -20367,6 +20870,8 @@ class WorkReuse(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         enableReuse: Any,
@@ -20375,8 +20880,6 @@ class WorkReuse(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -20420,7 +20923,7 @@ class WorkReuse(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -20438,6 +20941,8 @@ class WorkReuse(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `enableReuse`":
@@ -20509,15 +21014,16 @@ class WorkReuse(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -20556,6 +21062,8 @@ class NetworkAccess(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         networkAccess: Any,
@@ -20564,8 +21072,6 @@ class NetworkAccess(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -20610,7 +21116,7 @@ class NetworkAccess(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -20628,6 +21134,8 @@ class NetworkAccess(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `networkAccess`":
@@ -20699,15 +21207,16 @@ class NetworkAccess(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -20737,6 +21246,8 @@ class NetworkAccess(ProcessRequirement):
 class ProcessGenerator(Process):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -20753,13 +21264,11 @@ class ProcessGenerator(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.inputs = inputs
         self.outputs = outputs
         self.requirements = requirements
@@ -20828,6 +21337,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20869,7 +21380,7 @@ class ProcessGenerator(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -20884,7 +21395,7 @@ class ProcessGenerator(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -20902,6 +21413,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -20950,6 +21463,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -20997,6 +21512,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -21044,6 +21561,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -21091,6 +21610,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -21138,6 +21659,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -21185,6 +21708,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -21233,6 +21758,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -21313,18 +21840,19 @@ class ProcessGenerator(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -21396,6 +21924,8 @@ class MPIRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         processes: Any,
@@ -21404,8 +21934,6 @@ class MPIRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -21449,7 +21977,7 @@ class MPIRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -21467,6 +21995,8 @@ class MPIRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `processes`":
@@ -21538,15 +22068,16 @@ class MPIRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -21579,6 +22110,8 @@ class CUDARequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         cudaComputeCapability: Any,
@@ -21590,8 +22123,6 @@ class CUDARequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -21650,7 +22181,7 @@ class CUDARequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -21668,6 +22199,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaComputeCapability`":
@@ -21715,6 +22248,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMax`":
@@ -21762,6 +22297,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMin`":
@@ -21810,6 +22347,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaVersionMin`":
@@ -21884,15 +22423,16 @@ class CUDARequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -21949,6 +22489,8 @@ class CUDARequirement(ProcessRequirement):
 
 
 class ShmSize(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         shmSize: Any,
@@ -21957,8 +22499,6 @@ class ShmSize(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22000,7 +22540,7 @@ class ShmSize(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22018,6 +22558,8 @@ class ShmSize(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `shmSize`":
@@ -22089,15 +22631,16 @@ class ShmSize(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17,6 +17,7 @@ from schema_salad.utils import aslist, json_dumps, yaml_no_ts
 import cwl_utils.parser
 import cwl_utils.parser.cwl_v1_0 as cwl
 import cwl_utils.parser.utils
+from cwl_utils.parser.index import IdIndex
 from cwl_utils.utils import yaml_dumps
 
 CONTENT_LIMIT: int = 64 * 1024
@@ -265,7 +266,9 @@ def type_for_step_input(
     """Determine the type for the given step input."""
     if in_.valueFrom is not None:
         return "Any"
-    step_run = cwl_utils.parser.utils.load_step(step)
+    step_run = cwl_utils.parser.clone(
+        cwl_utils.parser.utils.load_step(step, cache=True)
+    )
     cwl_utils.parser.utils.convert_stdstreams_to_files(step_run)
     if step_run and step_run.inputs:
         for step_input in step_run.inputs:
@@ -282,7 +285,9 @@ def type_for_step_output(
     sourcename: str,
 ) -> Any:
     """Determine the type for the given step output."""
-    step_run = cwl_utils.parser.utils.load_step(step)
+    step_run = cwl_utils.parser.clone(
+        cwl_utils.parser.utils.load_step(step, cache=True)
+    )
     cwl_utils.parser.utils.convert_stdstreams_to_files(step_run)
     if step_run and step_run.outputs:
         for step_output in step_run.outputs:
@@ -311,11 +316,12 @@ def type_for_source(
     sourcenames: str | list[str],
     parent: cwl.Workflow | None = None,
     linkMerge: str | None = None,
+    index: IdIndex | None = None,
 ) -> Any:
     """Determine the type for the given sourcenames."""
     scatter_context: list[tuple[int, str] | None] = []
     params = cwl_utils.parser.utils.param_for_source_id(
-        process, sourcenames, parent, scatter_context
+        process, sourcenames, parent, scatter_context, index
     )
     if not isinstance(params, MutableSequence):
         new_type = params.type_
@@ -2,11 +2,11 @@
 # This file was autogenerated using schema-salad-tool --codegen=python
 # The code itself is released under the Apache 2.0 license and the help text is
 # subject to the license of the original schema.
+# It was then patched with patch_parsers.py to use cwl_utils.parser.codegen_support.
 from __future__ import annotations
 
 import os
 import sys
-import uuid as _uuid__
 from collections.abc import Collection
 from typing import ClassVar
 
@@ -16,9 +16,19 @@ from schema_salad.runtime import (
     parse_errors,
     prefix_url,
     save,
-    save_relative_uri,
 )
 
+from cwl_utils.parser.anonymous import anonymous_id as _anonymous_id
+from cwl_utils.parser.codegen_support import ExpandMemos as _ExpandMemos
+from cwl_utils.parser.codegen_support import LazyExtensionFields as _LazyExtensionFields
+from cwl_utils.parser.codegen_support import expand_url as _expand_url_memoized
+from cwl_utils.parser.codegen_support import extension_fields as _extension_fields
+from cwl_utils.parser.codegen_support import intern as _intern
+from cwl_utils.parser.codegen_support import load_union as _load_union
+from cwl_utils.parser.codegen_support import save_relative_uri
+from cwl_utils.parser.codegen_support import speculative as _speculative
+from cwl_utils.parser.codegen_support import union_candidates as _union_candidates
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -88,6 +98,7 @@ class _PrimitiveLoader(Loader):
 class _ArrayLoader(Loader):
     def __init__(self, items: Loader) -> None:
         self.items: Final = items
+        self._item_loader: Final = _UnionLoader([self, items])
 
     def load(
         self,
@@ -107,9 +118,7 @@ class _ArrayLoader(Loader):
         fields: Final[list[str]] = []
         for i in range(0, len(doc)):
             try:
-                lf = _load_field(
-                    doc[i], _UnionLoader([self, self.items]), baseuri, loadingOptions, lc=lc
-                )
+                lf = _load_field(doc[i], self._item_loader, baseuri, loadingOptions, lc=lc)
                 flatten = loadingOptions.container != "@list"
                 if flatten and isinstance(lf, MutableSequence):
                     r.extend(lf)
@@ -130,6 +139,8 @@ class _ArrayLoader(Loader):
                             fields.append(doc[i].get("id"))
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 e = ValidationException(
                     "array item is invalid because", SourceLine(doc, i, str), [e]
                 )
@@ -176,6 +187,8 @@ class _MapLoader(Loader):
                 lf = _load_field(v, self.values, baseuri, loadingOptions, lc)
                 r[k] = lf
             except ValidationException as e:
+                if _speculative():
+                    raise
                 errors.append(e.with_sourceline(SourceLine(doc, k, str)))
         if errors:
             raise ValidationException("", None, errors)
@@ -199,7 +212,7 @@ class _EnumLoader(Loader):
         lc: Any | None = None,
     ) -> str:
         if doc in self.symbols:
-            return cast(str, doc)
+            return _intern(cast(str, doc))
         raise ValidationException(f"Expected one of {self.symbols}")
 
     def __repr__(self) -> str:
@@ -338,9 +351,15 @@ class _UnionLoader(Loader):
     def __init__(self, alternates: Sequence[Loader], name: str | None = None) -> None:
         self.alternates = alternates
         self.name: Final = name
+        self._dispatch: Final[dict[tuple[type, str | None], tuple[Loader, ...]]] = {}
 
     def add_loaders(self, loaders: Sequence[Loader]) -> None:
         self.alternates = tuple(loader for loader in chain(self.alternates, loaders))
+        self._dispatch.clear()
+
+    def _candidates(self, doc: Any) -> tuple[Loader, ...]:
+        """Select, in order, the alternates that may accept ``doc``."""
+        return cast(tuple[Loader, ...], _union_candidates(self, doc, _vocab))
 
     def load(
         self,
@@ -349,6 +368,16 @@ class _UnionLoader(Loader):
         loadingOptions: LoadingOptions,
         docRoot: str | None = None,
         lc: Any | None = None,
+    ) -> Any:
+        return _load_union(self, doc, baseuri, loadingOptions, docRoot, lc)
+
+    def _diagnose(
+        self,
+        doc: Any,
+        baseuri: str,
+        loadingOptions: LoadingOptions,
+        docRoot: str | None = None,
+        lc: Any | None = None,
     ) -> Any:
         errors: Final = []
 
@@ -753,6 +782,9 @@ def _document_load_by_url(
     return loadingOptions.idx[url]
 
 
+_expand_memo: Final = _ExpandMemos(_vocab, _rvocab)
+
+
 def _expand_url(
     url: str,
     base_url: str,
@@ -761,64 +793,15 @@ def _expand_url(
     vocab_term: bool = False,
     scoped_ref: int | None = None,
 ) -> str:
-    if url in ("@id", "@type"):
-        return url
-
-    vocab = _vocab | loadingOptions.vocab
-    if vocab_term and url in vocab:
-        return url
-
-    if bool(vocab) and ":" in url:
-        prefix: Final = url.split(":")[0]
-        if prefix in vocab:
-            url = vocab[prefix] + url[len(prefix) + 1 :]
-
-    split1: Final = urlsplit(url)
-
-    if (
-        (bool(split1.scheme) and split1.scheme in loadingOptions.fetcher.supported_schemes())
-        or url.startswith("$(")
-        or url.startswith("${")
-    ):
-        pass
-    elif scoped_id and not bool(split1.fragment):
-        splitbase1: Final = urlsplit(base_url)
-        frg: str
-        if bool(splitbase1.fragment):
-            frg = splitbase1.fragment + "/" + split1.path
-        else:
-            frg = split1.path
-        pt: Final = splitbase1.path if splitbase1.path != "" else "/"
-        url = urlunsplit((splitbase1.scheme, splitbase1.netloc, pt, splitbase1.query, frg))
-    elif scoped_ref is not None and not bool(split1.fragment):
-        splitbase2: Final = urlsplit(base_url)
-        sp = splitbase2.fragment.split("/")
-        n = scoped_ref
-        while n > 0 and len(sp) > 0:
-            sp.pop()
-            n -= 1
-        sp.append(url)
-        url = urlunsplit(
-            (
-                splitbase2.scheme,
-                splitbase2.netloc,
-                splitbase2.path,
-                splitbase2.query,
-                "/".join(sp),
-            )
-        )
-    else:
-        url = loadingOptions.fetcher.urljoin(base_url, url)
-
-    if vocab_term:
-        split2: Final = urlsplit(url)
-        if bool(split2.scheme):
-            if url in (rvocab := _rvocab | loadingOptions.rvocab):
-                return rvocab[url]
-        else:
-            raise ValidationException(f"Term {url!r} not in vocabulary")
-
-    return url
+    return _expand_url_memoized(
+        url,
+        base_url,
+        loadingOptions,
+        _expand_memo(loadingOptions),
+        scoped_id,
+        vocab_term,
+        scoped_ref,
+    )
 
 
 def _load_field(
@@ -855,6 +838,8 @@ def parser_info() -> str:
 
 
 class CWLArraySchema(schema_salad.metaschema.ArraySchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -864,8 +849,6 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -908,6 +891,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -956,6 +941,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1028,12 +1015,13 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -1056,6 +1044,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
 class CWLRecordField(schema_salad.metaschema.RecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -1066,14 +1056,12 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
 
     def __eq__(self, other: Any) -> bool:
@@ -1114,6 +1102,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -1170,6 +1160,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -1218,6 +1210,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1292,12 +1286,13 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -1322,6 +1317,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
 
 
 class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -1331,8 +1328,6 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1374,6 +1369,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -1422,6 +1419,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1494,12 +1493,13 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.fields is not None:
             r["fields"] = save(
                 self.fields, top=False, base_url=base_url, relative_uris=relative_uris
@@ -1548,6 +1548,8 @@ class File(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -1566,8 +1568,6 @@ class File(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1647,7 +1647,7 @@ class File(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -1664,6 +1664,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -1711,6 +1713,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -1758,6 +1762,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -1805,6 +1811,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dirname`":
@@ -1852,6 +1860,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameroot`":
@@ -1899,6 +1909,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameext`":
@@ -1946,6 +1958,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `checksum`":
@@ -1993,6 +2007,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `size`":
@@ -2040,6 +2056,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -2087,6 +2105,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -2134,6 +2154,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `contents`":
@@ -2215,15 +2237,16 @@ class File(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2326,6 +2349,8 @@ class Directory(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -2337,8 +2362,6 @@ class Directory(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -2391,7 +2414,7 @@ class Directory(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -2408,6 +2431,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -2455,6 +2480,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -2502,6 +2529,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -2549,6 +2578,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `listing`":
@@ -2623,15 +2654,16 @@ class Directory(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2705,6 +2737,8 @@ class Parameter(FieldBase, schema_salad.metaschema.Documented, IdentifierRequire
 
 
 class InputBinding(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -2713,8 +2747,6 @@ class InputBinding(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -2755,6 +2787,8 @@ class InputBinding(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -2826,12 +2860,13 @@ class InputBinding(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -2866,6 +2901,8 @@ class OutputSchema(IOSchema):
 class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -2882,14 +2919,12 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -2954,6 +2989,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3010,6 +3047,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -3058,6 +3097,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3105,6 +3146,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3152,6 +3195,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -3199,6 +3244,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -3246,6 +3293,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -3293,6 +3342,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -3340,6 +3391,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -3420,12 +3473,13 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3499,6 +3553,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
 class InputRecordSchema(CWLRecordSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -3511,8 +3567,6 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -3521,7 +3575,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, InputRecordSchema):
@@ -3563,6 +3617,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3604,7 +3660,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -3619,6 +3675,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -3667,6 +3725,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3714,6 +3774,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3761,6 +3823,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -3837,12 +3901,13 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3879,6 +3944,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
 class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -3891,13 +3958,11 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -3943,6 +4008,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3984,7 +4051,7 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -4000,6 +4067,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -4048,6 +4117,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4095,6 +4166,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4142,6 +4215,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4218,12 +4293,13 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -4259,6 +4335,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
 class InputArraySchema(CWLArraySchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -4271,8 +4349,6 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -4281,7 +4357,7 @@ class InputArraySchema(CWLArraySchema, InputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, InputArraySchema):
@@ -4323,6 +4399,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4364,7 +4442,7 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -4380,6 +4458,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -4428,6 +4508,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4475,6 +4557,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4522,6 +4606,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4598,12 +4684,13 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -4639,6 +4726,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
 class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -4653,14 +4742,12 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -4719,6 +4806,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4775,6 +4864,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4823,6 +4914,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4870,6 +4963,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4917,6 +5012,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -4964,6 +5061,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -5011,6 +5110,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -5089,12 +5190,13 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5144,6 +5246,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
 class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -5156,8 +5260,6 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5166,7 +5268,7 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, OutputRecordSchema):
@@ -5208,6 +5310,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -5249,7 +5353,7 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -5264,6 +5368,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -5312,6 +5418,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -5359,6 +5467,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5406,6 +5516,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -5482,12 +5594,13 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5524,6 +5637,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
 class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -5536,13 +5651,11 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -5588,6 +5701,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -5629,7 +5744,7 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -5645,6 +5760,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -5693,6 +5810,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -5740,6 +5859,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5787,6 +5908,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -5863,12 +5986,13 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5904,6 +6028,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
 class OutputArraySchema(CWLArraySchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -5916,8 +6042,6 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5926,7 +6050,7 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, OutputArraySchema):
@@ -5968,6 +6092,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -6009,7 +6135,7 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -6025,6 +6151,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -6073,6 +6201,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -6120,6 +6250,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -6167,6 +6299,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -6243,12 +6377,13 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -6315,6 +6450,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         expressionLib: Any | None = None,
@@ -6323,8 +6460,6 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6369,7 +6504,7 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6386,6 +6521,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `expressionLib`":
@@ -6457,15 +6594,16 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6502,6 +6640,8 @@ class SchemaDefRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         types: Any,
@@ -6510,8 +6650,6 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6553,7 +6691,7 @@ class SchemaDefRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6571,6 +6709,8 @@ class SchemaDefRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `types`":
@@ -6642,15 +6782,16 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6675,6 +6816,8 @@ class SchemaDefRequirement(ProcessRequirement):
 
 
 class SecondaryFileSchema(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         pattern: Any,
@@ -6684,8 +6827,6 @@ class SecondaryFileSchema(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6730,6 +6871,8 @@ class SecondaryFileSchema(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `pattern`":
@@ -6777,6 +6920,8 @@ class SecondaryFileSchema(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `required`":
@@ -6849,12 +6994,13 @@ class SecondaryFileSchema(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.pattern is not None:
             r["pattern"] = save(
                 self.pattern, top=False, base_url=base_url, relative_uris=relative_uris
@@ -6881,6 +7027,8 @@ class LoadListingRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadListing: Any | None = None,
@@ -6889,8 +7037,6 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6934,7 +7080,7 @@ class LoadListingRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6951,6 +7097,8 @@ class LoadListingRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -7022,15 +7170,16 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -7063,6 +7212,8 @@ class EnvironmentDef(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envName: Any,
@@ -7072,8 +7223,6 @@ class EnvironmentDef(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7118,6 +7267,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envName`":
@@ -7166,6 +7317,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envValue`":
@@ -7238,12 +7391,13 @@ class EnvironmentDef(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.envName is not None:
             r["envName"] = save(
                 self.envName, top=False, base_url=base_url, relative_uris=relative_uris
@@ -7288,6 +7442,8 @@ class CommandLineBinding(InputBinding):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -7302,8 +7458,6 @@ class CommandLineBinding(InputBinding):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7368,6 +7522,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7415,6 +7571,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `position`":
@@ -7462,6 +7620,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `prefix`":
@@ -7509,6 +7669,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `separate`":
@@ -7556,6 +7718,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `itemSeparator`":
@@ -7603,6 +7767,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -7650,6 +7816,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `shellQuote`":
@@ -7727,12 +7895,13 @@ class CommandLineBinding(InputBinding):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -7808,6 +7977,8 @@ class CommandOutputBinding(LoadContents):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -7819,8 +7990,6 @@ class CommandOutputBinding(LoadContents):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7869,6 +8038,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7916,6 +8087,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -7963,6 +8136,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `glob`":
@@ -8010,6 +8185,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputEval`":
@@ -8084,12 +8261,13 @@ class CommandOutputBinding(LoadContents):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -8136,6 +8314,8 @@ class CommandLineBindable(Saveable):
 class CommandInputRecordField(InputRecordField, CommandLineBindable):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -8153,14 +8333,12 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -8228,6 +8406,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8284,6 +8464,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -8332,6 +8514,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -8379,6 +8563,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -8426,6 +8612,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -8473,6 +8661,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -8520,6 +8710,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -8567,6 +8759,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -8614,6 +8808,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -8661,6 +8857,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -8742,12 +8940,13 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -8831,6 +9030,8 @@ class CommandInputRecordSchema(
 ):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -8844,8 +9045,6 @@ class CommandInputRecordSchema(
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -8854,7 +9053,7 @@ class CommandInputRecordSchema(
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.inputBinding = inputBinding
 
     def __eq__(self, other: Any) -> bool:
@@ -8907,6 +9106,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8948,7 +9149,7 @@ class CommandInputRecordSchema(
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -8963,6 +9164,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -9011,6 +9214,8 @@ class CommandInputRecordSchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9058,6 +9263,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9105,6 +9312,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -9152,6 +9361,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -9229,12 +9440,13 @@ class CommandInputRecordSchema(
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9278,6 +9490,8 @@ class CommandInputRecordSchema(
 class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBindable):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -9291,13 +9505,11 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -9354,6 +9566,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9395,7 +9609,7 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -9411,6 +9625,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -9459,6 +9675,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9506,6 +9724,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9553,6 +9773,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -9600,6 +9822,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -9677,12 +9901,13 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9727,6 +9952,8 @@ class CommandInputArraySchema(
 ):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -9740,8 +9967,6 @@ class CommandInputArraySchema(
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -9750,7 +9975,7 @@ class CommandInputArraySchema(
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.inputBinding = inputBinding
 
     def __eq__(self, other: Any) -> bool:
@@ -9796,6 +10021,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9837,7 +10064,7 @@ class CommandInputArraySchema(
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -9853,6 +10080,8 @@ class CommandInputArraySchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -9901,6 +10130,8 @@ class CommandInputArraySchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9948,6 +10179,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9995,6 +10228,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -10042,6 +10277,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -10119,12 +10356,13 @@ class CommandInputArraySchema(
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -10167,6 +10405,8 @@ class CommandInputArraySchema(
 class CommandOutputRecordField(OutputRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -10182,14 +10422,12 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -10251,6 +10489,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -10307,6 +10547,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -10355,6 +10597,8 @@ class CommandOutputRecordField(OutputRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10402,6 +10646,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10449,6 +10695,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -10496,6 +10744,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -10543,6 +10793,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -10590,6 +10842,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -10669,12 +10923,13 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -10740,6 +10995,8 @@ class CommandOutputRecordField(OutputRecordField):
 class CommandOutputRecordSchema(OutputRecordSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -10752,8 +11009,6 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -10762,7 +11017,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandOutputRecordSchema):
@@ -10804,6 +11059,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -10845,7 +11102,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -10860,6 +11117,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -10908,6 +11167,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10955,6 +11216,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11002,6 +11265,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11078,12 +11343,13 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11120,6 +11386,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
 class CommandOutputEnumSchema(OutputEnumSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -11132,13 +11400,11 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -11184,6 +11450,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -11225,7 +11493,7 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -11241,6 +11509,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -11289,6 +11559,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -11336,6 +11608,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11383,6 +11657,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11459,12 +11735,13 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11500,6 +11777,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
 class CommandOutputArraySchema(OutputArraySchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -11512,8 +11791,6 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -11522,7 +11799,7 @@ class CommandOutputArraySchema(OutputArraySchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandOutputArraySchema):
@@ -11564,6 +11841,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -11605,7 +11884,7 @@ class CommandOutputArraySchema(OutputArraySchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -11621,6 +11900,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -11669,6 +11950,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -11716,6 +11999,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11763,6 +12048,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11839,12 +12126,13 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11885,6 +12173,8 @@ class CommandInputParameter(InputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -11903,8 +12193,6 @@ class CommandInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -11913,7 +12201,7 @@ class CommandInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.loadContents = loadContents
         self.loadListing = loadListing
@@ -11981,6 +12269,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -12037,6 +12327,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -12084,6 +12376,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -12131,6 +12425,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -12178,6 +12474,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -12225,6 +12523,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -12272,6 +12572,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -12319,6 +12621,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -12366,6 +12670,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -12414,6 +12720,8 @@ class CommandInputParameter(InputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -12461,6 +12769,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -12543,12 +12853,13 @@ class CommandInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -12640,6 +12951,8 @@ class CommandOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -12655,8 +12968,6 @@ class CommandOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -12665,7 +12976,7 @@ class CommandOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.type_ = type_
         self.outputBinding = outputBinding
@@ -12724,6 +13035,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -12780,6 +13093,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -12827,6 +13142,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -12874,6 +13191,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -12921,6 +13240,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -12968,6 +13289,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -13016,6 +13339,8 @@ class CommandOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -13063,6 +13388,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -13142,12 +13469,13 @@ class CommandOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -13218,6 +13546,8 @@ class CommandLineTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -13241,13 +13571,11 @@ class CommandLineTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -13337,6 +13665,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -13378,7 +13708,7 @@ class CommandLineTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -13393,7 +13723,7 @@ class CommandLineTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -13410,6 +13740,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -13457,6 +13789,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -13505,6 +13839,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -13553,6 +13889,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -13600,6 +13938,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -13647,6 +13987,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -13694,6 +14036,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -13741,6 +14085,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `baseCommand`":
@@ -13788,6 +14134,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `arguments`":
@@ -13835,6 +14183,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdin`":
@@ -13882,6 +14232,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stderr`":
@@ -13929,6 +14281,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdout`":
@@ -13976,6 +14330,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `successCodes`":
@@ -14023,6 +14379,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `temporaryFailCodes`":
@@ -14070,6 +14428,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `permanentFailCodes`":
@@ -14157,18 +14517,19 @@ class CommandLineTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14307,6 +14668,8 @@ class DockerRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         dockerPull: Any | None = None,
@@ -14320,8 +14683,6 @@ class DockerRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14386,7 +14747,7 @@ class DockerRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14403,6 +14764,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerPull`":
@@ -14450,6 +14813,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerLoad`":
@@ -14497,6 +14862,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerFile`":
@@ -14544,6 +14911,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImport`":
@@ -14591,6 +14960,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImageId`":
@@ -14638,6 +15009,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerOutputDirectory`":
@@ -14714,15 +15087,16 @@ class DockerRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14800,6 +15174,8 @@ class SoftwareRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         packages: Any,
@@ -14808,8 +15184,6 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14851,7 +15225,7 @@ class SoftwareRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14869,6 +15243,8 @@ class SoftwareRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `packages`":
@@ -14940,15 +15316,16 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14973,6 +15350,8 @@ class SoftwareRequirement(ProcessRequirement):
 
 
 class SoftwarePackage(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         package: Any,
@@ -14983,8 +15362,6 @@ class SoftwarePackage(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15032,6 +15409,8 @@ class SoftwarePackage(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `package`":
@@ -15079,6 +15458,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `version`":
@@ -15126,6 +15507,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `specs`":
@@ -15199,12 +15582,13 @@ class SoftwarePackage(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.package is not None:
             r["package"] = save(
                 self.package, top=False, base_url=base_url, relative_uris=relative_uris
@@ -15234,6 +15618,8 @@ class Dirent(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         entry: Any,
@@ -15244,8 +15630,6 @@ class Dirent(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15292,6 +15676,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `entryname`":
@@ -15340,6 +15726,8 @@ class Dirent(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `entry`":
@@ -15387,6 +15775,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `writable`":
@@ -15460,12 +15850,13 @@ class Dirent(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.entryname is not None:
             r["entryname"] = save(
                 self.entryname,
@@ -15499,6 +15890,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         listing: Any,
@@ -15507,8 +15900,6 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15550,7 +15941,7 @@ class InitialWorkDirRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -15568,6 +15959,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `listing`":
@@ -15639,15 +16032,16 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15677,6 +16071,8 @@ class EnvVarRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envDef: Any,
@@ -15685,8 +16081,6 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15728,7 +16122,7 @@ class EnvVarRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -15746,6 +16140,8 @@ class EnvVarRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envDef`":
@@ -15817,15 +16213,16 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15855,6 +16252,8 @@ class ShellCommandRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -15862,8 +16261,6 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15904,7 +16301,7 @@ class ShellCommandRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -15942,15 +16339,16 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15988,6 +16386,8 @@ class ResourceRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         coresMin: Any | None = None,
@@ -16003,8 +16403,6 @@ class ResourceRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16075,7 +16473,7 @@ class ResourceRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16092,6 +16490,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMin`":
@@ -16139,6 +16539,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMax`":
@@ -16186,6 +16588,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMin`":
@@ -16233,6 +16637,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMax`":
@@ -16280,6 +16686,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMin`":
@@ -16327,6 +16735,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMax`":
@@ -16374,6 +16784,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMin`":
@@ -16421,6 +16833,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMax`":
@@ -16499,15 +16913,16 @@ class ResourceRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16591,6 +17006,8 @@ class WorkReuse(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         enableReuse: Any,
@@ -16599,8 +17016,6 @@ class WorkReuse(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16644,7 +17059,7 @@ class WorkReuse(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16662,6 +17077,8 @@ class WorkReuse(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `enableReuse`":
@@ -16733,15 +17150,16 @@ class WorkReuse(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16780,6 +17198,8 @@ class NetworkAccess(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         networkAccess: Any,
@@ -16788,8 +17208,6 @@ class NetworkAccess(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16834,7 +17252,7 @@ class NetworkAccess(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16852,6 +17270,8 @@ class NetworkAccess(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `networkAccess`":
@@ -16923,15 +17343,16 @@ class NetworkAccess(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16972,6 +17393,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inplaceUpdate: Any,
@@ -16980,8 +17403,6 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17026,7 +17447,7 @@ class InplaceUpdateRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -17044,6 +17465,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inplaceUpdate`":
@@ -17115,15 +17538,16 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17156,6 +17580,8 @@ class ToolTimeLimit(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         timelimit: Any,
@@ -17164,8 +17590,6 @@ class ToolTimeLimit(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17209,7 +17633,7 @@ class ToolTimeLimit(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -17227,6 +17651,8 @@ class ToolTimeLimit(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `timelimit`":
@@ -17298,15 +17724,16 @@ class ToolTimeLimit(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17336,6 +17763,8 @@ class ToolTimeLimit(ProcessRequirement):
 class ExpressionToolOutputParameter(OutputParameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17350,8 +17779,6 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17360,7 +17787,7 @@ class ExpressionToolOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.type_ = type_
 
@@ -17416,6 +17843,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17472,6 +17901,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -17519,6 +17950,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -17566,6 +17999,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -17613,6 +18048,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -17660,6 +18097,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -17708,6 +18147,8 @@ class ExpressionToolOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -17786,12 +18227,13 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -17841,6 +18283,8 @@ class ExpressionToolOutputParameter(OutputParameter):
 class WorkflowInputParameter(InputParameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17859,8 +18303,6 @@ class WorkflowInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17869,7 +18311,7 @@ class WorkflowInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.loadContents = loadContents
         self.loadListing = loadListing
@@ -17937,6 +18379,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17993,6 +18437,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18040,6 +18486,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -18087,6 +18535,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -18134,6 +18584,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18181,6 +18633,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -18228,6 +18682,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -18275,6 +18731,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -18322,6 +18780,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -18370,6 +18830,8 @@ class WorkflowInputParameter(InputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -18417,6 +18879,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -18499,12 +18963,13 @@ class WorkflowInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -18596,6 +19061,8 @@ class ExpressionTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -18612,13 +19079,11 @@ class ExpressionTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -18687,6 +19152,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -18728,7 +19195,7 @@ class ExpressionTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -18743,7 +19210,7 @@ class ExpressionTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -18760,6 +19227,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18807,6 +19276,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18855,6 +19326,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -18903,6 +19376,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -18950,6 +19425,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -18997,6 +19474,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -19044,6 +19523,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -19092,6 +19573,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `expression`":
@@ -19172,18 +19655,19 @@ class ExpressionTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19261,6 +19745,8 @@ class WorkflowOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -19277,8 +19763,6 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19287,7 +19771,7 @@ class WorkflowOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.outputSource = outputSource
         self.linkMerge = linkMerge
@@ -19349,6 +19833,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -19405,6 +19891,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -19452,6 +19940,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -19499,6 +19989,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -19546,6 +20038,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -19593,6 +20087,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -19640,6 +20136,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputSource`":
@@ -19687,6 +20185,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -19735,6 +20235,8 @@ class WorkflowOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -19815,12 +20317,13 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -19917,6 +20420,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -19932,13 +20437,11 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.source = source
         self.linkMerge = linkMerge
         self.loadContents = loadContents
@@ -20001,6 +20504,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20057,6 +20562,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `source`":
@@ -20104,6 +20611,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -20151,6 +20660,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -20198,6 +20709,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -20245,6 +20758,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -20292,6 +20807,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -20339,6 +20856,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -20418,12 +20937,13 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -20493,6 +21013,8 @@ class WorkflowStepOutput(IdentifierRequired):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -20501,13 +21023,11 @@ class WorkflowStepOutput(IdentifierRequired):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, WorkflowStepOutput):
@@ -20543,6 +21063,8 @@ class WorkflowStepOutput(IdentifierRequired):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20622,12 +21144,13 @@ class WorkflowStepOutput(IdentifierRequired):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -20679,6 +21202,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -20696,13 +21221,11 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.in_ = in_
@@ -20771,6 +21294,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20827,6 +21352,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -20874,6 +21401,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -20922,6 +21451,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `in`":
@@ -20970,6 +21501,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `out`":
@@ -21017,6 +21550,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -21064,6 +21599,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -21114,6 +21651,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -21161,6 +21700,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatter`":
@@ -21208,6 +21749,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatterMethod`":
@@ -21289,12 +21832,13 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -21390,6 +21934,8 @@ class Workflow(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -21406,13 +21952,11 @@ class Workflow(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -21481,6 +22025,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -21522,7 +22068,7 @@ class Workflow(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -21537,7 +22083,7 @@ class Workflow(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -21554,6 +22100,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -21601,6 +22149,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -21649,6 +22199,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -21697,6 +22249,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -21744,6 +22298,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -21791,6 +22347,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -21838,6 +22396,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -21886,6 +22446,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `steps`":
@@ -21966,18 +22528,19 @@ class Workflow(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22050,6 +22613,8 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22057,8 +22622,6 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22099,7 +22662,7 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22137,15 +22700,16 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22171,6 +22735,8 @@ class ScatterFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22178,8 +22744,6 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22220,7 +22784,7 @@ class ScatterFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22258,15 +22822,16 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22292,6 +22857,8 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22299,8 +22866,6 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22341,7 +22906,7 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22379,15 +22944,16 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22413,6 +22979,8 @@ class StepInputExpressionRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22420,8 +22988,6 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22462,7 +23028,7 @@ class StepInputExpressionRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22500,15 +23066,16 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22529,6 +23096,8 @@ class StepInputExpressionRequirement(ProcessRequirement):
 
 
 class Secrets(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         secrets: Any,
@@ -22537,8 +23106,6 @@ class Secrets(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22580,7 +23147,7 @@ class Secrets(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22598,6 +23165,8 @@ class Secrets(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `secrets`":
@@ -22669,15 +23238,16 @@ class Secrets(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22703,6 +23273,8 @@ class Secrets(ProcessRequirement):
 class ProcessGenerator(Process):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -22719,13 +23291,11 @@ class ProcessGenerator(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -22794,6 +23364,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -22835,7 +23407,7 @@ class ProcessGenerator(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -22850,7 +23422,7 @@ class ProcessGenerator(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22867,6 +23439,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -22914,6 +23488,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -22962,6 +23538,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -23010,6 +23588,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -23057,6 +23637,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -23104,6 +23686,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -23151,6 +23735,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -23201,6 +23787,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -23281,18 +23869,19 @@ class ProcessGenerator(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -23364,6 +23953,8 @@ class MPIRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         processes: Any,
@@ -23372,8 +23963,6 @@ class MPIRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -23417,7 +24006,7 @@ class MPIRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -23435,6 +24024,8 @@ class MPIRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `processes`":
@@ -23506,15 +24097,16 @@ class MPIRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -23547,6 +24139,8 @@ class CUDARequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         cudaComputeCapability: Any,
@@ -23558,8 +24152,6 @@ class CUDARequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -23618,7 +24210,7 @@ class CUDARequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -23636,6 +24228,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaComputeCapability`":
@@ -23683,6 +24277,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMax`":
@@ -23730,6 +24326,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMin`":
@@ -23778,6 +24376,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaVersionMin`":
@@ -23852,15 +24452,16 @@ class CUDARequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -23917,6 +24518,8 @@ class CUDARequirement(ProcessRequirement):
 
 
 class ShmSize(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         shmSize: Any,
@@ -23925,8 +24528,6 @@ class ShmSize(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -23968,7 +24569,7 @@ class ShmSize(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -23986,6 +24587,8 @@ class ShmSize(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `shmSize`":
@@ -24057,15 +24660,16 @@ class ShmSize(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2,11 +2,11 @@
 # This file was autogenerated using schema-salad-tool --codegen=python
 # The code itself is released under the Apache 2.0 license and the help text is
 # subject to the license of the original schema.
+# It was then patched with patch_parsers.py to use cwl_utils.parser.codegen_support.
 from __future__ import annotations
 
 import os
 import sys
-import uuid as _uuid__
 from collections.abc import Collection
 from typing import ClassVar
 
@@ -16,9 +16,19 @@ from schema_salad.runtime import (
     parse_errors,
     prefix_url,
     save,
-    save_relative_uri,
 )
 
+from cwl_utils.parser.anonymous import anonymous_id as _anonymous_id
+from cwl_utils.parser.codegen_support import ExpandMemos as _ExpandMemos
+from cwl_utils.parser.codegen_support import LazyExtensionFields as _LazyExtensionFields
+from cwl_utils.parser.codegen_support import expand_url as _expand_url_memoized
+from cwl_utils.parser.codegen_support import extension_fields as _extension_fields
+from cwl_utils.parser.codegen_support import intern as _intern
+from cwl_utils.parser.codegen_support import load_union as _load_union
+from cwl_utils.parser.codegen_support import save_relative_uri
+from cwl_utils.parser.codegen_support import speculative as _speculative
+from cwl_utils.parser.codegen_support import union_candidates as _union_candidates
+
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -88,6 +98,7 @@ class _PrimitiveLoader(Loader):
 class _ArrayLoader(Loader):
     def __init__(self, items: Loader) -> None:
         self.items: Final = items
+        self._item_loader: Final = _UnionLoader([self, items])
 
     def load(
         self,
@@ -107,9 +118,7 @@ class _ArrayLoader(Loader):
         fields: Final[list[str]] = []
         for i in range(0, len(doc)):
             try:
-                lf = _load_field(
-                    doc[i], _UnionLoader([self, self.items]), baseuri, loadingOptions, lc=lc
-                )
+                lf = _load_field(doc[i], self._item_loader, baseuri, loadingOptions, lc=lc)
                 flatten = loadingOptions.container != "@list"
                 if flatten and isinstance(lf, MutableSequence):
                     r.extend(lf)
@@ -130,6 +139,8 @@ class _ArrayLoader(Loader):
                             fields.append(doc[i].get("id"))
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 e = ValidationException(
                     "array item is invalid because", SourceLine(doc, i, str), [e]
                 )
@@ -176,6 +187,8 @@ class _MapLoader(Loader):
                 lf = _load_field(v, self.values, baseuri, loadingOptions, lc)
                 r[k] = lf
             except ValidationException as e:
+                if _speculative():
+                    raise
                 errors.append(e.with_sourceline(SourceLine(doc, k, str)))
         if errors:
             raise ValidationException("", None, errors)
@@ -199,7 +212,7 @@ class _EnumLoader(Loader):
         lc: Any | None = None,
     ) -> str:
         if doc in self.symbols:
-            return cast(str, doc)
+            return _intern(cast(str, doc))
         raise ValidationException(f"Expected one of {self.symbols}")
 
     def __repr__(self) -> str:
@@ -338,9 +351,15 @@ class _UnionLoader(Loader):
     def __init__(self, alternates: Sequence[Loader], name: str | None = None) -> None:
         self.alternates = alternates
         self.name: Final = name
+        self._dispatch: Final[dict[tuple[type, str | None], tuple[Loader, ...]]] = {}
 
     def add_loaders(self, loaders: Sequence[Loader]) -> None:
         self.alternates = tuple(loader for loader in chain(self.alternates, loaders))
+        self._dispatch.clear()
+
+    def _candidates(self, doc: Any) -> tuple[Loader, ...]:
+        """Select, in order, the alternates that may accept ``doc``."""
+        return cast(tuple[Loader, ...], _union_candidates(self, doc, _vocab))
 
     def load(
         self,
@@ -349,6 +368,16 @@ class _UnionLoader(Loader):
         loadingOptions: LoadingOptions,
         docRoot: str | None = None,
         lc: Any | None = None,
+    ) -> Any:
+        return _load_union(self, doc, baseuri, loadingOptions, docRoot, lc)
+
+    def _diagnose(
+        self,
+        doc: Any,
+        baseuri: str,
+        loadingOptions: LoadingOptions,
+        docRoot: str | None = None,
+        lc: Any | None = None,
     ) -> Any:
         errors: Final = []
 
@@ -753,6 +782,9 @@ def _document_load_by_url(
     return loadingOptions.idx[url]
 
 
+_expand_memo: Final = _ExpandMemos(_vocab, _rvocab)
+
+
 def _expand_url(
     url: str,
     base_url: str,
@@ -761,64 +793,15 @@ def _expand_url(
     vocab_term: bool = False,
     scoped_ref: int | None = None,
 ) -> str:
-    if url in ("@id", "@type"):
-        return url
-
-    vocab = _vocab | loadingOptions.vocab
-    if vocab_term and url in vocab:
-        return url
-
-    if bool(vocab) and ":" in url:
-        prefix: Final = url.split(":")[0]
-        if prefix in vocab:
-            url = vocab[prefix] + url[len(prefix) + 1 :]
-
-    split1: Final = urlsplit(url)
-
-    if (
-        (bool(split1.scheme) and split1.scheme in loadingOptions.fetcher.supported_schemes())
-        or url.startswith("$(")
-        or url.startswith("${")
-    ):
-        pass
-    elif scoped_id and not bool(split1.fragment):
-        splitbase1: Final = urlsplit(base_url)
-        frg: str
-        if bool(splitbase1.fragment):
-            frg = splitbase1.fragment + "/" + split1.path
-        else:
-            frg = split1.path
-        pt: Final = splitbase1.path if splitbase1.path != "" else "/"
-        url = urlunsplit((splitbase1.scheme, splitbase1.netloc, pt, splitbase1.query, frg))
-    elif scoped_ref is not None and not bool(split1.fragment):
-        splitbase2: Final = urlsplit(base_url)
-        sp = splitbase2.fragment.split("/")
-        n = scoped_ref
-        while n > 0 and len(sp) > 0:
-            sp.pop()
-            n -= 1
-        sp.append(url)
-        url = urlunsplit(
-            (
-                splitbase2.scheme,
-                splitbase2.netloc,
-                splitbase2.path,
-                splitbase2.query,
-                "/".join(sp),
-            )
-        )
-    else:
-        url = loadingOptions.fetcher.urljoin(base_url, url)
-
-    if vocab_term:
-        split2: Final = urlsplit(url)
-        if bool(split2.scheme):
-            if url in (rvocab := _rvocab | loadingOptions.rvocab):
-                return rvocab[url]
-        else:
-            raise ValidationException(f"Term {url!r} not in vocabulary")
-
-    return url
+    return _expand_url_memoized(
+        url,
+        base_url,
+        loadingOptions,
+        _expand_memo(loadingOptions),
+        scoped_id,
+        vocab_term,
+        scoped_ref,
+    )
 
 
 def _load_field(
@@ -855,6 +838,8 @@ def parser_info() -> str:
 
 
 class CWLArraySchema(schema_salad.metaschema.ArraySchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -864,8 +849,6 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -908,6 +891,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -956,6 +941,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1028,12 +1015,13 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.items is not None:
             u = save_relative_uri(self.items, base_url, False, 2, relative_uris)
             r["items"] = u
@@ -1056,6 +1044,8 @@ class CWLArraySchema(schema_salad.metaschema.ArraySchema):
 class CWLRecordField(schema_salad.metaschema.RecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -1066,14 +1056,12 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
 
     def __eq__(self, other: Any) -> bool:
@@ -1114,6 +1102,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -1170,6 +1160,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -1218,6 +1210,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1292,12 +1286,13 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -1322,6 +1317,8 @@ class CWLRecordField(schema_salad.metaschema.RecordField):
 
 
 class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -1331,8 +1328,6 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1374,6 +1369,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -1422,6 +1419,8 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -1494,12 +1493,13 @@ class CWLRecordSchema(schema_salad.metaschema.RecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.fields is not None:
             r["fields"] = save(
                 self.fields, top=False, base_url=base_url, relative_uris=relative_uris
@@ -1548,6 +1548,8 @@ class File(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -1566,8 +1568,6 @@ class File(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -1647,7 +1647,7 @@ class File(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -1664,6 +1664,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -1711,6 +1713,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -1758,6 +1762,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -1805,6 +1811,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dirname`":
@@ -1852,6 +1860,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameroot`":
@@ -1899,6 +1909,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `nameext`":
@@ -1946,6 +1958,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `checksum`":
@@ -1993,6 +2007,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `size`":
@@ -2040,6 +2056,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -2087,6 +2105,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -2134,6 +2154,8 @@ class File(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `contents`":
@@ -2215,15 +2237,16 @@ class File(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2326,6 +2349,8 @@ class Directory(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         location: Any | None = None,
@@ -2337,8 +2362,6 @@ class Directory(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -2391,7 +2414,7 @@ class Directory(Saveable):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -2408,6 +2431,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `location`":
@@ -2455,6 +2480,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `path`":
@@ -2502,6 +2529,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `basename`":
@@ -2549,6 +2578,8 @@ class Directory(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `listing`":
@@ -2623,15 +2654,16 @@ class Directory(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -2705,6 +2737,8 @@ class Parameter(FieldBase, schema_salad.metaschema.Documented, IdentifierRequire
 
 
 class InputBinding(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -2713,8 +2747,6 @@ class InputBinding(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -2755,6 +2787,8 @@ class InputBinding(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -2826,12 +2860,13 @@ class InputBinding(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -2866,6 +2901,8 @@ class OutputSchema(IOSchema):
 class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -2882,14 +2919,12 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -2954,6 +2989,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3010,6 +3047,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -3058,6 +3097,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3105,6 +3146,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3152,6 +3195,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -3199,6 +3244,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -3246,6 +3293,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -3293,6 +3342,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -3340,6 +3391,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -3420,12 +3473,13 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3499,6 +3553,8 @@ class InputRecordField(CWLRecordField, FieldBase, InputFormat, LoadContents):
 class InputRecordSchema(CWLRecordSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -3511,8 +3567,6 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -3521,7 +3575,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, InputRecordSchema):
@@ -3563,6 +3617,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3604,7 +3660,7 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -3619,6 +3675,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -3667,6 +3725,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -3714,6 +3774,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -3761,6 +3823,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -3837,12 +3901,13 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -3879,6 +3944,8 @@ class InputRecordSchema(CWLRecordSchema, InputSchema):
 class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -3891,13 +3958,11 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -3943,6 +4008,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -3984,7 +4051,7 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -4000,6 +4067,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -4048,6 +4117,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4095,6 +4166,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4142,6 +4215,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4218,12 +4293,13 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -4259,6 +4335,8 @@ class InputEnumSchema(schema_salad.metaschema.EnumSchema, InputSchema):
 class InputArraySchema(CWLArraySchema, InputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -4271,8 +4349,6 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -4281,7 +4357,7 @@ class InputArraySchema(CWLArraySchema, InputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, InputArraySchema):
@@ -4323,6 +4399,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4364,7 +4442,7 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -4380,6 +4458,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -4428,6 +4508,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4475,6 +4557,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4522,6 +4606,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4598,12 +4684,13 @@ class InputArraySchema(CWLArraySchema, InputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -4639,6 +4726,8 @@ class InputArraySchema(CWLArraySchema, InputSchema):
 class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -4653,14 +4742,12 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -4719,6 +4806,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -4775,6 +4864,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -4823,6 +4914,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -4870,6 +4963,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -4917,6 +5012,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -4964,6 +5061,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -5011,6 +5110,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -5089,12 +5190,13 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5144,6 +5246,8 @@ class OutputRecordField(CWLRecordField, FieldBase, OutputFormat):
 class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -5156,8 +5260,6 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5166,7 +5268,7 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, OutputRecordSchema):
@@ -5208,6 +5310,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -5249,7 +5353,7 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -5264,6 +5368,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -5312,6 +5418,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -5359,6 +5467,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5406,6 +5516,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -5482,12 +5594,13 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5524,6 +5637,8 @@ class OutputRecordSchema(CWLRecordSchema, OutputSchema):
 class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -5536,13 +5651,11 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -5588,6 +5701,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -5629,7 +5744,7 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -5645,6 +5760,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -5693,6 +5810,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -5740,6 +5859,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -5787,6 +5908,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -5863,12 +5986,13 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -5904,6 +6028,8 @@ class OutputEnumSchema(schema_salad.metaschema.EnumSchema, OutputSchema):
 class OutputArraySchema(CWLArraySchema, OutputSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -5916,8 +6042,6 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -5926,7 +6050,7 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, OutputArraySchema):
@@ -5968,6 +6092,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -6009,7 +6135,7 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -6025,6 +6151,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -6073,6 +6201,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -6120,6 +6250,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -6167,6 +6299,8 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -6243,12 +6377,13 @@ class OutputArraySchema(CWLArraySchema, OutputSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -6315,6 +6450,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         expressionLib: Any | None = None,
@@ -6323,8 +6460,6 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6369,7 +6504,7 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6386,6 +6521,8 @@ class InlineJavascriptRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `expressionLib`":
@@ -6457,15 +6594,16 @@ class InlineJavascriptRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6506,6 +6644,8 @@ class SchemaDefRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         types: Any,
@@ -6514,8 +6654,6 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6557,7 +6695,7 @@ class SchemaDefRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6575,6 +6713,8 @@ class SchemaDefRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `types`":
@@ -6646,15 +6786,16 @@ class SchemaDefRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -6691,6 +6832,8 @@ class SecondaryFileSchema(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         pattern: Any,
@@ -6700,8 +6843,6 @@ class SecondaryFileSchema(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6746,6 +6887,8 @@ class SecondaryFileSchema(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `pattern`":
@@ -6793,6 +6936,8 @@ class SecondaryFileSchema(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `required`":
@@ -6865,12 +7010,13 @@ class SecondaryFileSchema(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.pattern is not None:
             r["pattern"] = save(
                 self.pattern, top=False, base_url=base_url, relative_uris=relative_uris
@@ -6897,6 +7043,8 @@ class LoadListingRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadListing: Any | None = None,
@@ -6905,8 +7053,6 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -6950,7 +7096,7 @@ class LoadListingRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -6967,6 +7113,8 @@ class LoadListingRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -7038,15 +7186,16 @@ class LoadListingRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -7079,6 +7228,8 @@ class EnvironmentDef(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envName: Any,
@@ -7088,8 +7239,6 @@ class EnvironmentDef(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7134,6 +7283,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envName`":
@@ -7182,6 +7333,8 @@ class EnvironmentDef(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envValue`":
@@ -7254,12 +7407,13 @@ class EnvironmentDef(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.envName is not None:
             r["envName"] = save(
                 self.envName, top=False, base_url=base_url, relative_uris=relative_uris
@@ -7304,6 +7458,8 @@ class CommandLineBinding(InputBinding):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -7318,8 +7474,6 @@ class CommandLineBinding(InputBinding):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7384,6 +7538,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7431,6 +7587,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `position`":
@@ -7478,6 +7636,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `prefix`":
@@ -7525,6 +7685,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `separate`":
@@ -7572,6 +7734,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `itemSeparator`":
@@ -7619,6 +7783,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -7666,6 +7832,8 @@ class CommandLineBinding(InputBinding):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `shellQuote`":
@@ -7743,12 +7911,13 @@ class CommandLineBinding(InputBinding):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -7824,6 +7993,8 @@ class CommandOutputBinding(LoadContents):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loadContents: Any | None = None,
@@ -7835,8 +8006,6 @@ class CommandOutputBinding(LoadContents):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -7885,6 +8054,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -7932,6 +8103,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -7979,6 +8152,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `glob`":
@@ -8026,6 +8201,8 @@ class CommandOutputBinding(LoadContents):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputEval`":
@@ -8100,12 +8277,13 @@ class CommandOutputBinding(LoadContents):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.loadContents is not None:
             r["loadContents"] = save(
                 self.loadContents,
@@ -8152,6 +8330,8 @@ class CommandLineBindable(Saveable):
 class CommandInputRecordField(InputRecordField, CommandLineBindable):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -8169,14 +8349,12 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -8244,6 +8422,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8300,6 +8480,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -8348,6 +8530,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -8395,6 +8579,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -8442,6 +8628,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -8489,6 +8677,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -8536,6 +8726,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -8583,6 +8775,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -8630,6 +8824,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -8677,6 +8873,8 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -8758,12 +8956,13 @@ class CommandInputRecordField(InputRecordField, CommandLineBindable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -8847,6 +9046,8 @@ class CommandInputRecordSchema(
 ):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -8860,8 +9061,6 @@ class CommandInputRecordSchema(
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -8870,7 +9069,7 @@ class CommandInputRecordSchema(
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.inputBinding = inputBinding
 
     def __eq__(self, other: Any) -> bool:
@@ -8923,6 +9122,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -8964,7 +9165,7 @@ class CommandInputRecordSchema(
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -8979,6 +9180,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -9027,6 +9230,8 @@ class CommandInputRecordSchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9074,6 +9279,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9121,6 +9328,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -9168,6 +9377,8 @@ class CommandInputRecordSchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -9245,12 +9456,13 @@ class CommandInputRecordSchema(
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9294,6 +9506,8 @@ class CommandInputRecordSchema(
 class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBindable):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -9307,13 +9521,11 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -9370,6 +9582,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9411,7 +9625,7 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -9427,6 +9641,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -9475,6 +9691,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9522,6 +9740,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -9569,6 +9789,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -9616,6 +9838,8 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -9693,12 +9917,13 @@ class CommandInputEnumSchema(InputEnumSchema, CommandInputSchema, CommandLineBin
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -9743,6 +9968,8 @@ class CommandInputArraySchema(
 ):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -9756,8 +9983,6 @@ class CommandInputArraySchema(
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -9766,7 +9991,7 @@ class CommandInputArraySchema(
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.inputBinding = inputBinding
 
     def __eq__(self, other: Any) -> bool:
@@ -9812,6 +10037,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -9853,7 +10080,7 @@ class CommandInputArraySchema(
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -9869,6 +10096,8 @@ class CommandInputArraySchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -9917,6 +10146,8 @@ class CommandInputArraySchema(
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -9964,6 +10195,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10011,6 +10244,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -10058,6 +10293,8 @@ class CommandInputArraySchema(
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -10135,12 +10372,13 @@ class CommandInputArraySchema(
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -10183,6 +10421,8 @@ class CommandInputArraySchema(
 class CommandOutputRecordField(OutputRecordField):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         name: Any,
@@ -10198,14 +10438,12 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.type_ = type_
         self.label = label
         self.secondaryFiles = secondaryFiles
@@ -10267,6 +10505,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -10323,6 +10563,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -10371,6 +10613,8 @@ class CommandOutputRecordField(OutputRecordField):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10418,6 +10662,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -10465,6 +10711,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -10512,6 +10760,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -10559,6 +10809,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -10606,6 +10858,8 @@ class CommandOutputRecordField(OutputRecordField):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -10685,12 +10939,13 @@ class CommandOutputRecordField(OutputRecordField):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -10756,6 +11011,8 @@ class CommandOutputRecordField(OutputRecordField):
 class CommandOutputRecordSchema(OutputRecordSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         type_: Any,
@@ -10768,8 +11025,6 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -10778,7 +11033,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandOutputRecordSchema):
@@ -10820,6 +11075,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -10861,7 +11118,7 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         fields = None
@@ -10876,6 +11133,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `fields`":
@@ -10924,6 +11183,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -10971,6 +11232,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11018,6 +11281,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11094,12 +11359,13 @@ class CommandOutputRecordSchema(OutputRecordSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11136,6 +11402,8 @@ class CommandOutputRecordSchema(OutputRecordSchema):
 class CommandOutputEnumSchema(OutputEnumSchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         symbols: Any,
@@ -11148,13 +11416,11 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
         self.symbols = symbols
         self.type_ = type_
         self.label = label
@@ -11200,6 +11466,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -11241,7 +11509,7 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -11257,6 +11525,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `symbols`":
@@ -11305,6 +11575,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -11352,6 +11624,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11399,6 +11673,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11475,12 +11751,13 @@ class CommandOutputEnumSchema(OutputEnumSchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11516,6 +11793,8 @@ class CommandOutputEnumSchema(OutputEnumSchema):
 class CommandOutputArraySchema(OutputArraySchema):
     name: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         items: Any,
@@ -11528,8 +11807,6 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -11538,7 +11815,7 @@ class CommandOutputArraySchema(OutputArraySchema):
         self.type_ = type_
         self.label = label
         self.doc = doc
-        self.name = name if name is not None else "_:" + str(_uuid__.uuid4())
+        self.name = name if name is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, CommandOutputArraySchema):
@@ -11580,6 +11857,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `name`":
@@ -11621,7 +11900,7 @@ class CommandOutputArraySchema(OutputArraySchema):
             if docRoot is not None:
                 name = docRoot
             else:
-                name = "_:" + str(_uuid__.uuid4())
+                name = _anonymous_id()
         if not __original_name_is_none:
             baseuri = cast(str, name)
         try:
@@ -11637,6 +11916,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `items`":
@@ -11685,6 +11966,8 @@ class CommandOutputArraySchema(OutputArraySchema):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -11732,6 +12015,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -11779,6 +12064,8 @@ class CommandOutputArraySchema(OutputArraySchema):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -11855,12 +12142,13 @@ class CommandOutputArraySchema(OutputArraySchema):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.name is not None:
             u = save_relative_uri(self.name, base_url, True, None, relative_uris)
             r["name"] = u
@@ -11901,6 +12189,8 @@ class CommandInputParameter(InputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -11919,8 +12209,6 @@ class CommandInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -11929,7 +12217,7 @@ class CommandInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.loadContents = loadContents
         self.loadListing = loadListing
@@ -11997,6 +12285,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -12053,6 +12343,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -12100,6 +12392,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -12147,6 +12441,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -12194,6 +12490,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -12241,6 +12539,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -12288,6 +12588,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -12335,6 +12637,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -12382,6 +12686,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -12430,6 +12736,8 @@ class CommandInputParameter(InputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -12477,6 +12785,8 @@ class CommandInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -12559,12 +12869,13 @@ class CommandInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -12656,6 +12967,8 @@ class CommandOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -12671,8 +12984,6 @@ class CommandOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -12681,7 +12992,7 @@ class CommandOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.type_ = type_
         self.outputBinding = outputBinding
@@ -12740,6 +13051,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -12796,6 +13109,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -12843,6 +13158,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -12890,6 +13207,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -12937,6 +13256,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -12984,6 +13305,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -13032,6 +13355,8 @@ class CommandOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -13079,6 +13404,8 @@ class CommandOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputBinding`":
@@ -13158,12 +13485,13 @@ class CommandOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -13234,6 +13562,8 @@ class CommandLineTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -13258,13 +13588,11 @@ class CommandLineTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -13357,6 +13685,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -13398,7 +13728,7 @@ class CommandLineTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -13413,7 +13743,7 @@ class CommandLineTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -13430,6 +13760,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -13477,6 +13809,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -13525,6 +13859,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -13573,6 +13909,8 @@ class CommandLineTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -13620,6 +13958,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -13667,6 +14007,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -13714,6 +14056,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -13761,6 +14105,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `intent`":
@@ -13808,6 +14154,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `baseCommand`":
@@ -13855,6 +14203,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `arguments`":
@@ -13902,6 +14252,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdin`":
@@ -13949,6 +14301,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stderr`":
@@ -13996,6 +14350,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `stdout`":
@@ -14043,6 +14399,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `successCodes`":
@@ -14090,6 +14448,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `temporaryFailCodes`":
@@ -14137,6 +14497,8 @@ class CommandLineTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `permanentFailCodes`":
@@ -14225,18 +14587,19 @@ class CommandLineTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14379,6 +14742,8 @@ class DockerRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         dockerPull: Any | None = None,
@@ -14392,8 +14757,6 @@ class DockerRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14458,7 +14821,7 @@ class DockerRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14475,6 +14838,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerPull`":
@@ -14522,6 +14887,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerLoad`":
@@ -14569,6 +14936,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerFile`":
@@ -14616,6 +14985,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImport`":
@@ -14663,6 +15034,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerImageId`":
@@ -14710,6 +15083,8 @@ class DockerRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `dockerOutputDirectory`":
@@ -14786,15 +15161,16 @@ class DockerRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -14872,6 +15248,8 @@ class SoftwareRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         packages: Any,
@@ -14880,8 +15258,6 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -14923,7 +15299,7 @@ class SoftwareRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -14941,6 +15317,8 @@ class SoftwareRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `packages`":
@@ -15012,15 +15390,16 @@ class SoftwareRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15045,6 +15424,8 @@ class SoftwareRequirement(ProcessRequirement):
 
 
 class SoftwarePackage(Saveable):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         package: Any,
@@ -15055,8 +15436,6 @@ class SoftwarePackage(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15104,6 +15483,8 @@ class SoftwarePackage(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `package`":
@@ -15151,6 +15532,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `version`":
@@ -15198,6 +15581,8 @@ class SoftwarePackage(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `specs`":
@@ -15271,12 +15656,13 @@ class SoftwarePackage(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.package is not None:
             r["package"] = save(
                 self.package, top=False, base_url=base_url, relative_uris=relative_uris
@@ -15308,6 +15694,8 @@ class Dirent(Saveable):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         entry: Any,
@@ -15318,8 +15706,6 @@ class Dirent(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15366,6 +15752,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `entryname`":
@@ -15414,6 +15802,8 @@ class Dirent(Saveable):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `entry`":
@@ -15461,6 +15851,8 @@ class Dirent(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `writable`":
@@ -15534,12 +15926,13 @@ class Dirent(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.entryname is not None:
             r["entryname"] = save(
                 self.entryname,
@@ -15573,6 +15966,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         listing: Any,
@@ -15581,8 +15976,6 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15624,7 +16017,7 @@ class InitialWorkDirRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -15642,6 +16035,8 @@ class InitialWorkDirRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `listing`":
@@ -15713,15 +16108,16 @@ class InitialWorkDirRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15751,6 +16147,8 @@ class EnvVarRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         envDef: Any,
@@ -15759,8 +16157,6 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15802,7 +16198,7 @@ class EnvVarRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -15820,6 +16216,8 @@ class EnvVarRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `envDef`":
@@ -15891,15 +16289,16 @@ class EnvVarRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -15929,6 +16328,8 @@ class ShellCommandRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -15936,8 +16337,6 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -15978,7 +16377,7 @@ class ShellCommandRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16016,15 +16415,16 @@ class ShellCommandRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16064,6 +16464,8 @@ class ResourceRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         coresMin: Any | None = None,
@@ -16079,8 +16481,6 @@ class ResourceRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16151,7 +16551,7 @@ class ResourceRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16168,6 +16568,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMin`":
@@ -16215,6 +16617,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `coresMax`":
@@ -16262,6 +16666,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMin`":
@@ -16309,6 +16715,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `ramMax`":
@@ -16356,6 +16764,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMin`":
@@ -16403,6 +16813,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `tmpdirMax`":
@@ -16450,6 +16862,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMin`":
@@ -16497,6 +16911,8 @@ class ResourceRequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outdirMax`":
@@ -16575,15 +16991,16 @@ class ResourceRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16667,6 +17084,8 @@ class WorkReuse(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         enableReuse: Any,
@@ -16675,8 +17094,6 @@ class WorkReuse(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16720,7 +17137,7 @@ class WorkReuse(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16738,6 +17155,8 @@ class WorkReuse(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `enableReuse`":
@@ -16809,15 +17228,16 @@ class WorkReuse(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -16856,6 +17276,8 @@ class NetworkAccess(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         networkAccess: Any,
@@ -16864,8 +17286,6 @@ class NetworkAccess(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -16910,7 +17330,7 @@ class NetworkAccess(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -16928,6 +17348,8 @@ class NetworkAccess(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `networkAccess`":
@@ -16999,15 +17421,16 @@ class NetworkAccess(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17048,6 +17471,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inplaceUpdate: Any,
@@ -17056,8 +17481,6 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17102,7 +17525,7 @@ class InplaceUpdateRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -17120,6 +17543,8 @@ class InplaceUpdateRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inplaceUpdate`":
@@ -17191,15 +17616,16 @@ class InplaceUpdateRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17232,6 +17658,8 @@ class ToolTimeLimit(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         timelimit: Any,
@@ -17240,8 +17668,6 @@ class ToolTimeLimit(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17285,7 +17711,7 @@ class ToolTimeLimit(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -17303,6 +17729,8 @@ class ToolTimeLimit(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `timelimit`":
@@ -17374,15 +17802,16 @@ class ToolTimeLimit(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -17412,6 +17841,8 @@ class ToolTimeLimit(ProcessRequirement):
 class ExpressionToolOutputParameter(OutputParameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17426,8 +17857,6 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17436,7 +17865,7 @@ class ExpressionToolOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.type_ = type_
 
@@ -17492,6 +17921,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -17548,6 +17979,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -17595,6 +18028,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -17642,6 +18077,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -17689,6 +18126,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -17736,6 +18175,8 @@ class ExpressionToolOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -17784,6 +18225,8 @@ class ExpressionToolOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -17862,12 +18305,13 @@ class ExpressionToolOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -17917,6 +18361,8 @@ class ExpressionToolOutputParameter(OutputParameter):
 class WorkflowInputParameter(InputParameter):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -17935,8 +18381,6 @@ class WorkflowInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -17945,7 +18389,7 @@ class WorkflowInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.loadContents = loadContents
         self.loadListing = loadListing
@@ -18013,6 +18457,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -18069,6 +18515,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18116,6 +18564,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -18163,6 +18613,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -18210,6 +18662,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18257,6 +18711,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -18304,6 +18760,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -18351,6 +18809,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -18398,6 +18858,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -18446,6 +18908,8 @@ class WorkflowInputParameter(InputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -18493,6 +18957,8 @@ class WorkflowInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `inputBinding`":
@@ -18575,12 +19041,13 @@ class WorkflowInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -18672,6 +19139,8 @@ class ExpressionTool(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -18689,13 +19158,11 @@ class ExpressionTool(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -18767,6 +19234,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -18808,7 +19277,7 @@ class ExpressionTool(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -18823,7 +19292,7 @@ class ExpressionTool(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -18840,6 +19309,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -18887,6 +19358,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -18935,6 +19408,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -18983,6 +19458,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -19030,6 +19507,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -19077,6 +19556,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -19124,6 +19605,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -19171,6 +19654,8 @@ class ExpressionTool(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `intent`":
@@ -19219,6 +19704,8 @@ class ExpressionTool(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `expression`":
@@ -19300,18 +19787,19 @@ class ExpressionTool(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -19395,6 +19883,8 @@ class WorkflowOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -19412,8 +19902,6 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -19422,7 +19910,7 @@ class WorkflowOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.outputSource = outputSource
         self.linkMerge = linkMerge
@@ -19487,6 +19975,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -19543,6 +20033,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -19590,6 +20082,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -19637,6 +20131,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -19684,6 +20180,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -19731,6 +20229,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -19778,6 +20278,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `outputSource`":
@@ -19825,6 +20327,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -19872,6 +20376,8 @@ class WorkflowOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `pickValue`":
@@ -19920,6 +20426,8 @@ class WorkflowOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -20001,12 +20509,13 @@ class WorkflowOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -20157,6 +20666,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -20173,13 +20684,11 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.source = source
         self.linkMerge = linkMerge
         self.pickValue = pickValue
@@ -20245,6 +20754,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20301,6 +20812,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `source`":
@@ -20348,6 +20861,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -20395,6 +20910,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `pickValue`":
@@ -20442,6 +20959,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -20489,6 +21008,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -20536,6 +21057,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -20583,6 +21106,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -20630,6 +21155,8 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -20710,12 +21237,13 @@ class WorkflowStepInput(IdentifierRequired, Sink, LoadContents, Labeled):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -20790,6 +21318,8 @@ class WorkflowStepOutput(IdentifierRequired):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -20798,13 +21328,11 @@ class WorkflowStepOutput(IdentifierRequired):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, WorkflowStepOutput):
@@ -20840,6 +21368,8 @@ class WorkflowStepOutput(IdentifierRequired):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -20919,12 +21449,13 @@ class WorkflowStepOutput(IdentifierRequired):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -20987,6 +21518,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -21005,13 +21538,11 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.in_ = in_
@@ -21083,6 +21614,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -21139,6 +21672,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -21186,6 +21721,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -21234,6 +21771,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `in`":
@@ -21282,6 +21821,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `out`":
@@ -21329,6 +21870,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -21376,6 +21919,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -21426,6 +21971,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -21473,6 +22020,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `when`":
@@ -21520,6 +22069,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatter`":
@@ -21567,6 +22118,8 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `scatterMethod`":
@@ -21649,12 +22202,13 @@ class WorkflowStep(IdentifierRequired, Labeled, schema_salad.metaschema.Document
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -21757,6 +22311,8 @@ class Workflow(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -21774,13 +22330,11 @@ class Workflow(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -21852,6 +22406,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -21893,7 +22449,7 @@ class Workflow(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -21908,7 +22464,7 @@ class Workflow(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -21925,6 +22481,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -21972,6 +22530,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -22020,6 +22580,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -22068,6 +22630,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -22115,6 +22679,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -22162,6 +22728,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -22209,6 +22777,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -22256,6 +22826,8 @@ class Workflow(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `intent`":
@@ -22304,6 +22876,8 @@ class Workflow(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `steps`":
@@ -22385,18 +22959,19 @@ class Workflow(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22473,6 +23048,8 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22480,8 +23057,6 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22522,7 +23097,7 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22560,15 +23135,16 @@ class SubworkflowFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22594,6 +23170,8 @@ class ScatterFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22601,8 +23179,6 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22643,7 +23219,7 @@ class ScatterFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22681,15 +23257,16 @@ class ScatterFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22715,6 +23292,8 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22722,8 +23301,6 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22764,7 +23341,7 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22802,15 +23379,16 @@ class MultipleInputFeatureRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22836,6 +23414,8 @@ class StepInputExpressionRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         extension_fields: MutableMapping[str, Any] | None = None,
@@ -22843,8 +23423,6 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22885,7 +23463,7 @@ class StepInputExpressionRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -22923,15 +23501,16 @@ class StepInputExpressionRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -22959,6 +23538,8 @@ class OperationInputParameter(InputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -22976,8 +23557,6 @@ class OperationInputParameter(InputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -22986,7 +23565,7 @@ class OperationInputParameter(InputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.loadContents = loadContents
         self.loadListing = loadListing
@@ -23051,6 +23630,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -23107,6 +23688,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -23154,6 +23737,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -23201,6 +23786,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -23248,6 +23835,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -23295,6 +23884,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -23342,6 +23933,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadContents`":
@@ -23389,6 +23982,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loadListing`":
@@ -23436,6 +24031,8 @@ class OperationInputParameter(InputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -23484,6 +24081,8 @@ class OperationInputParameter(InputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -23565,12 +24164,13 @@ class OperationInputParameter(InputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -23654,6 +24254,8 @@ class OperationOutputParameter(OutputParameter):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         id: Any,
@@ -23668,8 +24270,6 @@ class OperationOutputParameter(OutputParameter):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -23678,7 +24278,7 @@ class OperationOutputParameter(OutputParameter):
         self.secondaryFiles = secondaryFiles
         self.streamable = streamable
         self.doc = doc
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.format = format
         self.type_ = type_
 
@@ -23734,6 +24334,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -23790,6 +24392,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -23837,6 +24441,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `secondaryFiles`":
@@ -23884,6 +24490,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `streamable`":
@@ -23931,6 +24539,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -23978,6 +24588,8 @@ class OperationOutputParameter(OutputParameter):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `format`":
@@ -24026,6 +24638,8 @@ class OperationOutputParameter(OutputParameter):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `type`":
@@ -24104,12 +24718,13 @@ class OperationOutputParameter(OutputParameter):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -24164,6 +24779,8 @@ class Operation(Process):
 
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -24180,13 +24797,11 @@ class Operation(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -24255,6 +24870,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -24296,7 +24913,7 @@ class Operation(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -24311,7 +24928,7 @@ class Operation(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -24328,6 +24945,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -24375,6 +24994,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -24423,6 +25044,8 @@ class Operation(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -24471,6 +25094,8 @@ class Operation(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -24518,6 +25143,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -24565,6 +25192,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -24612,6 +25241,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -24659,6 +25290,8 @@ class Operation(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `intent`":
@@ -24739,18 +25372,19 @@ class Operation(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -24817,6 +25451,8 @@ class Operation(Process):
 
 
 class Secrets(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         secrets: Any,
@@ -24825,8 +25461,6 @@ class Secrets(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -24868,7 +25502,7 @@ class Secrets(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -24886,6 +25520,8 @@ class Secrets(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `secrets`":
@@ -24957,15 +25593,16 @@ class Secrets(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -24991,6 +25628,8 @@ class Secrets(ProcessRequirement):
 class ProcessGenerator(Process):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         inputs: Any,
@@ -25008,13 +25647,11 @@ class ProcessGenerator(Process):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.label = label
         self.doc = doc
         self.inputs = inputs
@@ -25086,6 +25723,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -25127,7 +25766,7 @@ class ProcessGenerator(Process):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         try:
@@ -25142,7 +25781,7 @@ class ProcessGenerator(Process):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -25159,6 +25798,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `label`":
@@ -25206,6 +25847,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `doc`":
@@ -25254,6 +25897,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `inputs`":
@@ -25302,6 +25947,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputs`":
@@ -25349,6 +25996,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `requirements`":
@@ -25396,6 +26045,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `hints`":
@@ -25443,6 +26094,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cwlVersion`":
@@ -25490,6 +26143,8 @@ class ProcessGenerator(Process):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `intent`":
@@ -25540,6 +26195,8 @@ class ProcessGenerator(Process):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `run`":
@@ -25621,18 +26278,19 @@ class ProcessGenerator(Process):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -25708,6 +26366,8 @@ class MPIRequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         processes: Any,
@@ -25716,8 +26376,6 @@ class MPIRequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -25761,7 +26419,7 @@ class MPIRequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -25779,6 +26437,8 @@ class MPIRequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `processes`":
@@ -25850,15 +26510,16 @@ class MPIRequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -25891,6 +26552,8 @@ class CUDARequirement(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         cudaComputeCapability: Any,
@@ -25902,8 +26565,6 @@ class CUDARequirement(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -25962,7 +26623,7 @@ class CUDARequirement(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -25980,6 +26641,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaComputeCapability`":
@@ -26027,6 +26690,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMax`":
@@ -26074,6 +26739,8 @@ class CUDARequirement(ProcessRequirement):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `cudaDeviceCountMin`":
@@ -26122,6 +26789,8 @@ class CUDARequirement(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `cudaVersionMin`":
@@ -26196,15 +26865,16 @@ class CUDARequirement(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -26263,6 +26933,8 @@ class CUDARequirement(ProcessRequirement):
 class LoopInput(Saveable):
     id: str
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         default: Any | None = None,
@@ -26276,14 +26948,12 @@ class LoopInput(Saveable):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
             self.loadingOptions = LoadingOptions()
         self.default = default
-        self.id = id if id is not None else "_:" + str(_uuid__.uuid4())
+        self.id = id if id is not None else _anonymous_id()
         self.linkMerge = linkMerge
         self.loopSource = loopSource
         self.pickValue = pickValue
@@ -26339,6 +27009,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `id`":
@@ -26380,7 +27052,7 @@ class LoopInput(Saveable):
             if docRoot is not None:
                 id = docRoot
             else:
-                id = "_:" + str(_uuid__.uuid4())
+                id = _anonymous_id()
         if not __original_id_is_none:
             baseuri = cast(str, id)
         default = None
@@ -26395,6 +27067,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `default`":
@@ -26442,6 +27116,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `linkMerge`":
@@ -26489,6 +27165,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `loopSource`":
@@ -26536,6 +27214,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `pickValue`":
@@ -26583,6 +27263,8 @@ class LoopInput(Saveable):
                 )
 
             except ValidationException as e:
+                if _speculative():
+                    raise
                 error_message, to_print, verb_tensage = parse_errors(str(e))
 
                 if str(e) == "missing required field `valueFrom`":
@@ -26660,12 +27342,13 @@ class LoopInput(Saveable):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.id is not None:
             u = save_relative_uri(self.id, base_url, True, None, relative_uris)
             r["id"] = u
@@ -26716,6 +27399,8 @@ class Loop(ProcessRequirement):
 
     """
 
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         loop: Any,
@@ -26726,8 +27411,6 @@ class Loop(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -26776,7 +27459,7 @@ class Loop(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -26794,6 +27477,8 @@ class Loop(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `loop`":
@@ -26842,6 +27527,8 @@ class Loop(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `loopWhen`":
@@ -26890,6 +27577,8 @@ class Loop(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `outputMethod`":
@@ -26963,15 +27652,16 @@ class Loop(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -27009,6 +27699,8 @@ class Loop(ProcessRequirement):
 
 
 class ShmSize(ProcessRequirement):
+    extension_fields = _LazyExtensionFields()
+
     def __init__(
         self,
         shmSize: Any,
@@ -27017,8 +27709,6 @@ class ShmSize(ProcessRequirement):
     ) -> None:
         if extension_fields:
             self.extension_fields = extension_fields
-        else:
-            self.extension_fields = CommentedMap()
         if loadingOptions:
             self.loadingOptions = loadingOptions
         else:
@@ -27060,7 +27750,7 @@ class ShmSize(ProcessRequirement):
                 lc=_doc.get("class")
             )
 
-            vocab = _vocab | loadingOptions.vocab
+            vocab = _expand_memo(loadingOptions).vocab
             if class_ not in (cls.__name__, vocab.get(cls.__name__)):
                 raise ValidationException(f"tried `{cls.__name__}` but")
         except ValidationException as e:
@@ -27078,6 +27768,8 @@ class ShmSize(ProcessRequirement):
             )
 
         except ValidationException as e:
+            if _speculative():
+                raise
             error_message, to_print, verb_tensage = parse_errors(str(e))
 
             if str(e) == "missing required field `shmSize`":
@@ -27149,15 +27841,16 @@ class ShmSize(ProcessRequirement):
     ) -> dict[str, Any]:
         r: dict[str, Any] = {}
 
+        extension_fields = _extension_fields(self)
         if relative_uris:
-            for ef in self.extension_fields:
-                r[prefix_url(ef, self.loadingOptions.vocab)] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[prefix_url(ef, self.loadingOptions.vocab)] = extension_fields[ef]
         else:
-            for ef in self.extension_fields:
-                r[ef] = self.extension_fields[ef]
+            for ef in extension_fields:
+                r[ef] = extension_fields[ef]
         if self.class_ is not None:
-            vocab = _vocab | self.loadingOptions.vocab
-            rvocab = _rvocab | self.loadingOptions.rvocab
+            vocab = _expand_memo(self.loadingOptions).vocab
+            rvocab = _expand_memo(self.loadingOptions).rvocab
             uri = vocab[self.class_]
             if p := rvocab.get(uri[: -len(self.class_)]):
                 uri = f"{p}:{self.class_}"
@@ -0,0 +1,229 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Structural content hashes of loaded CWL objects.
+
+The hash of an object is computed from its fields directly, without saving
+it, and is the same for every loading of the same content:
+
+* identifiers and references within the document an object was loaded from
+  are hashed relative to that document, so the same tool in two files has
+  the same hash (references to other documents are hashed as they are);
+* the names of blank node identifiers (``_:...``), random or not, are
+  ignored, and so is the identifier of an object when it is a blank node;
+* the order of mapping keys, of lists of identified objects (such as
+  ``inputs``, ``outputs``, ``steps`` and record ``fields``) and of
+  requirements and hints of distinct classes does not matter, as they can be
+  written as mappings;
+* the order of every other list does: ``arguments``, plain data such as
+  ``default`` values, and requirements or hints where a class appears more
+  than once (the last one wins);
+* source line data, loading options and unset (``None``) fields are ignored.
+
+A :py:class:`ContentHasher` remembers the digest of every object it hashed,
+so hashing a workflow again after one of its tools changed only hashes
+that tool and the objects holding it.
+"""
+
+import functools
+import hashlib
+import re
+from collections.abc import Iterable, Mapping, MutableSequence
+from typing import Any, Final
+
+from schema_salad.runtime import Saveable
+
+from cwl_utils.parser.index import _identifier
+
+_FIELDS_NOT_HASHED: Final = frozenset({"loadingOptions", "extension_fields"})
+_BLANK_NODE: Final = re.compile(r"_:[\w.-]+")
+
+
+_BY_CLASS: Final = frozenset({"requirements", "hints"})
+
+
+def _identified(item: Any) -> bool:
+    """Tell if a list item is an object that can be written as a mapping entry."""
+    return isinstance(item, Saveable) and _identifier(item) is not None
+
+
+def _class_of(item: Any) -> Any:
+    if isinstance(item, Saveable):
+        return getattr(item, "class_", None)
+    if isinstance(item, Mapping):
+        return item.get("class")
+    return None
+
+
+def _distinct_classes(value: Any) -> bool:
+    """Tell if requirements or hints can be written as a mapping by class."""
+    if not isinstance(value, MutableSequence) or not value:
+        return False
+    classes = [_class_of(item) for item in value]
+    if not all(isinstance(class_, str) for class_ in classes):
+        return False
+    return len(set(classes)) == len(classes)
+
+
+class ContentHasher:
+    """
+    Hash loaded CWL objects, remembering the digest of every object hashed.
+
+    The digests are kept until :py:meth:`forget` is told that an object
+    changed, so the objects should not be changed otherwise while the hasher
+    is in use.
+    """
+
+    def __init__(self) -> None:
+        """Create a hasher that has not hashed anything yet."""
+        self._digests: dict[int, tuple[Saveable, bytes]] = {}
+        self._holders: dict[int, set[int]] = {}
+
+    def digest(self, obj: Any) -> bytes:
+        """
+        Get the SHA-256 digest of a loaded object, or of a list of them.
+
+        :param obj: A loaded object (such as a ``Process``), a list of them,
+            as returned by :py:func:`cwl_utils.parser.load_document_by_uri`,
+            or any value that can be found in their fields.
+        """
+        if isinstance(obj, Saveable):
+            return self._digest(obj)
+        parts: list[bytes] = []
+        self._encode(parts, obj, None, None)
+        return hashlib.sha256(b"".join(parts)).digest()
+
+    def hexdigest(self, obj: Any) -> str:
+        """Get the digest of :py:meth:`digest` as a hexadecimal string."""
+        return self.digest(obj).hex()
+
+    def forget(self, obj: Saveable) -> None:
+        """
+        Forget the digest of an object that changed.
+
+        The objects holding it (those that were hashed with it in their
+        fields) are forgotten too.
+        """
+        stack = [id(obj)]
+        while stack:
+            key = stack.pop()
+            if self._digests.pop(key, None) is not None:
+                stack.extend(self._holders.pop(key, ()))
+
+    def clear(self) -> None:
+        """Forget every digest."""
+        self._digests.clear()
+        self._holders.clear()
+
+    def _digest(self, obj: Saveable) -> bytes:
+        if (known := self._digests.get(id(obj))) is not None:
+            return known[1]
+        loadingOptions = getattr(obj, "loadingOptions", None)
+        document = getattr(loadingOptions, "fileuri", None)
+        parts = [b"o", type(obj).__name__.encode("utf-8")]
+        fields = vars(obj)
+        for name in sorted(fields):
+            value = fields[name]
+            if value is None or name in _FIELDS_NOT_HASHED:
+                continue
+            if name == "id" and isinstance(value, str) and value.startswith("_:"):
+                continue
+            parts.append(_field_name(name))
+            if name in _BY_CLASS and _distinct_classes(value):
+                self._encode_unordered(parts, value, document, obj)
+            else:
+                self._encode(parts, value, document, obj)
+        if extension_fields := fields.get("extension_fields"):
+            parts.append(b"x")
+            self._encode(parts, extension_fields, document, obj)
+        digest = hashlib.sha256(b"".join(parts)).digest()
+        self._digests[id(obj)] = (obj, digest)
+        return digest
+
+    def _encode(
+        self,
+        parts: list[bytes],
+        value: Any,
+        document: str | None,
+        holder: Saveable | None,
+    ) -> None:
+        """Add a field value to ``parts``, with the identifiers of ``document``."""
+        if isinstance(value, str):
+            _encode_str(parts, value, document)
+        elif isinstance(value, Mapping):
+            parts.append(b"m%d;" % len(value))
+            for key in sorted(value, key=str):
+                _encode_str(parts, str(key), document)
+                self._encode(parts, value[key], document, holder)
+        elif isinstance(value, MutableSequence):
+            if value and all(_identified(item) for item in value):
+                self._encode_unordered(parts, value, document, holder)
+            else:
+                parts.append(b"l%d;" % len(value))
+                for item in value:
+                    self._encode(parts, item, document, holder)
+        elif value is None:
+            parts.append(b"n")
+        elif isinstance(value, bool):
+            parts.append(b"t" if value else b"f")
+        elif isinstance(value, int):
+            parts.append(b"i%d;" % value)
+        elif isinstance(value, float):
+            parts.append(b"d%r;" % value)
+        elif isinstance(value, Saveable):
+            parts.append(b"o")
+            parts.append(self._digest(value))
+            if holder is not None:
+                self._holders.setdefault(id(value), set()).add(id(holder))
+        else:
+            raise TypeError(f"Can not hash a value of type {type(value).__name__}")
+
+    def _encode_unordered(
+        self,
+        parts: list[bytes],
+        items: Iterable[Any],
+        document: str | None,
+        holder: Saveable | None,
+    ) -> None:
+        digests = []
+        for item in items:
+            if isinstance(item, Saveable):
+                digests.append(self._digest(item))
+                if holder is not None:
+                    self._holders.setdefault(id(item), set()).add(id(holder))
+            else:
+                item_parts: list[bytes] = []
+                self._encode(item_parts, item, document, holder)
+                digests.append(hashlib.sha256(b"".join(item_parts)).digest())
+        digests.sort()
+        parts.append(b"u%d;" % len(digests))
+        parts.extend(digests)
+
+
+@functools.lru_cache(maxsize=1024)
+def _field_name(name: str) -> bytes:
+    data = name.encode("utf-8")
+    return b"s%d:%s" % (len(data), data)
+
+
+def _encode_str(parts: list[bytes], value: str, document: str | None) -> None:
+    if document is not None and value.startswith(document):
+        rest = value[len(document) :]
+        if not rest or rest[0] == "#":
+            value = rest
+    if "_:" in value:
+        value = _BLANK_NODE.sub("_:", value)
+    data = value.encode("utf-8")
+    parts.append(b"s%d:%s" % (len(data), data))
+
+
+def content_hash(obj: Any) -> str:
+    """
+    Get a hexadecimal SHA-256 hash of the content of a loaded CWL object.
+
+    See :py:mod:`cwl_utils.parser.hashing` for what the hash does and does
+    not depend on. To hash many objects that share parts, or to hash objects
+    again after changing some of their parts, use a :py:class:`ContentHasher`.
+
+    :param obj: A loaded object (such as a ``Process``) or a list of them.
+    """
+    return ContentHasher().hexdigest(obj)
@@ -0,0 +1,156 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Index of the identified objects of loaded CWL documents.
+
+Processes, their input and output parameters, workflow steps with their
+inputs and outputs, record fields and named schemas all carry a full
+identifier (``id`` or ``name``) once loaded. An :py:class:`IdIndex` maps
+those identifiers to the objects, and also indexes them by fragment (the
+part after ``#``, such as ``step1/out``) and by short name (the last
+segment, such as ``out``), the two forms that CWL ``source`` and
+``outputSource`` references use. It also records which object holds each
+indexed one, so that a lookup can be narrowed to the inputs of a process or
+the steps of a workflow without scanning them. Step outputs written as plain identifiers
+rather than ``WorkflowStepOutput`` objects are not indexed.
+"""
+
+from collections.abc import Iterator, MutableMapping, MutableSequence
+from typing import Any
+
+from schema_salad.runtime import Saveable, shortname
+
+from cwl_utils.parser.lazy import LazyProcess
+
+
+def _identifier(obj: Saveable) -> str | None:
+    attrs = getattr(type(obj), "attrs", ())
+    for key in ("id", "name"):
+        if key in attrs:
+            value = getattr(obj, key, None)
+            # blank node identifiers of anonymous schemas can not be referenced
+            if isinstance(value, str) and value and not value.startswith("_:"):
+                return value
+    return None
+
+
+class IdIndex:
+    """
+    Look up the objects of loaded CWL documents by identifier.
+
+    The index is a snapshot: objects added to, removed from or renamed in the
+    documents after :py:meth:`add` are not reflected until they are added
+    again (or a new index is built).
+    """
+
+    def __init__(self, *objs: Any) -> None:
+        """Create an index of the given loaded objects (see :py:meth:`add`)."""
+        self._ids: dict[str, Any] = {}
+        self._fragments: dict[str, list[Any]] = {}
+        self._shortnames: dict[str, list[Any]] = {}
+        self._holders: dict[int, tuple[Any, str]] = {}
+        for obj in objs:
+            self.add(obj)
+
+    def add(self, obj: Any) -> None:
+        """
+        Index a loaded object and every identified object reachable from it.
+
+        ``obj`` can be a single object or a list of them, as returned by
+        :py:func:`cwl_utils.parser.load_document_by_uri`. The processes of
+        workflow steps are indexed too, unless their ``run`` is a reference
+        that has not been loaded yet.
+        """
+        seen: set[int] = set()
+        stack: list[tuple[Any, tuple[Any, str] | None]] = [(obj, None)]
+        while stack:
+            node, holder = stack.pop()
+            if isinstance(node, LazyProcess):
+                if node.loaded:
+                    stack.append((node.resolve(), holder))
+            elif isinstance(node, Saveable):
+                if id(node) in seen:
+                    continue
+                seen.add(id(node))
+                if (identifier := _identifier(node)) is not None:
+                    self._insert(identifier, node, holder)
+                stack.extend(
+                    (value, (node, key))
+                    for key, value in vars(node).items()
+                    if key not in ("loadingOptions", "extension_fields")
+                )
+            elif isinstance(node, MutableSequence):
+                stack.extend((item, holder) for item in node)
+            elif isinstance(node, MutableMapping):
+                stack.extend((value, holder) for value in node.values())
+
+    def _insert(
+        self, identifier: str, obj: Any, holder: tuple[Any, str] | None
+    ) -> None:
+        previous = self._ids.get(identifier)
+        if previous is obj:
+            return
+        if previous is not None:
+            self._fragments[identifier.split("#")[-1]].remove(previous)
+            self._shortnames[shortname(identifier)].remove(previous)
+            self._holders.pop(id(previous), None)
+        self._ids[identifier] = obj
+        if holder is not None:
+            self._holders[id(obj)] = holder
+        self._fragments.setdefault(identifier.split("#")[-1], []).append(obj)
+        self._shortnames.setdefault(shortname(identifier), []).append(obj)
+
+    def __getitem__(self, identifier: str) -> Any:
+        """Get the object with this full identifier."""
+        return self._ids[identifier]
+
+    def get(self, identifier: str, default: Any = None) -> Any:
+        """Get the object with this full identifier, or ``default``."""
+        return self._ids.get(identifier, default)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def by_fragment(self, reference: str) -> list[Any]:
+        """
+        Get the objects whose identifier has the same fragment as ``reference``.
+
+        :param reference: A full identifier, or just its fragment with or
+            without the leading ``#`` (``step1/out`` or ``#step1/out``).
+        """
+        return list(self._fragments.get(reference.split("#")[-1], ()))
+
+    def held_by(self, holder: Any, field: str, reference: str) -> list[Any]:
+        """
+        Get the objects in the ``field`` of ``holder`` with this fragment.
+
+        This is :py:meth:`by_fragment` narrowed to, for example, the
+        ``inputs`` of a process or the ``steps`` of a workflow, in the order
+        they were indexed.
+
+        :param holder: An object of the indexed documents.
+        :param field: The attribute of ``holder`` that lists the objects.
+        :param reference: A full identifier or a fragment, as for
+            :py:meth:`by_fragment`.
+        """
+        found = []
+        for obj in self._fragments.get(reference.split("#")[-1], ()):
+            entry = self._holders.get(id(obj))
+            if entry is not None and entry[0] is holder and entry[1] == field:
+                found.append(obj)
+        return found
+
+    def by_shortname(self, name: str) -> list[Any]:
+        """
+        Get the objects whose identifier ends with this short name.
+
+        :param name: The last segment of an identifier (``out`` for
+            ``file:///wf.cwl#step1/out``), or a full identifier or fragment
+            to take it from.
+        """
+        return list(self._shortnames.get(shortname(name), ()))
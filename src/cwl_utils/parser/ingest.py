@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Turn the text of a CWL document into YAML/JSON objects for the parsers."""
+
+import json
+from typing import Any
+
+from ruamel.yaml.constructor import SafeConstructor
+from ruamel.yaml.main import YAML
+from schema_salad.utils import yaml_no_ts
+
+
+class _SafeNoTimeStampConstructor(SafeConstructor):
+    def construct_yaml_timestamp(self, node: Any, values: Any = None) -> Any:
+        return node.value
+
+
+_SafeNoTimeStampConstructor.add_constructor(
+    "tag:yaml.org,2002:timestamp",
+    _SafeNoTimeStampConstructor.construct_yaml_timestamp,
+)
+
+
+def yaml_safe_no_ts() -> YAML:
+    """
+    Get a plain (non round-trip) YAML loader that leaves timestamps as strings.
+
+    It produces ordinary dicts and lists and uses the C parser when
+    ``ruamel.yaml.clib`` is installed.
+    """
+    yaml = YAML(typ="safe")
+    yaml.Constructor = _SafeNoTimeStampConstructor
+    return yaml
+
+
+def parse_document(text: str, track_source_lines: bool = True) -> Any:
+    """
+    Parse the text of a CWL document.
+
+    :param track_source_lines: When ``False``, skip the ruamel round-trip
+        loader: JSON input is read with :py:func:`json.loads` and YAML input
+        with :py:func:`yaml_safe_no_ts`. The result is made of plain dicts
+        and lists, so validation errors will lack line and column numbers.
+    """
+    if track_source_lines:
+        return yaml_no_ts().load(text)
+    if text.lstrip()[:1] in ("{", "["):
+        try:
+            return json.loads(text)
+        except ValueError:
+            pass
+    return yaml_safe_no_ts().load(text)
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Lazily loaded ``WorkflowStep.run`` references."""
+
+from collections.abc import Collection, MutableSequence
+from typing import Any, cast
+
+from schema_salad.runtime import LoadingOptions
+
+
+class LazyProcess(str):
+    """
+    A ``run`` reference that loads the referenced process on first use.
+
+    The object is still the (absolute) URI string, so code that checks
+    ``isinstance(step.run, str)`` and :py:func:`cwl_utils.parser.save` keep
+    treating it as a reference. Accessing any process attribute (``inputs``,
+    ``requirements``, ``steps``, ...) loads and validates the document, so
+    loading errors are raised at that point.
+    """
+
+    _loadingOptions: LoadingOptions
+    _process: Any
+    _fields: Collection[str] | None
+
+    def __new__(
+        cls,
+        uri: str,
+        loadingOptions: LoadingOptions,
+        fields: Collection[str] | None = None,
+    ) -> "LazyProcess":
+        """
+        Create a reference to ``uri``, to be loaded with ``loadingOptions``.
+
+        :param fields: Only load these fields, see
+            :py:func:`cwl_utils.parser.load_document_by_uri`.
+        """
+        obj = super().__new__(cls, uri)
+        obj._loadingOptions = loadingOptions
+        obj._process = None
+        obj._fields = fields
+        return obj
+
+    @property
+    def loaded(self) -> bool:
+        """Report whether the referenced process has been loaded yet."""
+        return self._process is not None
+
+    def resolve(self) -> Any:
+        """Load (once) and return the referenced process."""
+        if self._process is None:
+            from cwl_utils.parser import is_process, load_document_by_uri
+
+            uri = str(self)
+            indexed = self._loadingOptions.idx.get(uri)
+            if indexed is not None and is_process(indexed[0]):
+                self._process = indexed[0]
+            else:
+                self._process = load_document_by_uri(
+                    uri,
+                    loadingOptions=self._loadingOptions,
+                    lazy=True,
+                    fields=self._fields,
+                )
+        return self._process
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name in ("_loadingOptions", "_process", "_fields"):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (LazyProcess, (str(self), self._loadingOptions, self._fields))
+
+
+def make_runs_lazy(result: Any, fields: Collection[str] | None = None) -> Any:
+    """
+    Replace the string ``run`` references of every (nested) workflow step.
+
+    :param fields: Passed on to the :py:class:`LazyProcess` proxies.
+    """
+    from cwl_utils.parser import WorkflowTypes
+
+    if isinstance(result, MutableSequence):
+        for item in result:
+            make_runs_lazy(item, fields)
+    elif isinstance(result, WorkflowTypes):
+        for step in result.steps:
+            if isinstance(step.run, LazyProcess):
+                continue
+            if isinstance(step.run, str):
+                step.run = LazyProcess(
+                    step.loadingOptions.fetcher.urljoin(
+                        cast(str, step.loadingOptions.fileuri), step.run
+                    ),
+                    step.loadingOptions,
+                    fields,
+                )
+            else:
+                make_runs_lazy(step.run, fields)
+    return result
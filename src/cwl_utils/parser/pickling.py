@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Compact pickling of loaded CWL objects.
+
+Every loaded object refers to the :py:class:`LoadingOptions` of its document,
+and through them to the fetcher (with its HTTP session and cache of document
+texts), the index of every object loaded with those options, the original
+YAML and the loader tables. Pickled as they are, a single tool of a
+:py:class:`~cwl_utils.parser.Workspace` drags the whole workspace along.
+
+The protocol implemented here pickles instead:
+
+* of each :py:class:`LoadingOptions`, only the per-document settings:
+  ``fileuri``, ``baseuri``, ``namespaces``, ``schemas``, ``addl_metadata``,
+  ``no_link_check`` and ``container``. On the receiving side they are
+  reattached to the ``loadingOptions`` given to :py:func:`loads`, or else to
+  new options shared by everything unpickled in that call, so the received
+  objects share a fetcher and an (initially empty) index. Objects unpickled
+  outside :py:func:`loads`, such as the results sent back by
+  :py:mod:`multiprocessing` workers, share one set of options per process
+  until :py:func:`reset` is called;
+* the ruamel.yaml mappings and sequences found in the objects (``default``
+  values, hints of unknown classes, extension fields) as plain dicts and
+  lists, without their source line data.
+
+All the objects of one document share their options, which are thus
+pickled once. Use :py:func:`dumps` and :py:func:`loads` (or
+:py:class:`Pickler`) directly, or call :py:func:`register` to use the
+protocol for everything sent between processes by :py:mod:`multiprocessing`
+and :py:mod:`concurrent.futures`.
+"""
+
+import copyreg
+import io
+import pickle  # nosec
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from multiprocessing.reduction import ForkingPickler
+from typing import Any, Final
+
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from schema_salad.runtime import LoadingOptions
+
+KEPT_OPTIONS: Final = (
+    "fileuri",
+    "baseuri",
+    "namespaces",
+    "schemas",
+    "addl_metadata",
+    "no_link_check",
+    "container",
+)
+"""The :py:class:`LoadingOptions` attributes that are pickled."""
+
+_receiving: ContextVar[LoadingOptions | None] = ContextVar("_receiving", default=None)
+_shared: LoadingOptions | None = None
+
+
+def _restore_loading_options(state: Mapping[str, Any]) -> LoadingOptions:
+    global _shared
+    base = _receiving.get()
+    if base is None:
+        if _shared is None:
+            _shared = LoadingOptions()
+        base = _shared
+    return LoadingOptions(copyfrom=base, **state)
+
+
+def _reduce_loading_options(
+    loadingOptions: LoadingOptions,
+) -> tuple[Callable[..., LoadingOptions], tuple[dict[str, Any]]]:
+    return _restore_loading_options, (
+        {name: getattr(loadingOptions, name) for name in KEPT_OPTIONS},
+    )
+
+
+def _reduce_map(value: CommentedMap) -> tuple[type[dict[Any, Any]], tuple[Any]]:
+    return dict, (list(value.items()),)
+
+
+def _reduce_seq(value: CommentedSeq) -> tuple[type[list[Any]], tuple[Any]]:
+    return list, (list(value),)
+
+
+_REDUCERS: Final[dict[type, Callable[[Any], Any]]] = {
+    LoadingOptions: _reduce_loading_options,
+    CommentedMap: _reduce_map,
+    CommentedSeq: _reduce_seq,
+}
+
+
+class Pickler(pickle.Pickler):
+    """A pickler that writes loaded CWL objects with the compact protocol."""
+
+    dispatch_table = {**copyreg.dispatch_table, **_REDUCERS}
+
+
+def dumps(obj: Any, protocol: int | None = pickle.HIGHEST_PROTOCOL) -> bytes:
+    """Pickle ``obj`` with the compact protocol."""
+    buffer = io.BytesIO()
+    Pickler(buffer, protocol).dump(obj)
+    return buffer.getvalue()
+
+
+def loads(data: bytes, loadingOptions: LoadingOptions | None = None) -> Any:
+    """
+    Unpickle objects pickled with :py:func:`dumps`.
+
+    :param loadingOptions: Options to reattach the unpickled objects to: they
+        get their fetcher and index, with the pickled per-document settings.
+        By default, new options are made for the objects of this call.
+    """
+    token = _receiving.set(
+        LoadingOptions() if loadingOptions is None else loadingOptions
+    )
+    try:
+        return pickle.loads(data)  # nosec
+    finally:
+        _receiving.reset(token)
+
+
+def register() -> None:
+    """
+    Use the compact protocol for what :py:mod:`multiprocessing` sends.
+
+    This must be called in each process that sends loaded objects, for
+    example in the ``initializer`` of the workers that return them.
+    Unpickling needs nothing; the received objects share the options of
+    their process (see :py:func:`reset`).
+    """
+    for type_, reducer in _REDUCERS.items():
+        ForkingPickler.register(type_, reducer)
+
+
+def reset() -> None:
+    """
+    Forget the options shared by the objects unpickled outside :py:func:`loads`.
+
+    Their index keeps every document loaded through the received objects, and
+    their fetcher the text of every document read, for as long as any of the
+    objects unpickled before is alive or this is not called. The objects
+    unpickled afterwards get new options.
+    """
+    global _shared
+    _shared = None
@@ -0,0 +1,274 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Concurrent discovery and loading of the documents referenced by a CWL document."""
+
+import contextvars
+import os
+import threading
+import weakref
+from collections.abc import (
+    Callable,
+    Collection,
+    Iterator,
+    MutableMapping,
+    MutableSequence,
+)
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Final
+from urllib.parse import urldefrag, urlparse
+from urllib.request import url2pathname
+
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.loghandler import _logger
+from cwl_utils.parser.ingest import parse_document
+
+# the fingerprints of the run documents loaded ahead, by URI, under the
+# loading options of the processes loaded from them
+_prefetched: Final[weakref.WeakKeyDictionary[LoadingOptions, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+_prefetched_lock: Final = threading.Lock()
+
+
+def iter_references(node: Any) -> Iterator[tuple[str, str]]:
+    """
+    Yield the external references found in a parsed CWL document.
+
+    Each item is a ``(kind, reference)`` pair where ``kind`` is one of
+    ``run``, ``$import`` or ``$include`` and ``reference`` is the unresolved
+    string as written in the document.
+    """
+    if isinstance(node, MutableMapping):
+        for key, value in node.items():
+            if key in ("$import", "$include") and isinstance(value, str):
+                yield key, value
+            elif key == "run" and isinstance(value, str):
+                yield key, value
+            else:
+                yield from iter_references(value)
+    elif isinstance(node, MutableSequence):
+        for item in node:
+            yield from iter_references(item)
+
+
+def _fetch(
+    doc_url: str, kind: str, loadingOptions: LoadingOptions, track_source_lines: bool
+) -> Any:
+    """Read (and parse, unless it is an ``$include``) one referenced document."""
+    text = loadingOptions.fetcher.fetch_text(doc_url)
+    return _remember(doc_url, text, kind, loadingOptions, track_source_lines)
+
+
+def _remember(
+    doc_url: str,
+    text: str,
+    kind: str,
+    loadingOptions: LoadingOptions,
+    track_source_lines: bool,
+) -> Any:
+    cache = getattr(loadingOptions.fetcher, "cache", None)
+    if cache is not None:
+        cache[doc_url] = text
+    if kind == "$include":
+        return None
+    return parse_document(text, track_source_lines)
+
+
+def _run_fingerprint(uri: str) -> tuple[Any, ...] | None:
+    """
+    Identify the current version of the document behind a ``run`` URI.
+
+    Documents that are not files get an empty fingerprint: fetching them
+    again to find out whether they changed would cost as much as loading
+    them again.
+    """
+    parsed = urlparse(urldefrag(uri)[0])
+    if parsed.scheme != "file":
+        return ()
+    try:
+        stat = os.stat(url2pathname(parsed.path))
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_run(
+    url: str,
+    loadingOptions: LoadingOptions,
+    track_source_lines: bool,
+    fields: Collection[str] | None,
+) -> None:
+    """Load the process behind a ``run`` reference into the shared index."""
+    from cwl_utils.parser import is_process, load_document_by_uri
+
+    if url in loadingOptions.idx:
+        return None
+    fingerprint = _run_fingerprint(url)
+    process = load_document_by_uri(
+        url,
+        loadingOptions=loadingOptions,
+        track_source_lines=track_source_lines,
+        fields=fields,
+    )
+    if is_process(process):
+        loadingOptions.idx[url] = (process, process.loadingOptions)
+        if fingerprint is not None:
+            mark_prefetched(url, process, fingerprint)
+    return None
+
+
+def mark_prefetched(url: str, process: Any, fingerprint: tuple[Any, ...]) -> None:
+    """
+    Let :py:func:`take_prefetched` hand over a process loaded ahead.
+
+    :param url: The URI of the process, under which it is in the loading
+        index of its ``loadingOptions``.
+    :param fingerprint: The fingerprint of its document, taken before it was
+        read (as :py:func:`cwl_utils.parser.utils.load_step` takes them).
+    """
+    with _prefetched_lock:
+        _prefetched.setdefault(process.loadingOptions, {})[url] = fingerprint
+
+
+def take_prefetched(
+    url: str, loadingOptions: LoadingOptions, fingerprint: tuple[Any, ...]
+) -> Any:
+    """
+    Hand over the process loaded ahead for a ``run`` reference, once.
+
+    :param fingerprint: The current fingerprint of the document behind
+        ``url``; the process is only handed over if it was loaded from the
+        same version of the document (otherwise the text fetched ahead is
+        dropped from the fetcher's cache, so that it is read again).
+    :returns: The process, or ``None``.
+    """
+    entry = loadingOptions.idx.get(url)
+    if entry is None:
+        return None
+    processOptions = getattr(entry[0], "loadingOptions", None)
+    if processOptions is None:
+        return None
+    with _prefetched_lock:
+        marks = _prefetched.get(processOptions)
+        if marks is None or (loaded := marks.pop(url, None)) is None:
+            return None
+    if loaded != fingerprint:
+        cache = getattr(loadingOptions.fetcher, "cache", None)
+        if cache is not None:
+            cache.pop(urldefrag(url)[0], None)
+        return None
+    return entry[0]
+
+
+def forget_prefetched(loadingOptions: LoadingOptions | None = None) -> None:
+    """
+    Stop handing over the processes loaded ahead.
+
+    :param loadingOptions: If given, only those of the document(s) sharing
+        this ``LoadingOptions`` index are forgotten.
+    """
+    with _prefetched_lock:
+        if loadingOptions is None:
+            _prefetched.clear()
+            return
+        for options in [o for o in _prefetched if o.idx is loadingOptions.idx]:
+            del _prefetched[options]
+
+
+def _submit(
+    pool: ThreadPoolExecutor, fn: Callable[..., Any], *args: Any
+) -> Future[Any]:
+    """
+    Run ``fn(*args)`` in ``pool`` with a copy of the current context.
+
+    The worker threads would otherwise not see the context variables of the
+    caller, such as the strategy of :py:func:`cwl_utils.parser.anonymous_ids`.
+    """
+    return pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def prefetch_references(
+    uri: str,
+    text: str,
+    loadingOptions: LoadingOptions,
+    workers: int,
+    track_source_lines: bool = True,
+    fields: Collection[str] | None = None,
+) -> Any:
+    """
+    Fetch, parse and load everything reachable from a document in parallel.
+
+    Starting from the ``text`` of the document located at ``uri``, every
+    ``run``, ``$import`` and ``$include`` reference is discovered transitively
+    and fetched by a pool of ``workers`` threads. Fetched texts are stored in
+    the fetcher's memory cache and the processes named by ``run`` references
+    are loaded and stored in ``loadingOptions.idx``, where the generated
+    ``$import`` handling finds them; :py:func:`take_prefetched` hands them
+    over to ``load_step(step, cache=True)`` (see
+    :py:func:`cwl_utils.parser.utils.load_step`). Failures are only logged
+    here; they are reported again when the reference is actually used.
+
+    :param track_source_lines: See
+        :py:func:`cwl_utils.parser.load_document_by_uri`.
+    :param fields: See :py:func:`cwl_utils.parser.load_document_by_uri`.
+
+    :returns: The parsed YAML of the starting document.
+    """
+    root_url = urldefrag(uri)[0]
+    yaml = _remember(root_url, text, "run", loadingOptions, track_source_lines)
+    fetched: set[str] = {root_url}
+    requested: set[str] = {root_url}
+    seen_runs: set[str] = set()
+    waiting: dict[str, list[str]] = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: dict[Future[Any], tuple[str, str]] = {}
+
+        def load(url: str) -> None:
+            pending[
+                _submit(
+                    pool, _load_run, url, loadingOptions, track_source_lines, fields
+                )
+            ] = ("load", url)
+
+        def schedule(base: str, node: Any) -> None:
+            for kind, ref in iter_references(node):
+                url = loadingOptions.fetcher.urljoin(base, ref)
+                doc_url = urldefrag(url)[0]
+                if kind == "run" and url not in seen_runs:
+                    seen_runs.add(url)
+                    if doc_url in fetched:
+                        load(url)
+                    else:
+                        waiting.setdefault(doc_url, []).append(url)
+                if doc_url not in requested:
+                    requested.add(doc_url)
+                    pending[
+                        _submit(
+                            pool,
+                            _fetch,
+                            doc_url,
+                            kind,
+                            loadingOptions,
+                            track_source_lines,
+                        )
+                    ] = (kind, doc_url)
+
+        schedule(root_url, yaml)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                kind, url = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    _logger.debug("Unable to prefetch %s: %s", url, e)
+                    continue
+                if kind == "load":
+                    continue
+                fetched.add(url)
+                for run_url in waiting.pop(url, []):
+                    load(run_url)
+                if result is not None:
+                    schedule(url, result)
+    return yaml
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Strip parsed CWL documents down to the fields a caller needs."""
+
+import copy
+from collections.abc import Collection, MutableMapping, MutableSequence
+from typing import Any, Final
+
+KEPT_FIELDS: Final = frozenset({"class", "id", "cwlVersion", "run"})
+"""Fields of processes and steps that are always kept."""
+
+_PLACEHOLDERS: Final[dict[str, Any]] = {
+    "inputs": [],
+    "outputs": [],
+    "steps": [],
+    "in": [],
+    "out": [],
+    "expression": "",
+}
+"""Stand-ins for the required fields that are dropped."""
+
+_PROCESS_CLASSES: Final = frozenset(
+    {"CommandLineTool", "ExpressionTool", "Workflow", "Operation", "ProcessGenerator"}
+)
+
+
+def _prune(node: MutableMapping[str, Any], fields: Collection[str]) -> None:
+    for key in list(node):
+        if key in fields or key in KEPT_FIELDS or key.startswith("$"):
+            continue
+        del node[key]
+        if key in _PLACEHOLDERS:
+            node[key] = copy.copy(_PLACEHOLDERS[key])
+
+
+def project(doc: Any, fields: Collection[str]) -> Any:
+    """
+    Drop the fields of the processes and workflow steps of a parsed document.
+
+    Every process (including those in a ``$graph`` and those inline in
+    workflow steps) and every workflow step keeps only the given ``fields``,
+    the fields listed in :py:data:`KEPT_FIELDS` and the ``$`` directives.
+    Required fields that are dropped (``inputs``, ``outputs``, ``steps``,
+    ``in``, ``out`` and ``expression``) are replaced by empty values, so
+    the result still loads. Requirements, hints and other nested objects are
+    kept or dropped as a whole.
+
+    The document is changed in place.
+
+    :returns: ``doc``
+    """
+    if isinstance(doc, MutableSequence):
+        for item in doc:
+            project(item, fields)
+    elif isinstance(doc, MutableMapping):
+        if "$graph" in doc:
+            project(doc["$graph"], fields)
+        elif str(doc.get("class", "")).rpartition(":")[2] in _PROCESS_CLASSES:
+            _prune(doc, fields)
+            steps = doc.get("steps")
+            if isinstance(steps, MutableMapping):
+                steps = list(steps.values())
+            for step in steps if isinstance(steps, MutableSequence) else ():
+                if isinstance(step, MutableMapping):
+                    _prune(step, fields)
+                    project(step.get("run"), fields)
+    return doc
@@ -0,0 +1,255 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Write loaded CWL objects as JSON or YAML without building their saved form.
+
+:py:func:`cwl_utils.parser.save` returns the complete nested dicts of a
+document, which for a large packed workflow take as much memory again as
+the loaded objects, before anything can be written. :py:func:`dump_json` and
+:py:func:`dump_yaml` instead write the objects one at a time: each object is
+saved by its own generated ``save()`` with its nested objects (and lists of
+objects) held back, and those are then written, in turn, in their place.
+The ``save()`` of every object is still the one that decides which fields
+to write and how its URIs are made relative, so the output is the same as
+the saved form.
+"""
+
+import copy
+import json
+import re
+from collections.abc import Iterator, Mapping, MutableSequence
+from typing import IO, Any, Final, cast
+
+from schema_salad.runtime import Saveable
+
+_FIELDS_NOT_SAVED: Final = frozenset({"loadingOptions", "extension_fields"})
+_SCALARS: Final = frozenset({str, int, float, bool})
+
+
+@Saveable.register
+class _Deferred:
+    """
+    Stands in for a field value while the object holding it is saved.
+
+    It is registered as a :py:class:`Saveable`, without being a loadable
+    one, so that the generated ``save()`` methods call its :py:meth:`save`.
+    """
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def save(
+        self, top: bool = False, base_url: str = "", relative_uris: bool = True
+    ) -> Any:
+        return _Pending(self.value, top, base_url, relative_uris)
+
+
+class _Pending:
+    """A field value held back, with the arguments it was to be saved with."""
+
+    __slots__ = ("value", "top", "base_url", "relative_uris")
+
+    def __init__(
+        self, value: Any, top: bool, base_url: str, relative_uris: bool
+    ) -> None:
+        self.value = value
+        self.top = top
+        self.base_url = base_url
+        self.relative_uris = relative_uris
+
+    def resolve(self) -> Any:
+        if isinstance(self.value, Saveable):
+            return _save_shallow(
+                self.value, self.top, self.base_url, self.relative_uris
+            )
+        # as schema_salad.runtime.save() does for lists
+        return _Items(
+            _save_shallow(item, False, self.base_url, self.relative_uris)
+            for item in self.value
+        )
+
+
+class _Items:
+    """The items of a (non empty) list of objects, saved one at a time."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterator[Any]) -> None:
+        self.items = items
+
+
+def _save_shallow(obj: Saveable, top: bool, base_url: str, relative_uris: bool) -> Any:
+    """Save ``obj`` with its nested objects held back as :py:class:`_Pending`."""
+    shallow = copy.copy(obj)
+    for name, value in vars(obj).items():
+        if value is None or type(value) in _SCALARS or name in _FIELDS_NOT_SAVED:
+            continue
+        if isinstance(value, Saveable) or (
+            isinstance(value, MutableSequence)
+            and value
+            and all(isinstance(item, Saveable) for item in value)
+        ):
+            setattr(shallow, name, _Deferred(value))
+    return shallow.save(top=top, base_url=base_url, relative_uris=relative_uris)
+
+
+def _start(val: Any, base_url: str, relative_uris: bool) -> Any:
+    """Begin writing ``val`` as :py:func:`cwl_utils.parser.save` would save it."""
+    from cwl_utils.parser import is_process, version_split
+
+    if isinstance(val, Saveable):
+        return _save_shallow(val, True, base_url, relative_uris)
+    if isinstance(val, MutableSequence):
+        items = _Items(
+            (
+                _save_shallow(v, True, base_url, relative_uris)
+                if isinstance(v, Saveable)
+                else v
+            )
+            for v in val
+        )
+        if val and all(is_process(v) for v in val):
+            versions = [v.cwlVersion for v in val if v.cwlVersion is not None]
+            latest = max(versions, key=cast(Any, version_split))
+            return {"cwlVersion": latest, "$graph": items}
+        return items if val else []
+    return val
+
+
+def _resolve(value: Any, base_url: str, relative_uris: bool) -> Any:
+    if isinstance(value, _Pending):
+        return value.resolve()
+    if isinstance(value, Saveable):
+        return _save_shallow(value, False, base_url, relative_uris)
+    return value
+
+
+def dump_json(
+    val: Any,
+    stream: IO[str],
+    base_url: str = "",
+    relative_uris: bool = True,
+    indent: int | None = None,
+) -> None:
+    """
+    Write a CWL Python object as JSON, one object at a time.
+
+    The output is the same as ``json.dump(save(val, ...), stream,
+    indent=indent)``.
+
+    :param val: What to write, as for :py:func:`cwl_utils.parser.save`.
+    :param base_url: See :py:func:`cwl_utils.parser.save`.
+    :param relative_uris: See :py:func:`cwl_utils.parser.save`.
+    :param indent: See :py:func:`json.dump`.
+    """
+
+    def write(value: Any, level: int) -> None:
+        value = _resolve(value, base_url, relative_uris)
+        if isinstance(value, Mapping):
+            entries: Any = ((json.dumps(str(k)) + ": ", v) for k, v in value.items())
+            brackets = "{}"
+        elif isinstance(value, _Items):
+            entries = (("", v) for v in value.items)
+            brackets = "[]"
+        else:
+            write_plain(value, level)
+            return
+        stream.write(brackets[0])
+        empty = True
+        for prefix, item in entries:
+            if not empty:
+                stream.write(separator)
+            if indent is not None:
+                stream.write("\n" + " " * (indent * (level + 1)))
+            stream.write(prefix)
+            if brackets == "[]" or isinstance(item, (_Pending, _Items, Saveable)):
+                write(item, level + 1)
+            else:
+                # nothing is held back below the fields of a saved object
+                write_plain(item, level + 1)
+            empty = False
+        if not empty and indent is not None:
+            stream.write("\n" + " " * (indent * level))
+        stream.write(brackets[1])
+
+    def write_plain(value: Any, level: int) -> None:
+        text = json.dumps(value, indent=indent)
+        if indent is not None and level:
+            text = text.replace("\n", "\n" + " " * (indent * level))
+        stream.write(text)
+
+    separator = ", " if indent is None else ","
+    write(_start(val, base_url, relative_uris), 0)
+
+
+_PLAIN: Final = re.compile(r"[A-Za-z_/$][\w./$@+-]*")
+_NOT_PLAIN: Final = frozenset(
+    {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+)
+
+
+def _yaml_text(value: Any) -> str:
+    if isinstance(value, Mapping):
+        return "{}"
+    if isinstance(value, MutableSequence):
+        return "[]"
+    return _yaml_scalar(value)
+
+
+def _yaml_scalar(value: Any) -> str:
+    if isinstance(value, str):
+        if _PLAIN.fullmatch(value) and value.lower() not in _NOT_PLAIN:
+            return value
+        return json.dumps(value, ensure_ascii=False)
+    return json.dumps(value)
+
+
+def dump_yaml(
+    val: Any, stream: IO[str], base_url: str = "", relative_uris: bool = True
+) -> None:
+    """
+    Write a CWL Python object as block style YAML, one object at a time.
+
+    Loading the output gives the same as :py:func:`cwl_utils.parser.save`.
+    Strings that could be mistaken for another type are double quoted.
+
+    :param val: What to write, as for :py:func:`cwl_utils.parser.save`.
+    :param base_url: See :py:func:`cwl_utils.parser.save`.
+    :param relative_uris: See :py:func:`cwl_utils.parser.save`.
+    """
+
+    def entries(value: Any) -> tuple[bool, Iterator[tuple[str, Any]]] | None:
+        """Tell if a value is a mapping and get its entries, unless it is empty."""
+        if isinstance(value, Mapping):
+            if not value:
+                return None
+            return True, ((_yaml_scalar(k) + ":", v) for k, v in value.items())
+        if isinstance(value, _Items):
+            return False, (("-", v) for v in value.items)
+        if isinstance(value, MutableSequence) and value:
+            return False, (("-", v) for v in value)
+        return None
+
+    def write(
+        collection: tuple[bool, Iterator[tuple[str, Any]]], indent: int, inline: bool
+    ) -> None:
+        """Write the entries of a collection, the first one at the cursor if ``inline``."""
+        is_mapping, items = collection
+        for index, (prefix, item) in enumerate(items):
+            if index or not inline:
+                stream.write(" " * indent)
+            stream.write(prefix)
+            item = _resolve(item, base_url, relative_uris)
+            if (nested := entries(item)) is None:
+                stream.write(" " + _yaml_text(item) + "\n")
+            elif is_mapping:
+                stream.write("\n")
+                write(nested, indent + 2, False)
+            else:
+                stream.write(" ")
+                write(nested, indent + 2, True)
+
+    value = _resolve(_start(val, base_url, relative_uris), base_url, relative_uris)
+    if (collection := entries(value)) is None:
+        stream.write(_yaml_text(value) + "\n")
+    else:
+        write(collection, 0, True)
@@ -1,10 +1,12 @@
 """CWL parser utility functions."""
 
-import copy
 import logging
+import threading
+import weakref
+from collections import OrderedDict
 from collections.abc import MutableSequence
 from pathlib import Path
-from typing import Any, cast, Literal
+from typing import Any, Final, cast, Literal
 from urllib.parse import unquote_plus, urlparse
 
 from schema_salad.exceptions import ValidationException
@@ -26,18 +28,34 @@ from cwl_utils.parser import (
     cwl_v1_1_utils,
     cwl_v1_2,
     cwl_v1_2_utils,
+    IdIndex,
     InputRecordSchema,
     CommandOutputRecordSchema,
+    LazyProcess,
+    clone,
     CommandInputParameter,
     CommandOutputParameter,
     WorkflowInputParameter,
     load_document_by_uri,
 )
 from cwl_utils.errors import WorkflowException
+from cwl_utils.parser.prefetch import (
+    _run_fingerprint,
+    forget_prefetched,
+    take_prefetched,
+)
 from cwl_utils.utils import yaml_dumps
 
 _logger = logging.getLogger("cwl_utils")
 
+STEP_CACHE_SIZE: int = 1024
+"""Maximum number of resolved step processes kept by :py:func:`load_step`."""
+
+# keyed by (weak reference to the loading options of the step, run URI,
+# fingerprint of the run document)
+_step_cache: Final[OrderedDict[tuple[Any, ...], Process]] = OrderedDict()
+_step_cache_lock: Final = threading.Lock()
+
 
 def _compare_records(
     src: RecordSchema, sink: RecordSchema, strict: bool = False
@@ -229,19 +247,94 @@ def load_inputfile_by_yaml(
             )
 
 
-def load_step(
-    step: WorkflowStep,
-) -> Process:
-    if isinstance(step.run, str):
-        step_run = load_document_by_uri(
-            path=step.loadingOptions.fetcher.urljoin(
-                base_url=cast(str, step.loadingOptions.fileuri),
-                url=step.run,
-            ),
-            loadingOptions=step.loadingOptions,
+def _step_cache_lookup(key: tuple[Any, ...]) -> Process | None:
+    with _step_cache_lock:
+        process = _step_cache.get(key)
+        if process is not None:
+            _step_cache.move_to_end(key)
+        return process
+
+
+def _step_cache_store(key: tuple[Any, ...], process: Process) -> None:
+    with _step_cache_lock:
+        _step_cache[key] = process
+        _step_cache.move_to_end(key)
+        while len(_step_cache) > max(STEP_CACHE_SIZE, 0):
+            _step_cache.popitem(last=False)
+
+
+def clear_step_cache(loadingOptions: LoadingOptions | None = None) -> None:
+    """
+    Forget processes memoized by :py:func:`load_step`.
+
+    :param loadingOptions: If given, only drop the processes that were resolved
+        for steps loaded with options sharing this ``LoadingOptions`` index.
+    """
+    forget_prefetched(loadingOptions)
+    with _step_cache_lock:
+        if loadingOptions is None:
+            _step_cache.clear()
+            return
+        for key in [
+            k
+            for k in _step_cache
+            if (options := k[0]()) is None or options.idx is loadingOptions.idx
+        ]:
+            del _step_cache[key]
+
+
+def load_step(step: WorkflowStep, cache: bool = False) -> Process:
+    """
+    Return the process run by the given workflow step.
+
+    By default the process is the caller's own: ``run`` references are
+    loaded again, inline processes and
+    :py:class:`~cwl_utils.parser.LazyProcess` references are copied (with
+    :py:func:`~cwl_utils.parser.clone`).
+
+    :param cache: Return a shared process instead, which must not be
+        changed (copy it with :py:func:`~cwl_utils.parser.clone` first).
+        Inline processes are returned as they are, and
+        :py:class:`~cwl_utils.parser.LazyProcess` references are resolved
+        through the proxy. Other ``run`` references are memoized
+        process-wide, by the loading options of the step, the URI and the
+        modification time and size of the file; documents at other URIs are
+        taken not to change while the loading options are in use. External
+        ``run`` documents loaded ahead by
+        ``load_document_by_uri(..., workers=N)`` are taken from the loading
+        index of the step the first time, if they have not changed since.
+        The memoized processes share that index, so they keep the documents
+        in it alive until they are evicted (see :py:data:`STEP_CACHE_SIZE`)
+        or dropped by :py:func:`clear_step_cache`.
+    """
+    if isinstance(step.run, LazyProcess):
+        process = cast(Process, step.run.resolve())
+        return process if cache else clone(process)
+    if not isinstance(step.run, str):
+        return step.run if cache else cast(Process, clone(step.run))
+    uri = step.loadingOptions.fetcher.urljoin(
+        base_url=cast(str, step.loadingOptions.fileuri),
+        url=step.run,
+    )
+    fingerprint = _run_fingerprint(uri) if cache else None
+    if fingerprint is None:
+        return cast(
+            Process,
+            load_document_by_uri(path=uri, loadingOptions=step.loadingOptions),
+        )
+    key = (weakref.ref(step.loadingOptions), uri, fingerprint)
+    if (cached := _step_cache_lookup(key)) is not None:
+        return cached
+    step_run = cast(
+        Process | None, take_prefetched(uri, step.loadingOptions, fingerprint)
+    )
+    if step_run is None:
+        step_run = cast(
+            Process,
+            load_document_by_uri(path=uri, loadingOptions=step.loadingOptions),
         )
-        return cast(Process, step_run)
-    return cast(Process, copy.deepcopy(step.run))
+    _step_cache_store(key, step_run)
+    return step_run
 
 
 def merge_flatten_type(src: Any) -> Any:
@@ -253,11 +346,23 @@ def merge_flatten_type(src: Any) -> Any:
     return ArraySchema(type_="array", items=src)
 
 
+def _held_by(
+    target: Any, field: str, fragment: str, index: IdIndex | None
+) -> list[Any]:
+    """Find the items in ``field`` of ``target`` with this identifier fragment."""
+    if index is not None:
+        return index.held_by(target, field, fragment)
+    return [
+        item for item in getattr(target, field) if item.id.split("#")[-1] == fragment
+    ]
+
+
 def param_for_source_id(
     process: Process,
     sourcenames: str | list[str],
     parent: Workflow | None = None,
     scatter_context: list[tuple[int, str] | None] | None = None,
+    index: IdIndex | None = None,
 ) -> (
     CommandInputParameter
     | CommandOutputParameter
@@ -266,48 +371,51 @@ def param_for_source_id(
         CommandInputParameter | CommandOutputParameter | WorkflowInputParameter
     ]
 ):
-    """Find the process input parameter that matches one of the given sourcenames."""
+    """
+    Find the process input parameter that matches one of the given sourcenames.
+
+    :param index: Optional :py:class:`IdIndex` of the documents of ``process``
+        and ``parent``, to look the inputs and steps up in instead of scanning
+        them. It must have been built (or added to) after the last change of
+        those documents.
+    """
     if isinstance(sourcenames, str):
         sourcenames = [sourcenames]
     params: MutableSequence[
         CommandInputParameter | CommandOutputParameter | WorkflowInputParameter
     ] = []
     for sourcename in sourcenames:
+        fragment = sourcename.split("#")[-1]
         if not isinstance(process, Workflow):
-            for param in process.inputs:
-                if param.id.split("#")[-1] == sourcename.split("#")[-1]:
-                    params.append(param)
-                    if scatter_context is not None:
-                        scatter_context.append(None)
+            for param in _held_by(process, "inputs", fragment, index):
+                params.append(param)
+                if scatter_context is not None:
+                    scatter_context.append(None)
         targets = [process]
         if parent:
             targets.append(parent)
         for target in targets:
             if isinstance(target, Workflow):
-                for inp in target.inputs:
-                    if inp.id.split("#")[-1] == sourcename.split("#")[-1]:
-                        params.append(inp)
-                        if scatter_context is not None:
-                            scatter_context.append(None)
-                for step in target.steps:
-                    if (
-                        "/".join(sourcename.split("#")[-1].split("/")[:-1])
-                        == step.id.split("#")[-1]
-                        and step.out
-                    ):
-                        step_run = cwl_utils.parser.utils.load_step(step)
+                for inp in _held_by(target, "inputs", fragment, index):
+                    params.append(inp)
+                    if scatter_context is not None:
+                        scatter_context.append(None)
+                step_fragment = "/".join(fragment.split("/")[:-1])
+                for step in _held_by(target, "steps", step_fragment, index):
+                    if step.out:
+                        step_run = clone(load_step(step, cache=True))
                         cwl_utils.parser.utils.convert_stdstreams_to_files(step_run)
                         for outp in step.out:
                             outp_id = outp if isinstance(outp, str) else outp.id
                             if (
                                 outp_id.split("#")[-1].split("/")[-1]
-                                == sourcename.split("#")[-1].split("/")[-1]
+                                == fragment.split("/")[-1]
                             ):
                                 if step_run and step_run.outputs:
                                     for output in step_run.outputs:
                                         if (
                                             output.id.split("#")[-1].split("/")[-1]
-                                            == sourcename.split("#")[-1].split("/")[-1]
+                                            == fragment.split("/")[-1]
                                         ):
                                             params.append(output)
                                             if scatter_context is not None:
@@ -527,8 +635,14 @@ def type_for_source(
     parent: Workflow | None = None,
     linkMerge: str | None = None,
     pickValue: str | None = None,
+    index: IdIndex | None = None,
 ) -> Any:
-    """Determine the type for the given sourcenames."""
+    """
+    Determine the type for the given sourcenames.
+
+    :param index: Optional :py:class:`IdIndex` to look the sources up in, see
+        :py:func:`param_for_source_id`.
+    """
     match process.cwlVersion or cwlVersion:
         case "v1.0":
             return cwl_v1_0_utils.type_for_source(
@@ -541,6 +655,7 @@ def type_for_source(
                 sourcenames,
                 cast(cwl_v1_0.Workflow | None, parent),
                 linkMerge,
+                index,
             )
         case "v1.1":
             return cwl_v1_1_utils.type_for_source(
@@ -553,6 +668,7 @@ def type_for_source(
                 sourcenames,
                 cast(cwl_v1_1.Workflow | None, parent),
                 linkMerge,
+                index,
             )
         case "v1.2":
             return cwl_v1_2_utils.type_for_source(
@@ -566,6 +682,7 @@ def type_for_source(
                 cast(cwl_v1_2.Workflow | None, parent),
                 linkMerge,
                 pickValue,
+                index,
             )
         case _ as cwlVersion:
             raise ValidationException(
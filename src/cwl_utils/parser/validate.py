@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+"""
+Check CWL documents without keeping what was loaded.
+
+Almost all the cost of loading a document is in parsing the YAML with
+source line tracking and in validating it, not in building the objects (a
+few percent of the load). So :py:func:`validate_document` loads once on the
+fast ingestion path, without source lines, and discards the result; only
+the documents that turn out to be invalid are loaded again with source
+lines, to locate the errors.
+"""
+
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TypedDict
+from urllib.parse import urlparse
+
+from schema_salad.exceptions import SchemaSaladException
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.loghandler import _logger
+
+
+class Diagnostic(TypedDict):
+    """One error found in a document."""
+
+    uri: str
+    line: int | None
+    column: int | None
+    message: str
+
+
+def _uri_of(file: str | None, uri: str) -> str:
+    """Undo the shortening of local file names in the source line of errors."""
+    if not file:
+        return uri
+    if urlparse(file).scheme:
+        return file
+    return Path(file).resolve().as_uri()
+
+
+def _diagnostics(error: Exception, uri: str) -> list[Diagnostic]:
+    """Describe each of the underlying errors of an exception."""
+    if isinstance(error, SchemaSaladException):
+        return [
+            Diagnostic(
+                uri=_uri_of(leaf.file, uri),
+                line=leaf.start[0] if leaf.start else None,
+                column=leaf.start[1] if leaf.start else None,
+                message=leaf.detailed_message or leaf.message,
+            )
+            for leaf in error.leaves() or [error]
+        ]
+    # YAML syntax errors carry a zero based position
+    mark = getattr(error, "problem_mark", None)
+    return [
+        Diagnostic(
+            uri=uri,
+            line=mark.line + 1 if mark is not None else None,
+            column=mark.column + 1 if mark is not None else None,
+            message=str(error),
+        )
+    ]
+
+
+def validate_document(
+    path: str | Path, loadingOptions: LoadingOptions | None = None
+) -> list[Diagnostic]:
+    """
+    Check that a document is valid CWL.
+
+    Every process of a ``$graph`` is checked. The documents ``run`` by
+    workflow steps are not; check them separately, for example with
+    :py:func:`validate_documents`.
+
+    :param path: The document to check, as a URI or a path.
+    :param loadingOptions: Options to load the document with.
+
+    :returns: The errors found, with the line and column (counting from one)
+        where each was found when known; an empty list if the document is
+        valid.
+    """
+    from cwl_utils.parser import _split_uri, load_document_by_uri
+
+    uri = _split_uri(path)[0]
+    try:
+        load_document_by_uri(
+            uri, loadingOptions, load_all=True, track_source_lines=False
+        )
+        return []
+    except Exception as e:
+        _logger.debug("Locating the errors in %s: %s", uri, e)
+    try:
+        load_document_by_uri(uri, loadingOptions, load_all=True)
+    except Exception as e:
+        return _diagnostics(e, uri)
+    return []
+
+
+def validate_documents(
+    paths: Iterable[str | Path], workers: int | None = None
+) -> dict[str, list[Diagnostic]]:
+    """
+    Check many documents, each on its own, with :py:func:`validate_document`.
+
+    :param paths: The documents to check, as URIs or paths.
+    :param workers: If greater than one, check the documents in that many
+        processes.
+
+    :returns: The errors found in each document, by URI, in the order of
+        ``paths``.
+    """
+    from cwl_utils.parser import _split_uri, preload
+
+    uris = [_split_uri(path)[0] for path in paths]
+    if workers is None or workers <= 1:
+        return {uri: validate_document(uri) for uri in uris}
+    with ProcessPoolExecutor(max_workers=workers, initializer=preload) as pool:
+        chunksize = max(1, len(uris) // (workers * 4))
+        return dict(zip(uris, pool.map(validate_document, uris, chunksize=chunksize)))
@@ -0,0 +1,358 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Load all the CWL documents of a directory tree with shared state."""
+
+import hashlib
+import os
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from urllib.parse import urldefrag, urlparse
+from urllib.request import url2pathname
+
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.loghandler import _logger
+from cwl_utils.parser.prefetch import (
+    _remember,
+    _submit,
+    iter_references,
+    mark_prefetched,
+)
+
+_Fingerprint = tuple[int, int, str]
+
+
+def _fingerprint(uri: str, previous: _Fingerprint | None = None) -> _Fingerprint | None:
+    """
+    Get the modification time, size and SHA-256 of a local document.
+
+    The document is only hashed again when its modification time or size
+    differ from ``previous``. Other documents are assumed not to change.
+    """
+    parsed = urlparse(uri)
+    if parsed.scheme != "file":
+        return None
+    path = url2pathname(parsed.path)
+    try:
+        stat = os.stat(path)
+        if previous is not None and previous[:2] == (stat.st_mtime_ns, stat.st_size):
+            return previous
+        with open(path, "rb") as handle:
+            digest = hashlib.sha256(handle.read()).hexdigest()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, digest
+
+
+class Workspace:
+    """
+    The CWL documents found below a directory, loaded once and together.
+
+    All the documents are loaded with one :py:class:`LoadingOptions`, so they
+    share its fetcher (whose cache keeps the text of every document read) and
+    its index of loaded documents: a document that is ``$import``-ed or
+    ``run`` by many others is read, parsed and loaded only once, and
+    ``load_step(step, cache=True)`` (see
+    :py:func:`cwl_utils.parser.utils.load_step`) finds the processes of the
+    workspace there instead of loading them again. Objects loaded from a
+    shared document are shared too, so copy them before making changes.
+
+    Documents that fail to load are recorded in :py:attr:`errors` instead of
+    interrupting the build.
+
+    After some of the files changed, :py:meth:`refresh` reloads only the
+    documents that need it and keeps the objects of the others.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        pattern: str = "**/*.cwl",
+        loadingOptions: LoadingOptions | None = None,
+        track_source_lines: bool = True,
+        fields: Collection[str] | None = None,
+    ) -> None:
+        """
+        Prepare a workspace; nothing is read until :py:meth:`load`.
+
+        :param root: The directory to search for documents.
+        :param pattern: Glob pattern, relative to ``root``, of the documents
+            to load.
+        :param loadingOptions: Options to derive the shared ones from.
+        :param track_source_lines: See
+            :py:func:`cwl_utils.parser.load_document_by_uri`.
+        :param fields: Only load these fields, see
+            :py:func:`cwl_utils.parser.load_document_by_uri`.
+        """
+        self.root = Path(root).resolve()
+        self.pattern = pattern
+        self.loadingOptions = LoadingOptions(
+            copyfrom=loadingOptions, fileuri=self.root.as_uri() + "/"
+        )
+        self.track_source_lines = track_source_lines
+        self.fields = fields
+        self.processes: dict[str, Any] = {}
+        """The loaded object of each document, by URI."""
+        self.errors: dict[str, Exception] = {}
+        """Why each of the documents that could not be loaded failed, by URI."""
+        self.dependencies: dict[str, set[str]] = {}
+        """URIs of the documents that each document refers to, by URI."""
+        self._references: dict[str, list[tuple[str, str]]] = {}
+        self._fingerprints: dict[str, _Fingerprint | None] = {}
+
+    def uris(self) -> list[str]:
+        """List the URIs of the documents of the workspace, in path order."""
+        return sorted(path.as_uri() for path in self.root.glob(self.pattern))
+
+    def load(
+        self, workers: int | None = None, uris: Iterable[str] | None = None
+    ) -> "Workspace":
+        """
+        Load (or reload) every document of the workspace.
+
+        :param workers: If greater than one, read and load the documents with
+            that many threads. All documents are read and parsed first; they
+            are then loaded in rounds, where no two documents of a round
+            ``$import`` the same document that is not loaded yet, so that it is
+            still loaded only once.
+        :param uris: Only load these documents instead of those found by
+            :py:meth:`uris`.
+
+        :returns: The workspace itself.
+        """
+        self.processes.clear()
+        self.errors.clear()
+        self.dependencies.clear()
+        self._references.clear()
+        self._fingerprints.clear()
+        self._load_all(self.uris() if uris is None else list(uris), workers)
+        return self
+
+    def refresh(self, workers: int | None = None) -> list[str]:
+        """
+        Bring the workspace up to date with the files below its root.
+
+        The documents that were read are compared with the files, by
+        modification time and size and then by content. A document is
+        reloaded if it is new or changed, or if it ``$import``-s or
+        ``$include``-s (even indirectly) a document that changed or was
+        deleted. The objects of the other documents are kept: a workflow
+        whose ``run`` references a changed tool still holds the reference,
+        which ``load_step(step, cache=True)`` now resolves to the reloaded
+        tool. Deleted documents are dropped.
+
+        :param workers: See :py:meth:`load`.
+
+        :returns: The URIs of the documents that were reloaded.
+        """
+        current = self.uris()
+        previous = set(self.processes) | set(self.errors)
+        changed = set(previous - set(current))
+        for uri, before in self._fingerprints.items():
+            after = _fingerprint(uri, before)
+            if (after and after[2]) != (before and before[2]):
+                changed.add(uri)
+            self._fingerprints[uri] = after
+        importers: dict[str, set[str]] = {}
+        for source, references in self._references.items():
+            for kind, target in references:
+                if kind != "run":
+                    importers.setdefault(target, set()).add(source)
+        stale = set(changed)
+        pending = list(changed)
+        while pending:
+            for source in importers.get(pending.pop(), ()):
+                if source not in stale:
+                    stale.add(source)
+                    pending.append(source)
+        cache = getattr(self.loadingOptions.fetcher, "cache", None)
+        for uri in changed:
+            if cache is not None:
+                cache.pop(uri, None)
+            self._fingerprints.pop(uri, None)
+        for key in list(self.loadingOptions.idx):
+            if urldefrag(key)[0] in stale:
+                del self.loadingOptions.idx[key]
+        for uri in stale:
+            for results in (self.processes, self.errors, self.dependencies):
+                results.pop(uri, None)
+            self._references.pop(uri, None)
+        reload = sorted((stale | (set(current) - previous)) & set(current))
+        self._load_all(reload, workers)
+        return reload
+
+    def _load_all(self, uris: list[str], workers: int | None) -> None:
+        """Read, parse and load documents, then record what they import."""
+        if workers is None or workers <= 1:
+            for uri in uris:
+                if (yaml := self._parse(uri)) is not None:
+                    self._load(uri, yaml)
+        else:
+            self._load_parallel(uris, workers)
+        self._trace_imports()
+        for results in (self.processes, self.errors):
+            ordered = sorted(results.items())
+            results.clear()
+            results.update(ordered)
+
+    def _load_parallel(self, uris: list[str], workers: int) -> None:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [_submit(pool, self._parse, uri) for uri in uris]
+            parsed = {
+                uri: yaml
+                for uri, future in zip(uris, futures)
+                if (yaml := future.result()) is not None
+            }
+            while parsed:
+                claimed: set[str] = set()
+                batch = []
+                for uri in parsed:
+                    pending = {
+                        ref
+                        for kind, ref in self._references[uri]
+                        if kind == "$import" and ref not in self.loadingOptions.idx
+                    }
+                    if claimed.isdisjoint(pending):
+                        claimed.update(pending)
+                        batch.append(uri)
+                for future in [
+                    _submit(pool, self._load, uri, parsed.pop(uri)) for uri in batch
+                ]:
+                    future.result()
+
+    def _trace_imports(self) -> None:
+        """Record the references of the imported documents outside the workspace."""
+        pending = [
+            target
+            for references in list(self._references.values())
+            for kind, target in references
+            if kind == "$import"
+        ]
+        while pending:
+            uri = pending.pop()
+            if uri in self._references:
+                continue
+            self._references[uri] = []
+            try:
+                self._fingerprints.setdefault(uri, _fingerprint(uri))
+                yaml = _remember(
+                    uri,
+                    self.loadingOptions.fetcher.fetch_text(uri),
+                    "$import",
+                    self.loadingOptions,
+                    False,
+                )
+            except Exception as e:
+                _logger.debug("Unable to read %s: %s", uri, e)
+                continue
+            for kind, ref in iter_references(yaml):
+                target = urldefrag(self.loadingOptions.fetcher.urljoin(uri, ref))[0]
+                self._references[uri].append((kind, target))
+                self._fingerprints.setdefault(target, _fingerprint(target))
+                if kind == "$import":
+                    pending.append(target)
+
+    def _parse(self, uri: str) -> Any:
+        """Read and parse a document and record its dependencies."""
+        try:
+            self._fingerprints[uri] = _fingerprint(uri)
+            text = self.loadingOptions.fetcher.fetch_text(uri)
+            yaml = _remember(
+                uri, text, "run", self.loadingOptions, self.track_source_lines
+            )
+            references = [
+                (kind, urldefrag(self.loadingOptions.fetcher.urljoin(uri, ref))[0])
+                for kind, ref in iter_references(yaml)
+            ]
+            for _, ref in references:
+                self._fingerprints.setdefault(ref, _fingerprint(ref))
+            self.dependencies[uri] = {ref for _, ref in references}
+            self._references[uri] = references
+            return yaml
+        except Exception as e:
+            _logger.debug("Unable to read %s: %s", uri, e)
+            self.errors[uri] = e
+            return None
+
+    def _load(self, uri: str, yaml: Any) -> None:
+        from cwl_utils.parser import _split_uri, is_process, load_document_by_yaml
+
+        indexed = self.loadingOptions.idx.get(uri)
+        if indexed is not None and is_process(indexed[0]):
+            self.processes[uri] = indexed[0]
+            self._mark_loaded(uri)
+            return
+        loadingOptions = LoadingOptions(
+            copyfrom=self.loadingOptions,
+            fileuri=uri,
+            baseuri=_split_uri(uri)[1],
+            imports=[],
+            includes=[],
+        )
+        try:
+            self.processes[uri] = load_document_by_yaml(
+                yaml, uri, loadingOptions, fields=self.fields
+            )
+            self._mark_loaded(uri)
+        except Exception as e:
+            _logger.debug("Unable to load %s: %s", uri, e)
+            self.errors[uri] = e
+        # the loader also finds the imports of the imported documents
+        for kind, urls in (
+            ("$import", loadingOptions.imports),
+            ("$include", loadingOptions.includes),
+        ):
+            for url in urls:
+                if (kind, urldefrag(url)[0]) not in self._references[uri]:
+                    self._references[uri].append((kind, urldefrag(url)[0]))
+
+    def _mark_loaded(self, uri: str) -> None:
+        """Let :py:func:`cwl_utils.parser.utils.load_step` use a loaded process."""
+        from cwl_utils.parser import is_process
+
+        process = self.processes[uri]
+        if is_process(process) and (fingerprint := self._fingerprints.get(uri)):
+            # load_step fingerprints files by modification time and size
+            mark_prefetched(uri, process, fingerprint[:2])
+
+    def get(self, path: str | Path) -> Any:
+        """Get the loaded object of a document, by path or URI."""
+        from cwl_utils.parser import _split_uri
+
+        return self.processes.get(_split_uri(path)[0])
+
+    def dependents(self, path: str | Path) -> set[str]:
+        """Get the URIs of the documents that refer to a document, by path or URI."""
+        from cwl_utils.parser import _split_uri
+
+        uri = _split_uri(path)[0]
+        return {
+            source for source, targets in self.dependencies.items() if uri in targets
+        }
+
+    def references(self, path: str | Path) -> list[tuple[str, str]]:
+        """
+        Get the references of a document, by path or URI.
+
+        :returns: ``(kind, URI)`` pairs, where ``kind`` is one of ``run``,
+            ``$import`` or ``$include`` and the URI is that of the referenced
+            document (without fragment), in the order they were found.
+        """
+        from cwl_utils.parser import _split_uri
+
+        return list(self._references.get(_split_uri(path)[0], ()))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.processes)
+
+    def __len__(self) -> int:
+        return len(self.processes)
+
+    def __getitem__(self, uri: str) -> Any:
+        return self.processes[uri]
+
+    @property
+    def index(self) -> Mapping[str, Any]:
+        """The shared index of every document loaded, including ``$import``-s."""
+        return self.loadingOptions.idx
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the identifiers of anonymous objects."""
+
+import re
+import shutil
+from pathlib import Path
+from typing import Any
+
+import cwl_utils.parser.cwl_v1_2 as cwl
+from cwl_utils.parser import (
+    CountingIds,
+    Workspace,
+    anonymous_ids,
+    content_hash,
+    load_document_by_uri,
+    save,
+)
+from cwl_utils.parser.utils import load_step
+
+from .util import get_path
+
+PATH = get_path("testdata/workflow_input_sf_expr_array_v1_2.cwl")
+
+
+def _saved() -> Any:
+    return save(load_document_by_uri(PATH), relative_uris=False)
+
+
+def test_counting_ids() -> None:
+    """Anonymous objects get the same identifiers when counted."""
+    assert _saved() != _saved()
+    with anonymous_ids(CountingIds()):
+        first = _saved()
+    with anonymous_ids(CountingIds()):
+        assert _saved() == first
+    assert "_:1" in str(first)
+    with anonymous_ids(CountingIds(prefix="b")):
+        counted = load_document_by_uri(PATH)
+    assert content_hash(counted) == content_hash(load_document_by_uri(PATH))
+
+
+def test_counting_ids_constructors() -> None:
+    """Objects created without an identifier get one from the strategy too."""
+    with anonymous_ids(CountingIds(prefix="new", start=5)):
+        assert cwl.InputRecordSchema(type_="record").name == "_:new5"
+        with anonymous_ids(lambda: "_:fixed"):
+            assert cwl.CommandLineTool([], []).id == "_:fixed"
+        assert cwl.InputRecordSchema(type_="record").name == "_:new6"
+    assert cwl.InputRecordSchema(type_="record").name.startswith("_:")
+
+
+MAIN = """\
+cwlVersion: v1.2
+class: Workflow
+inputs: []
+outputs: []
+steps:
+  one:
+    run: sub.cwl
+    in: []
+    out: []
+"""
+
+
+def test_counting_ids_workers(tmp_path: Path) -> None:
+    """Documents loaded by worker threads get their identifiers counted too."""
+    for name in ("a", "b", "c"):
+        shutil.copy(PATH, tmp_path / f"{name}.cwl")
+    with anonymous_ids(CountingIds()):
+        workspace = Workspace(tmp_path).load(workers=2)
+    ids = [process.steps[0].run.id for process in workspace.processes.values()]
+    assert len(ids) == 3
+    assert all(re.fullmatch(r"_:\d+", i) for i in ids)
+    assert len(set(ids)) == 3
+
+    shutil.copy(PATH, tmp_path / "sub.cwl")
+    (tmp_path / "main.cwl").write_text(MAIN)
+    with anonymous_ids(CountingIds(prefix="w")):
+        main = load_document_by_uri(tmp_path / "main.cwl", workers=2)
+    sub = load_step(main.steps[0], cache=True)
+    assert isinstance(sub, cwl.Workflow)
+    assert re.fullmatch(r"_:w\d+", sub.steps[0].run.id)
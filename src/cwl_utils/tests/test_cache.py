@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the persistent parse cache."""
+
+import shutil
+from pathlib import Path
+
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.parser import load_document_by_uri, save
+from cwl_utils.parser.cache import ParseCache
+
+from .util import get_path
+
+
+def test_cache_roundtrip(tmp_path: Path) -> None:
+    """A second load of the same document is served from the cache."""
+    cache = ParseCache(tmp_path / "cache")
+    uri = get_path("testdata/count-lines6-wf_v1_2.cwl").as_uri()
+    first = load_document_by_uri(uri, cache=cache)
+    second = load_document_by_uri(uri, cache=cache)
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["stores"] == 1
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+    assert first is not second
+    assert save(first) == save(second)
+    assert second.loadingOptions.fetcher is not None
+
+
+def test_cache_stores_document_options_only(tmp_path: Path) -> None:
+    """Entries leave out the fetcher and index, hits get those of the caller."""
+    cache = ParseCache(tmp_path / "cache")
+    uri = get_path("testdata/md5sum_v12.cwl").as_uri()
+    options = LoadingOptions()
+    options.fetcher.cache["file:///unrelated.cwl"] = "unrelated-marker"
+    load_document_by_uri(uri, loadingOptions=options, cache=cache)
+    (entry,) = (tmp_path / "cache").iterdir()
+    assert b"unrelated-marker" not in entry.read_bytes()
+    receiver = LoadingOptions()
+    hit = load_document_by_uri(uri, loadingOptions=receiver, cache=cache)
+    assert cache.stats()["hits"] == 1
+    assert hit.loadingOptions.fetcher is receiver.fetcher
+    assert hit.loadingOptions.idx is receiver.idx
+    assert hit.loadingOptions.fileuri == uri
+
+
+def test_cache_invalidated_by_import(tmp_path: Path) -> None:
+    """Changing an $import-ed document invalidates the cached entry."""
+    shutil.copy(get_path("testdata/types/testtypes.yml"), tmp_path / "testtypes.yml")
+    tool = tmp_path / "tool.cwl"
+    tool.write_text(
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "requirements:\n"
+        "  SchemaDefRequirement:\n"
+        "    types:\n"
+        "      - $import: testtypes.yml\n"
+        "inputs: []\n"
+        "outputs: []\n"
+        "baseCommand: echo\n"
+    )
+    cache = ParseCache(tmp_path / "cache")
+    load_document_by_uri(tool, cache=cache)
+    load_document_by_uri(tool, cache=cache)
+    assert cache.stats()["hits"] == 1
+    with (tmp_path / "testtypes.yml").open("a") as handle:
+        handle.write("\n# changed\n")
+    load_document_by_uri(tool, cache=cache)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+def test_cache_eviction(tmp_path: Path) -> None:
+    """Old entries are evicted once the cache exceeds its size bound."""
+    cache = ParseCache(tmp_path / "cache", max_size=1)
+    for name in ("md5sum_v12.cwl", "echo_v1_2.cwl"):
+        load_document_by_uri(get_path(f"testdata/{name}"), cache=cache)
+    stats = cache.stats()
+    assert stats["stores"] == 2
+    assert stats["evictions"] == 2
+    assert stats["entries"] == 0
+    cache.clear()
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the persistent catalog of processes."""
+
+from pathlib import Path
+
+from cwl_utils.parser import Catalog
+
+TYPES = """\
+- name: sample
+  type: record
+  fields:
+    - name: id
+      type: string
+"""
+
+TOOL = """\
+cwlVersion: v1.2
+class: CommandLineTool
+baseCommand: echo
+requirements:
+  - class: SchemaDefRequirement
+    types:
+      - $import: types.yml
+hints:
+  - class: DockerRequirement
+    dockerPull: {image}
+inputs:
+  s: types.yml#sample
+outputs: []
+"""
+
+WORKFLOW = """\
+cwlVersion: v1.2
+class: Workflow
+requirements:
+  - class: InlineJavascriptRequirement
+inputs: []
+outputs: []
+steps:
+  {steps}
+"""
+
+
+def _tree(root: Path) -> None:
+    (root / "types.yml").write_text(TYPES)
+    (root / "tool1.cwl").write_text(TOOL.format(image="debian:12"))
+    (root / "tool2.cwl").write_text(TOOL.format(image="alpine:3"))
+    (root / "wf.cwl").write_text(
+        WORKFLOW.format(steps="one: {run: tool1.cwl, in: [], out: []}")
+    )
+    (root / "outer.cwl").write_text(
+        WORKFLOW.format(steps="inner: {run: wf.cwl, in: [], out: []}")
+    )
+
+
+def test_catalog_queries(tmp_path: Path) -> None:
+    """The catalog answers queries about requirements, images and runs."""
+    _tree(tmp_path)
+    catalog = Catalog()
+    assert len(catalog.refresh(tmp_path)) == 4
+    uri = tmp_path.as_uri()
+    assert catalog.users(f"{uri}/tool1.cwl") == {f"{uri}/wf.cwl"}
+    assert catalog.users(f"{uri}/tool1.cwl", recursive=True) == {
+        f"{uri}/wf.cwl",
+        f"{uri}/outer.cwl",
+    }
+    assert catalog.users(f"{uri}/tool2.cwl") == set()
+    assert catalog.with_requirement("InlineJavascriptRequirement") == {
+        f"{uri}/wf.cwl",
+        f"{uri}/outer.cwl",
+    }
+    assert catalog.with_requirement("DockerRequirement") == {
+        f"{uri}/tool1.cwl",
+        f"{uri}/tool2.cwl",
+    }
+    assert catalog.with_requirement("DockerRequirement", hints=False) == set()
+    assert catalog.with_image("alpine:3") == {f"{uri}/tool2.cwl"}
+    assert catalog.images() == {"debian:12", "alpine:3"}
+    assert catalog.get(f"{uri}/tool1.cwl")["class_"] == "CommandLineTool"
+
+
+def test_catalog_incremental(tmp_path: Path) -> None:
+    """Only new and changed documents are loaded again."""
+    root = tmp_path / "tree"
+    root.mkdir()
+    _tree(root)
+    stored = tmp_path / "catalog.json"
+    assert len(Catalog(stored).refresh(root)) == 4
+    catalog = Catalog(stored)
+    assert catalog.refresh(root) == []
+    assert catalog.images() == {"debian:12", "alpine:3"}
+
+    (root / "tool2.cwl").write_text(TOOL.format(image="alpine:4"))
+    assert catalog.refresh(root) == [(root / "tool2.cwl").as_uri()]
+    assert catalog.images() == {"debian:12", "alpine:4"}
+
+    # an $import-ed document changes the documents that import it
+    (root / "types.yml").write_text(TYPES + "    - name: extra\n      type: int\n")
+    assert sorted(catalog.refresh(root)) == [
+        (root / "tool1.cwl").as_uri(),
+        (root / "tool2.cwl").as_uri(),
+    ]
+
+    (root / "tool2.cwl").unlink()
+    (root / "broken.cwl").write_text("cwlVersion: v1.2\nclass: Nothing\n")
+    assert catalog.refresh(root) == [(root / "broken.cwl").as_uri()]
+    assert catalog.documents[(root / "broken.cwl").as_uri()]["error"]
+    assert catalog.images() == {"debian:12"}
+    assert Catalog(stored).documents == catalog.documents
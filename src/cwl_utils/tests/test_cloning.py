@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for copying loaded objects."""
+
+import pytest
+from ruamel.yaml.comments import CommentedMap
+from schema_salad.utils import yaml_no_ts
+
+from cwl_utils.parser import clone, load_document_by_uri, replace, save
+
+from .util import get_path
+
+
+def test_clone() -> None:
+    """A clone can be changed apart from the original, but shares its options."""
+    wf = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"))
+    copied = clone(wf)
+    assert save(copied) == save(wf)
+    assert copied is not wf
+    assert copied.loadingOptions is wf.loadingOptions
+    step, copied_step = wf.steps[0], copied.steps[0]
+    assert copied_step is not step
+    assert copied_step.run is not step.run
+    assert copied_step.run.loadingOptions is step.run.loadingOptions
+    copied_step.run.arguments.append("bar")
+    copied_step.scatter.pop()
+    assert step.run.arguments == ["-n", "foo"]
+    assert len(step.scatter) == 2
+
+
+def test_clone_yaml() -> None:
+    """Objects found twice are copied once; ruamel.yaml line numbers are kept."""
+    default = yaml_no_ts().load("class: File\nlocation:\n  args.py\n")
+    assert isinstance(default, CommentedMap)
+    copied = clone([default, default])
+    assert copied[0] is copied[1]
+    assert copied[0] is not default
+    assert isinstance(copied[0], CommentedMap)
+    assert copied[0] == default
+    assert copied[0].lc.data == default.lc.data
+
+
+def test_replace() -> None:
+    """Only the replaced fields of a replaced object differ from the original."""
+    wf = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"))
+    step = wf.steps[0]
+    changed = replace(step, scatterMethod="flat_crossproduct")
+    assert changed.scatterMethod == "flat_crossproduct"
+    assert step.scatterMethod == "nested_crossproduct"
+    assert changed.run is step.run
+    assert changed.in_ is step.in_
+    with pytest.raises(TypeError):
+        replace(step, scatter_method="flat_crossproduct")
+    with pytest.raises(TypeError):
+        replace(step, save=None)
+    extended = replace(step, extension_fields={"http://example.com/foo": "bar"})
+    assert extended.extension_fields == {"http://example.com/foo": "bar"}
+    assert not step.extension_fields
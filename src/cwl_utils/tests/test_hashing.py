@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the structural content hashes of loaded objects."""
+
+from pathlib import Path
+
+from cwl_utils.parser import ContentHasher, content_hash, load_document_by_uri
+
+from .util import get_path
+
+TOOL = """\
+cwlVersion: v1.2
+class: CommandLineTool
+requirements:
+  InlineJavascriptRequirement: {}
+  ResourceRequirement: {coresMin: 2}
+inputs:
+  first: {type: string, inputBinding: {position: 1}}
+  second: {type: "int[]", inputBinding: {position: 2}}
+outputs:
+  out: {type: stdout}
+baseCommand: echo
+arguments: [-n, "$(inputs.first)"]
+"""
+
+
+def _load(tmp_path: Path, name: str, text: str) -> str:
+    path = tmp_path / name
+    path.write_text(text)
+    return content_hash(load_document_by_uri(path))
+
+
+def test_content_hash_stable() -> None:
+    """The hash does not depend on source lines or on blank node uuids."""
+    path = get_path("testdata/workflow_input_format_expr_v1_2.cwl")
+    first = load_document_by_uri(path)
+    second = load_document_by_uri(path, track_source_lines=False)
+    assert content_hash(first) == content_hash(second)
+    assert content_hash(first) == ContentHasher().hexdigest(first)
+    packed = get_path("testdata/revsort-packed.cwl")
+    assert content_hash(load_document_by_uri(packed, load_all=True)) == content_hash(
+        load_document_by_uri(packed, load_all=True)
+    )
+
+
+def test_content_hash_structural(tmp_path: Path) -> None:
+    """The hash ignores location and mapping order, but not content."""
+    expected = _load(tmp_path, "tool.cwl", TOOL)
+    assert _load(tmp_path, "copy.cwl", TOOL) == expected
+    lines = TOOL.splitlines(keepends=True)
+    # swap the two requirements, and the two inputs
+    lines[3], lines[4], lines[6], lines[7] = lines[4], lines[3], lines[7], lines[6]
+    reordered = "".join(lines)
+    assert reordered != TOOL
+    assert _load(tmp_path, "reordered.cwl", reordered) == expected
+    for changed in (
+        TOOL.replace("coresMin: 2", "coresMin: 3"),
+        TOOL.replace("position: 2", "position: 3"),
+        TOOL.replace('[-n, "$(inputs.first)"]', '["$(inputs.first)", -n]'),
+        TOOL.replace("second:", "third:"),
+    ):
+        assert _load(tmp_path, "changed.cwl", changed) != expected
+
+
+def test_content_hasher_forget() -> None:
+    """Digests are remembered until the changed object is forgotten."""
+    wf = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"))
+    hasher = ContentHasher()
+    before = hasher.digest(wf)
+    tool = wf.steps[0].run
+    tool.baseCommand = "printf"
+    assert hasher.digest(wf) == before
+    hasher.forget(tool)
+    after = hasher.digest(wf)
+    assert after != before
+    assert after.hex() == content_hash(wf)
+    hasher.clear()
+    assert hasher.digest(wf) == after
+
+
+def test_content_hash_ordered_lists(tmp_path: Path) -> None:
+    """Swapping list items that are not written as a mapping changes the hash."""
+    files = TOOL.replace(
+        "second: {",
+        "files:\n"
+        "    type: File[]\n"
+        "    default: [{class: File, location: a.txt}, {class: File, location: b.txt}]\n"
+        "  second: {",
+    )
+    swapped_files = files.replace("a.txt", "c.txt").replace("b.txt", "a.txt")
+    swapped_files = swapped_files.replace("c.txt", "b.txt")
+    assert _load(tmp_path, "files.cwl", files) != _load(
+        tmp_path, "swapped_files.cwl", swapped_files
+    )
+    env = TOOL.replace(
+        "  InlineJavascriptRequirement: {}\n",
+        "  - class: EnvVarRequirement\n"
+        "    envDef: {MODE: fast}\n"
+        "  - class: EnvVarRequirement\n"
+        "    envDef: {MODE: slow}\n",
+    ).replace("  ResourceRequirement: {coresMin: 2}\n", "")
+    swapped_env = env.replace("fast", "other").replace("slow", "fast")
+    swapped_env = swapped_env.replace("other", "slow")
+    assert _load(tmp_path, "env.cwl", env) != _load(
+        tmp_path, "swapped_env.cwl", swapped_env
+    )
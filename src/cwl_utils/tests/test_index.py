@@ -0,0 +1,102 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the index of identified objects."""
+
+from typing import Any
+
+import pytest
+from schema_salad.runtime import save
+
+from cwl_utils.parser import IdIndex, load_document_by_uri
+from cwl_utils.parser.utils import load_step, type_for_source
+
+from .util import get_path
+
+
+def _unnamed(type_: Any) -> Any:
+    """Save a type without the blank node names of the array schemas."""
+    saved = save(type_)
+    if isinstance(saved, dict):
+        return {key: _unnamed(value) for key, value in saved.items() if key != "name"}
+    if isinstance(saved, list):
+        return [_unnamed(item) for item in saved]
+    return saved
+
+
+def test_index_during_load() -> None:
+    """load_document_by_uri() can fill an index, including step processes."""
+    index = IdIndex()
+    wf = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"), index=index)
+    assert index[wf.id] is wf
+    step = wf.steps[0]
+    assert index[step.id] is step
+    assert index.get(step.run.id) is step.run
+    assert index.by_fragment("#step1/echo_in1") == [step.in_[0]]
+    assert set(map(id, index.by_shortname("echo_in1"))) == {
+        id(step.in_[0]),
+        id(step.run.inputs[0]),
+    }
+    assert index.get("file:///nowhere.cwl#main") is None
+    assert index.by_fragment("nowhere") == []
+    assert not any(identifier.startswith("_:") for identifier in index)
+
+
+def test_index_packed_graph() -> None:
+    """All processes of a packed document are indexed, by fragment too."""
+    index = IdIndex(
+        load_document_by_uri(get_path("testdata/revsort-packed.cwl"), load_all=True)
+    )
+    uri = get_path("testdata/revsort-packed.cwl").as_uri()
+    assert f"{uri}#main" in index
+    assert type(index[f"{uri}#revtool.cwl"]).__name__ == "CommandLineTool"
+    assert [param.id for param in index.by_fragment("revtool.cwl/input")] == [
+        f"{uri}#revtool.cwl/input"
+    ]
+    assert len(index.by_shortname("output")) == 3
+    # adding the same objects again does not duplicate them
+    size = len(index)
+    index.add(index[f"{uri}#main"])
+    assert len(index) == size
+    assert len(index.by_shortname("output")) == 3
+
+
+def test_index_held_by() -> None:
+    """Lookups can be narrowed to the objects held in a field of another one."""
+    wf = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"))
+    index = IdIndex(wf)
+    step = wf.steps[0]
+    assert index.held_by(wf, "inputs", "inp1") == [wf.inputs[0]]
+    assert index.held_by(wf, "steps", "#step1") == [step]
+    assert index.held_by(step, "in_", "step1/echo_in1") == [step.in_[0]]
+    # the inline tool of the step holds its own inputs
+    tool_input = step.run.inputs[0]
+    assert index.held_by(step.run, "inputs", tool_input.id) == [tool_input]
+    assert index.held_by(wf, "inputs", tool_input.id) == []
+    assert index.held_by(wf, "outputs", "inp1") == []
+    assert index.held_by(step.run, "inputs", "inp1") == []
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "count-lines6-wf_v1_2.cwl",
+        "count-lines7-single-source-wf_v1_2.cwl",
+        "scatter-wf2_v1_1.cwl",
+        "scatter-wf3_v1_0.cwl",
+        "revsort-packed.cwl",
+    ],
+)
+def test_index_type_for_source(name: str) -> None:
+    """type_for_source() finds the same types through an index as by scanning."""
+    wf = load_document_by_uri(get_path(f"testdata/{name}"))
+    sources = [
+        (inp.source, load_step(step, cache=True))
+        for step in wf.steps
+        for inp in step.in_
+        if inp.source is not None
+    ]
+    index = IdIndex(wf)
+    for source, run in sources:
+        for process, parent in ((wf, None), (run, wf)):
+            assert _unnamed(
+                type_for_source(process, wf.cwlVersion, source, parent, index=index)
+            ) == _unnamed(type_for_source(process, wf.cwlVersion, source, parent))
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for the memory footprint of the loaded object model."""
+
+import tracemalloc
+from collections.abc import Iterator, MutableMapping, MutableSequence
+from typing import Any
+
+from schema_salad.runtime import Saveable
+
+import cwl_utils.parser.cwl_v1_2 as cwl
+from cwl_utils.parser import load_document_by_uri, save
+
+from .util import get_path
+
+
+def _saveables(node: Any) -> Iterator[Any]:
+    """Walk every generated object reachable from ``node``."""
+    if isinstance(node, Saveable):
+        yield node
+        for key, value in vars(node).items():
+            if key != "loadingOptions":
+                yield from _saveables(value)
+    elif isinstance(node, MutableSequence):
+        for item in node:
+            yield from _saveables(item)
+    elif isinstance(node, MutableMapping):
+        for item in node.values():
+            yield from _saveables(item)
+
+
+def test_extension_fields_not_allocated() -> None:
+    """Loading and saving a document allocates no empty extension_fields."""
+    cwl_obj = load_document_by_uri(get_path("testdata/revsort-packed.cwl"))
+    save(cwl_obj)
+    objects = list(_saveables(cwl_obj))
+    assert len(objects) >= 10
+    assert not any("extension_fields" in vars(obj) for obj in objects)
+
+
+def test_extension_fields_allocated_on_use() -> None:
+    """extension_fields still behaves like a per-object mutable mapping."""
+    tool = cwl.CommandLineTool(inputs=[], outputs=[])
+    other = cwl.CommandLineTool(inputs=[], outputs=[])
+    tool.extension_fields["http://example.com/foo"] = "bar"
+    assert tool.extension_fields == {"http://example.com/foo": "bar"}
+    assert other.extension_fields == {}
+    assert save(tool)["http://example.com/foo"] == "bar"
+    given = cwl.CommandLineTool(
+        inputs=[], outputs=[], extension_fields={"http://example.com/x": 1}
+    )
+    assert given.extension_fields == {"http://example.com/x": 1}
+
+
+def test_type_names_interned() -> None:
+    """Type names are shared between objects instead of copied per object."""
+    cwl_obj = load_document_by_uri(get_path("testdata/scatter-wf2_v1_2.cwl"))
+    types = [inp.type_ for step in cwl_obj.steps for inp in step.run.inputs]
+    assert types == ["string", "string"]
+    assert types[0] is types[1]
+
+
+def test_lazy_extension_fields_footprint() -> None:
+    """Measure what eagerly allocated extension_fields would cost."""
+    cwl_obj = load_document_by_uri(get_path("testdata/revsort-packed.cwl"))
+    objects = list(_saveables(cwl_obj))
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for obj in objects:
+            obj.extension_fields  # noqa: B018
+        eager = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    # an empty CommentedMap costs a few hundred bytes on every supported Python
+    assert eager > 200 * len(objects)
@@ -1,18 +1,34 @@
 # SPDX-License-Identifier: Apache-2.0
 """Test the load and save functions for CWL."""
 
+import gc
+import json
+import subprocess  # nosec
+import sys
+import weakref
+from pathlib import Path
+
 from pytest import raises
+from ruamel.yaml.error import YAMLError
 from ruamel.yaml.main import YAML
-from schema_salad.runtime import shortname
+from schema_salad.exceptions import ValidationException
+from schema_salad.runtime import LoadingOptions, shortname
 
+import cwl_utils.parser.codegen_support as codegen_support
+import cwl_utils.parser.cwl_v1_2 as cwl_v1_2
 import cwl_utils.parser.latest as latest
 from cwl_utils.errors import GraphTargetMissingException
 from cwl_utils.parser import (
+    LazyProcess,
     cwl_version,
+    iter_graph,
     load_document,
     load_document_by_uri,
+    load_documents,
+    preload,
     save,
 )
+from cwl_utils.parser.utils import load_step
 from .util import get_path
 
 TEST_v1_0_CWL = get_path("testdata/md5sum.cwl")
@@ -161,3 +177,265 @@ def test_map_ordering_v1_2() -> None:
     assert cwl_obj.outputs[0].id == f"{uri}#zz_first_output"
     assert cwl_obj.outputs[1].id == f"{uri}#ll_second_output"
     assert cwl_obj.outputs[2].id == f"{uri}#aa_third_output"
+
+
+def test_load_document_with_workers() -> None:
+    """Loading with a pool of workers gives the same result as a serial load."""
+    for name in ("md5sum_v12.cwl", "revsort-packed.cwl", "wf2.cwl"):
+        uri = get_path(f"testdata/{name}").as_uri()
+        assert save(load_document_by_uri(uri, workers=4)) == save(
+            load_document_by_uri(uri)
+        )
+
+
+def test_load_document_lazy_run() -> None:
+    """With lazy=True, external run references are loaded on first access."""
+    uri = get_path("testdata/md5sum_v12.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri, lazy=True)
+    run = cwl_obj.steps[0].run
+    assert isinstance(run, LazyProcess)
+    assert isinstance(run, str)
+    assert not run.loaded
+    assert run.baseCommand == "my_md5sum"
+    assert run.loaded
+    assert run.resolve() is run.resolve()
+    assert save(cwl_obj) == save(load_document_by_uri(uri))
+
+
+def test_load_document_lazy_run_error(tmp_path: Path) -> None:
+    """Errors in a lazily loaded run document surface on first access."""
+    (tmp_path / "broken.cwl").write_text("cwlVersion: v1.2\nclass: CommandLineTool\n")
+    wf = tmp_path / "wf.cwl"
+    wf.write_text(
+        "cwlVersion: v1.2\n"
+        "class: Workflow\n"
+        "inputs: []\n"
+        "outputs: []\n"
+        "steps:\n"
+        "  step1:\n"
+        "    run: broken.cwl\n"
+        "    in: []\n"
+        "    out: []\n"
+    )
+    cwl_obj = load_document_by_uri(wf, lazy=True)
+    with raises(ValidationException):
+        cwl_obj.steps[0].run.inputs
+
+
+def test_load_document_fields() -> None:
+    """A projected load keeps the requested fields, runs and identifiers."""
+    uri = get_path("testdata/md5sum_v12.cwl").as_uri()
+    full = load_document_by_uri(uri)
+    cwl_obj = load_document_by_uri(
+        uri, lazy=True, fields=("requirements", "hints", "steps")
+    )
+    assert cwl_obj.id == full.id
+    assert cwl_obj.inputs == [] and cwl_obj.outputs == []
+    step = cwl_obj.steps[0]
+    assert step.id == full.steps[0].id
+    assert step.in_ == [] and step.out == []
+    run = step.run
+    assert isinstance(run, LazyProcess)
+    assert save(run.hints) == save(load_step(full.steps[0]).hints)
+    assert run.inputs == [] and run.baseCommand is None
+
+
+def test_load_document_fields_graph() -> None:
+    """Every process of a $graph is projected."""
+    uri = get_path("testdata/revsort-packed.cwl").as_uri()
+    full = load_document_by_uri(uri, load_all=True)
+    projected = load_document_by_uri(uri, load_all=True, fields=("hints",))
+    assert [p.id for p in projected] == [p.id for p in full]
+    assert projected[0].hints
+    for process, expected in zip(projected, full):
+        assert save(process.hints) == save(expected.hints)
+        assert process.inputs == [] and not process.requirements
+
+
+def test_load_documents(tmp_path: Path) -> None:
+    """Batches load the same sequentially and with processes, errors included."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text("cwlVersion: v1.2\nclass: CommandLineTool\n")
+    unparsable = tmp_path / "unparsable.cwl"
+    unparsable.write_text("cwlVersion: v1.2\nclass: [\n")
+    paths = [get_path("testdata/md5sum_v12.cwl"), broken, TEST_v1_0_CWL, unparsable]
+    results = load_documents(paths)
+    assert list(results) == [path.as_uri() for path in paths]
+    assert isinstance(results[broken.as_uri()], ValidationException)
+    assert isinstance(results[unparsable.as_uri()], YAMLError)
+    for workers in (None, 2):
+        saved = load_documents(paths, workers=workers, saved=True)
+        assert saved[paths[0].as_uri()] == save(results[paths[0].as_uri()])
+        assert saved[paths[2].as_uri()] == save(results[paths[2].as_uri()])
+        assert str(saved[broken.as_uri()]) == str(results[broken.as_uri()])
+        assert isinstance(saved[unparsable.as_uri()], YAMLError)
+    loaded = load_documents(paths, workers=2)
+    assert save(loaded[paths[0].as_uri()]) == save(results[paths[0].as_uri()])
+
+
+def test_load_document_without_source_lines(tmp_path: Path) -> None:
+    """The fast ingestion path gives the same objects for YAML and JSON input."""
+    source = get_path("testdata/revsort-packed.cwl")
+    uri = source.as_uri()
+    assert save(load_document_by_uri(uri, track_source_lines=False)) == save(
+        load_document_by_uri(uri)
+    )
+    packed = tmp_path / "revsort-packed.json"
+    with source.open() as handle:
+        packed.write_text(json.dumps(YAML(typ="safe").load(handle)))
+    assert save(load_document_by_uri(packed, track_source_lines=False)) == save(
+        load_document_by_uri(packed)
+    )
+
+
+def test_load_document_without_source_lines_error(tmp_path: Path) -> None:
+    """Invalid documents are still rejected by the fast ingestion path."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text('{"cwlVersion": "v1.2", "class": "CommandLineTool"}')
+    with raises(ValidationException):
+        load_document_by_uri(broken, track_source_lines=False)
+
+
+def test_union_loader_dispatch() -> None:
+    """Unions only try the alternates that match the type and class of a node."""
+    docker = cwl_v1_2._RecordLoader(cwl_v1_2.DockerRequirement)
+    inline_js = cwl_v1_2._RecordLoader(cwl_v1_2.InlineJavascriptRequirement)
+    strings = cwl_v1_2._PrimitiveLoader(str)
+    union = cwl_v1_2._UnionLoader((strings, docker, inline_js))
+    assert union._candidates({"class": "InlineJavascriptRequirement"}) == (inline_js,)
+    assert union._candidates({"class": "cwl:DockerRequirement"}) == (
+        docker,
+        inline_js,
+    )
+    assert union._candidates("foo") == (strings,)
+    loaded = union.load(
+        {"class": "InlineJavascriptRequirement"}, "file:///", LoadingOptions()
+    )
+    assert isinstance(loaded, cwl_v1_2.InlineJavascriptRequirement)
+    with raises(ValidationException, match="invalid field `foo`"):
+        union.load(
+            {"class": "DockerRequirement", "foo": 1},
+            "file:///",
+            LoadingOptions(),
+        )
+
+
+def test_union_loader_diagnostics(tmp_path: Path) -> None:
+    """Misses are only reported in detail once the whole union has failed."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text(
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "inputs:\n"
+        "  in1:\n"
+        "    type: {type: array, itemz: string}\n"
+        "outputs: []\n"
+    )
+    with raises(ValidationException) as excinfo:
+        load_document_by_uri(broken)
+    message = str(excinfo.value)
+    for alternate in ("CommandInputRecordSchema", "CommandInputArraySchema", "`itemz`"):
+        assert alternate in message
+    assert codegen_support.load_state() == 0
+
+
+def test_expand_url_memo() -> None:
+    """Expanded URLs are remembered per fetcher and set of namespaces."""
+    options = LoadingOptions(namespaces={"ex": "http://example.com/"})
+    base = "file:///wf.cwl#main"
+    assert cwl_v1_2._expand_url("ex:foo", base, options) == "http://example.com/foo"
+    copied = LoadingOptions(copyfrom=options, no_link_check=True)
+    assert cwl_v1_2._expand_memo(copied) is cwl_v1_2._expand_memo(options)
+    options.vocab["ex"] = "http://example.org/"
+    assert cwl_v1_2._expand_url("ex:foo", base, options) == "http://example.org/foo"
+    other = LoadingOptions(namespaces={"ex": "http://example.net/"})
+    assert cwl_v1_2._expand_url("ex:foo", base, other) == "http://example.net/foo"
+    last = weakref.ref(other)
+    del other
+    gc.collect()
+    assert last() is None
+
+
+def test_iter_graph() -> None:
+    """iter_graph yields the same processes as load_all, one at a time."""
+    uri = get_path("testdata/revsort-packed.cwl").as_uri()
+    processes = iter_graph(uri)
+    first = next(processes)
+    assert shortname(first.id) == "main"
+    rest = list(processes)
+    assert [save(p) for p in [first, *rest]] == [
+        save(p) for p in load_document_by_uri(uri, load_all=True)
+    ]
+    assert first.loadingOptions.idx is not rest[0].loadingOptions.idx
+    tools = list(iter_graph(uri, lambda id_: id_.endswith(".cwl")))
+    assert [shortname(p.id) for p in tools] == ["revtool.cwl", "sorttool.cwl"]
+
+
+def test_iter_graph_single_process() -> None:
+    """A document without $graph is a graph of one process."""
+    uri = get_path("testdata/md5sum_v12.cwl").as_uri()
+    assert [save(p) for p in iter_graph(uri)] == [save(load_document_by_uri(uri))]
+
+
+def test_generated_parsers_imported_on_use() -> None:
+    """Only the parser for the cwlVersion of a loaded document is imported."""
+    script = f"""
+import sys
+import cwl_utils.parser as cwl
+assert not [m for m in sys.modules if m.startswith("cwl_utils.parser.cwl_v1_")]
+obj = cwl.load_document_by_uri({str(TEST_v1_2_CWL)!r})
+assert "cwl_utils.parser.cwl_v1_2" in sys.modules
+assert "cwl_utils.parser.cwl_v1_0" not in sys.modules
+assert isinstance(obj, cwl.Workflow) and isinstance(obj, cwl.WorkflowTypes)
+assert isinstance(obj, cwl.Process) and cwl.is_process(obj)
+assert not isinstance(obj, cwl.CommandLineTool | cwl.ExpressionTool)
+assert cwl.cwl_v1_0.CommandLineTool.__module__ == "cwl_utils.parser.cwl_v1_0"
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)  # nosec
+
+
+def test_preload() -> None:
+    """preload() imports the generated parsers of the given cwlVersions."""
+    preload(["v1.1"])
+    assert "cwl_utils.parser.cwl_v1_1" in sys.modules
+    preload()
+    assert "cwl_utils.parser.cwl_v1_0" in sys.modules
+    with raises(ValidationException, match="Did not recognise v2.0"):
+        preload(["v2.0"])
+
+
+def test_save_relative_uri() -> None:
+    """The fast relative URIs are those of schema-salad."""
+    from schema_salad.runtime import save_relative_uri
+
+    bases = [
+        "",
+        "file:///wf.cwl",
+        "file:///wf.cwl#main",
+        "file:///wf.cwl#main/step",
+        "file:///dir/wf.cwl#main",
+        "http://example.com/wf.cwl?x=1#main",
+        "file:///wf.cwl#main\t",
+    ]
+    uris = [
+        "file:///wf.cwl",
+        "file:///wf.cwl#main",
+        "file:///wf.cwl#main/step/in",
+        "file:///wf.cwl#other/x",
+        "file:///wf.cwl#main/step#x",
+        "file:///tools/tool.cwl",
+        "file:///dir/tool.cwl#main/x",
+        "http://example.com/wf.cwl?x=1#main/y",
+        "#main/x",
+        "string",
+        ["file:///wf.cwl#main/a", "file:///wf.cwl#main/b"],
+    ]
+    for base in bases:
+        for uri in uris:
+            for scoped_id in (True, False):
+                for ref_scope in (None, 0, 1, 2):
+                    for relative in (True, False):
+                        args = (uri, base, scoped_id, ref_scope, relative)
+                        assert codegen_support.save_relative_uri(
+                            *args
+                        ) == save_relative_uri(*args), args
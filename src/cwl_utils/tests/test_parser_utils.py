@@ -1,10 +1,14 @@
 # SPDX-License-Identifier: Apache-2.0
 """Test the CWL parsers utility functions."""
 
+import gc
 import logging
 import re
+import shutil
 import tempfile
+import weakref
 from collections.abc import MutableSequence
+from pathlib import Path
 from typing import cast
 
 import pytest
@@ -1249,3 +1253,100 @@ def test_v1_2_type_for_source_with_single_entry_all_non_null() -> None:
     )
     assert isinstance(source_type, ArraySchema)
     assert source_type.items == "string"
+
+
+def test_load_step_memoized() -> None:
+    """Cached lookups of the same step return the same resolved process."""
+    cwl_utils.parser.utils.clear_step_cache()
+    uri = get_path("testdata/count-lines6-wf_v1_2.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri)
+    step = cwl_obj.steps[0]
+    first = cwl_utils.parser.utils.load_step(step, cache=True)
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is first
+    own = cwl_utils.parser.utils.load_step(step)
+    assert own is not first
+    assert cwl_utils.parser.utils.load_step(step) is not own
+    other = load_document_by_uri(uri)
+    assert cwl_utils.parser.utils.load_step(other.steps[0], cache=True) is not first
+    cwl_utils.parser.utils.clear_step_cache(cwl_obj.loadingOptions)
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is not first
+
+
+def test_load_step_cache_cleared() -> None:
+    """Once cleared, the step cache keeps nothing of the documents alive."""
+    cwl_utils.parser.utils.clear_step_cache()
+    cwl_obj = load_document_by_uri(get_path("testdata/count-lines6-wf_v1_2.cwl"))
+    cwl_utils.parser.utils.load_step(cwl_obj.steps[0], cache=True)
+    options = weakref.ref(cwl_obj.steps[0].loadingOptions)
+    cwl_utils.parser.utils.clear_step_cache(cwl_obj.loadingOptions)
+    del cwl_obj
+    gc.collect()
+    assert options() is None
+
+
+def test_load_step_inline() -> None:
+    """Inline processes are copied, unless a shared process will do."""
+    uri = get_path("testdata/scatter-wf1_v1_2.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri)
+    step = cwl_obj.steps[0]
+    own = cwl_utils.parser.utils.load_step(step)
+    assert own is not step.run
+    assert own.save() == step.run.save()
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is step.run
+
+
+def test_load_step_lazy() -> None:
+    """Lazy references are copied, unless a shared process will do."""
+    uri = get_path("testdata/count-lines6-wf_v1_2.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri, lazy=True)
+    step = cwl_obj.steps[0]
+    own = cwl_utils.parser.utils.load_step(step)
+    assert own is not step.run.resolve()
+    assert own.save() == step.run.resolve().save()
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is step.run.resolve()
+
+
+def test_load_step_not_changed_by_type_lookups() -> None:
+    """Looking up step types does not change the memoized process."""
+    cwl_utils.parser.utils.clear_step_cache()
+    uri = get_path("testdata/stdout-wf_v1_2.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri)
+    step = cwl_obj.steps[0]
+    output_type = cwl_utils.parser.cwl_v1_2_utils.type_for_step_output(
+        step, cwl_obj.outputs[0].outputSource
+    )
+    assert output_type == "File"
+    step_run = cwl_utils.parser.utils.load_step(step, cache=True)
+    assert step_run.outputs[0].type_ == "stdout"
+    assert step_run.outputs[0].outputBinding is None
+
+
+def test_load_step_prefetched() -> None:
+    """Processes loaded with workers=N are picked up from the loading index."""
+    cwl_utils.parser.utils.clear_step_cache()
+    uri = get_path("testdata/count-lines6-wf_v1_2.cwl").as_uri()
+    cwl_obj = load_document_by_uri(uri, workers=4)
+    step = cwl_obj.steps[0]
+    run_uri = step.loadingOptions.fetcher.urljoin(
+        cast(str, step.loadingOptions.fileuri), step.run
+    )
+    assert run_uri in cwl_obj.loadingOptions.idx
+    step_run = cwl_utils.parser.utils.load_step(step, cache=True)
+    assert step_run is cwl_obj.loadingOptions.idx[run_uri][0]
+    assert step_run.cwlVersion == "v1.2"
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is step_run
+    cwl_utils.parser.utils.clear_step_cache()
+    assert cwl_utils.parser.utils.load_step(step, cache=True) is not step_run
+
+
+def test_load_step_prefetched_changed(tmp_path: Path) -> None:
+    """Processes loaded with workers=N are not used once their file changed."""
+    cwl_utils.parser.utils.clear_step_cache()
+    for name in ("count-lines6-wf_v1_2.cwl", "wc3-tool_v1_2.cwl"):
+        shutil.copy(get_path(f"testdata/{name}"), tmp_path / name)
+    cwl_obj = load_document_by_uri(tmp_path / "count-lines6-wf_v1_2.cwl", workers=2)
+    step = cwl_obj.steps[0]
+    tool = tmp_path / "wc3-tool_v1_2.cwl"
+    tool.write_text(tool.read_text() + "\nlabel: changed\n")
+    step_run = cwl_utils.parser.utils.load_step(step, cache=True)
+    assert step_run.label == "changed"
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Test the compact pickling of loaded CWL objects."""
+
+import pickle  # nosec
+
+from ruamel.yaml.comments import CommentedMap
+from schema_salad.runtime import LoadingOptions
+
+from cwl_utils.parser import LazyProcess, load_document_by_uri, save
+from cwl_utils.parser import pickling
+from cwl_utils.parser.utils import load_step
+from .util import get_path
+
+
+def test_pickling_round_trip() -> None:
+    """Objects survive the round trip, without the heavy loading options."""
+    uri = get_path("testdata/md5sum_v12.cwl").as_uri()
+    wf = load_document_by_uri(uri)
+    load_step(wf.steps[0])
+    assert wf.loadingOptions.idx
+    data = pickling.dumps(wf)
+    assert len(data) < len(pickle.dumps(wf))
+    copy = pickling.loads(data)
+    assert save(copy) == save(wf)
+    assert copy.loadingOptions.fileuri == uri
+    assert not copy.loadingOptions.idx
+    assert copy.steps[0].loadingOptions is copy.loadingOptions
+    assert load_step(copy.steps[0]).id == load_step(wf.steps[0]).id
+
+
+def test_pickling_reattach() -> None:
+    """Unpickled objects can be attached to the options of the receiver."""
+    wf = load_document_by_uri(get_path("testdata/md5sum_v12.cwl"), lazy=True)
+    receiver = LoadingOptions()
+    copy = pickling.loads(pickling.dumps(wf), receiver)
+    assert copy.loadingOptions.idx is receiver.idx
+    assert copy.loadingOptions.fetcher is receiver.fetcher
+    run = copy.steps[0].run
+    assert isinstance(run, LazyProcess)
+    assert run.baseCommand == "my_md5sum"
+
+
+def test_pickling_source_lines() -> None:
+    """ruamel.yaml containers are pickled as plain ones."""
+    value = CommentedMap([("a", [1, 2])])
+    copy = pickling.loads(pickling.dumps(value))
+    assert type(copy) is dict
+    assert copy == {"a": [1, 2]}
+
+
+def test_pickling_shared_options() -> None:
+    """Each loads() call gets new options; others share them until reset()."""
+    data = pickling.dumps(load_document_by_uri(get_path("testdata/md5sum_v12.cwl")))
+    first, second = pickling.loads(data), pickling.loads(data)
+    assert first.loadingOptions.idx is not second.loadingOptions.idx
+    first, second = pickle.loads(data), pickle.loads(data)  # nosec
+    assert first.loadingOptions.idx is second.loadingOptions.idx
+    pickling.reset()
+    third = pickle.loads(data)  # nosec
+    assert third.loadingOptions.idx is not first.loadingOptions.idx
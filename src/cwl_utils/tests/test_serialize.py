@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Test writing CWL objects as JSON and YAML one object at a time."""
+
+import io
+import json
+
+import pytest
+from ruamel.yaml import YAML
+
+from cwl_utils.parser import dump_json, dump_yaml, load_document_by_uri, save
+from .util import get_path
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "md5sum_v12.cwl",
+        "revsort-packed.cwl",
+        "scatter-wf2_v1_2.cwl",
+        "workflows/count-lines16-wf.cwl",
+        "cond-wf-003.1.cwl",
+        "map-ordering-v1_0.cwl",
+        "record-output-wf_v1_1.cwl",
+        "wf2.cwl",
+    ],
+)
+@pytest.mark.parametrize("relative_uris", [True, False])
+def test_serialize(name: str, relative_uris: bool) -> None:
+    """The output is that of save(), in JSON and YAML."""
+    path = get_path(f"testdata/{name}")
+    obj = load_document_by_uri(path, load_all=True)
+    base_url = path.parent.as_uri()
+    expected = save(obj, base_url=base_url, relative_uris=relative_uris)
+    for indent in (None, 2):
+        stream = io.StringIO()
+        dump_json(obj, stream, base_url, relative_uris, indent=indent)
+        assert stream.getvalue() == json.dumps(expected, indent=indent)
+    stream = io.StringIO()
+    dump_yaml(obj, stream, base_url, relative_uris)
+    assert YAML(typ="safe").load(stream.getvalue()) == expected
+
+
+def test_serialize_yaml_scalars() -> None:
+    """Strings that look like other types stay strings."""
+    value = {
+        "a": ["true", "1", "", "null", "- x", "a: b", "multi\nline", "ünï", None],
+        "b": [[1, [2.5]], {}, [], {"c": False}],
+    }
+    stream = io.StringIO()
+    dump_yaml(value, stream)
+    assert YAML(typ="safe").load(stream.getvalue()) == value
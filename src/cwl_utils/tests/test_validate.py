@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Test the validation of CWL documents."""
+
+from pathlib import Path
+
+from cwl_utils.parser import validate_document, validate_documents
+from .util import get_path
+
+
+def test_validate_valid() -> None:
+    """Valid documents, including packed ones, have no diagnostics."""
+    assert validate_document(get_path("testdata/md5sum_v12.cwl")) == []
+    assert validate_document(get_path("testdata/revsort-packed.cwl")) == []
+
+
+def test_validate_invalid(tmp_path: Path) -> None:
+    """Errors are reported with their position in the document."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text(
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "inputs:\n"
+        "  x:\n"
+        "    type: string\n"
+        "    inputBinding: {separate: maybe}\n"
+        "outputs: []\n"
+    )
+    diagnostics = validate_document(broken)
+    assert diagnostics
+    assert all(d["uri"] == broken.as_uri() for d in diagnostics)
+    assert any(d["line"] == 6 and "maybe" in d["message"] for d in diagnostics)
+
+
+def test_validate_syntax_error(tmp_path: Path) -> None:
+    """YAML syntax errors are reported too."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text("cwlVersion: v1.2\nclass: [CommandLineTool\n")
+    [diagnostic] = validate_document(broken)
+    assert diagnostic["uri"] == broken.as_uri()
+    assert diagnostic["line"] is not None
+
+
+def test_validate_documents(tmp_path: Path) -> None:
+    """A batch gives the same results sequentially and with processes."""
+    broken = tmp_path / "broken.cwl"
+    broken.write_text("cwlVersion: v1.2\nclass: CommandLineTool\n")
+    paths = [
+        get_path("testdata/md5sum_v12.cwl"),
+        broken,
+        get_path("testdata/dockstore-tool-md5sum_v12.cwl"),
+    ]
+    results = validate_documents(paths)
+    assert list(results) == [path.as_uri() for path in paths]
+    assert [bool(d) for d in results.values()] == [False, True, False]
+    assert validate_documents(paths, workers=2) == results
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+"""Tests for loading whole directory trees of CWL documents."""
+
+from pathlib import Path
+
+import pytest
+
+from cwl_utils.parser import Workspace
+from cwl_utils.parser.utils import load_step
+
+TYPES = """\
+- name: sample
+  type: record
+  fields:
+    - name: id
+      type: string
+"""
+
+TOOL = """\
+cwlVersion: v1.2
+class: CommandLineTool
+baseCommand: echo
+requirements:
+  - class: SchemaDefRequirement
+    types:
+      - $import: types.yml
+inputs:
+  s: types.yml#sample
+outputs: []
+"""
+
+WORKFLOW = """\
+cwlVersion: v1.2
+class: Workflow
+requirements:
+  - class: SchemaDefRequirement
+    types:
+      - $import: types.yml
+inputs:
+  s: types.yml#sample
+outputs: []
+steps:
+  one:
+    run: tools/tool1.cwl
+    in: {s: s}
+    out: []
+"""
+
+
+def _tree(root: Path) -> None:
+    (root / "tools").mkdir()
+    (root / "types.yml").write_text(TYPES)
+    (root / "tools" / "types.yml").write_text(TYPES)
+    for i in (1, 2, 3):
+        (root / "tools" / f"tool{i}.cwl").write_text(TOOL)
+    (root / "wf.cwl").write_text(WORKFLOW)
+    (root / "broken.cwl").write_text("cwlVersion: v1.2\nclass: Nothing\n")
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_workspace(tmp_path: Path, workers: int | None) -> None:
+    """Documents are loaded once and shared documents are deduplicated."""
+    _tree(tmp_path)
+    workspace = Workspace(tmp_path).load(workers=workers)
+    assert len(workspace) == 4
+    assert list(workspace.errors) == [(tmp_path / "broken.cwl").as_uri()]
+    tools = [workspace.get(tmp_path / "tools" / f"tool{i}.cwl") for i in (1, 2, 3)]
+    records = {id(tool.requirements[0].types[0]) for tool in tools}
+    assert len(records) == 1
+    wf = workspace[(tmp_path / "wf.cwl").as_uri()]
+    assert load_step(wf.steps[0], cache=True) is tools[0]
+    assert workspace.dependencies[(tmp_path / "wf.cwl").as_uri()] == {
+        (tmp_path / "types.yml").as_uri(),
+        (tmp_path / "tools" / "tool1.cwl").as_uri(),
+    }
+    assert workspace.dependents(tmp_path / "tools" / "types.yml") == {
+        (tmp_path / "tools" / f"tool{i}.cwl").as_uri() for i in (1, 2, 3)
+    }
+    assert (tmp_path / "tools" / "types.yml").as_uri() in workspace.index
+    assert workspace.references(tmp_path / "tools" / "tool1.cwl") == [
+        ("$import", (tmp_path / "tools" / "types.yml").as_uri())
+    ]
+
+
+@pytest.mark.parametrize("workers", [None, 4])
+def test_workspace_refresh(tmp_path: Path, workers: int | None) -> None:
+    """Only changed documents and the documents importing them are reloaded."""
+    _tree(tmp_path)
+    workspace = Workspace(tmp_path).load(workers=workers)
+    wf_uri = (tmp_path / "wf.cwl").as_uri()
+    tool1_uri = (tmp_path / "tools" / "tool1.cwl").as_uri()
+    wf = workspace[wf_uri]
+    tool2 = workspace.get(tmp_path / "tools" / "tool2.cwl")
+    assert workspace.refresh(workers) == []
+
+    # same content, new modification time
+    (tmp_path / "wf.cwl").write_text(WORKFLOW)
+    assert workspace.refresh(workers) == []
+
+    (tmp_path / "tools" / "tool1.cwl").write_text(
+        TOOL.replace("baseCommand: echo", "baseCommand: cat")
+    )
+    assert workspace.refresh(workers) == [tool1_uri]
+    assert workspace[wf_uri] is wf
+    assert load_step(wf.steps[0], cache=True) is workspace[tool1_uri]
+    assert workspace[tool1_uri].baseCommand == "cat"
+
+    (tmp_path / "tools" / "types.yml").write_text(TYPES.replace("string", "int"))
+    assert workspace.refresh(workers) == [
+        (tmp_path / "tools" / f"tool{i}.cwl").as_uri() for i in (1, 2, 3)
+    ]
+    assert workspace[wf_uri] is wf
+    tool2_now = workspace.get(tmp_path / "tools" / "tool2.cwl")
+    assert tool2_now is not tool2
+    assert tool2_now.requirements[0].types[0].fields[0].type_ == "int"
+
+    (tmp_path / "broken.cwl").unlink()
+    (tmp_path / "tools" / "tool4.cwl").write_text(TOOL)
+    assert workspace.refresh(workers) == [(tmp_path / "tools" / "tool4.cwl").as_uri()]
+    assert not workspace.errors
+    assert len(workspace) == 5
@@ -21,13 +21,6 @@ from ruamel.yaml.scanner import ScannerError
 from cwl_utils.errors import MissingKeyField
 from cwl_utils.loghandler import _logger
 
-# Type hinting
-from cwl_utils.parser import cwl_v1_0, cwl_v1_1, cwl_v1_2
-
-# Load as 1.2 files
-from cwl_utils.parser.cwl_v1_2 import InputArraySchema as InputArraySchemaV1_2
-from cwl_utils.parser.cwl_v1_2 import InputEnumSchema as InputEnumSchemaV1_2
-
 fast_yaml = YAML(typ="safe")
 
 _USERNS: bool | None = None
@@ -368,6 +361,13 @@ def sanitise_schema_field(
     if isinstance(schema_field_item, str):
         return schema_field_item
 
+    # The generated parsers are slow to import, so only do it when needed
+    from cwl_utils.parser import cwl_v1_0, cwl_v1_1, cwl_v1_2
+
+    # Load as 1.2 files
+    from cwl_utils.parser.cwl_v1_2 import InputArraySchema as InputArraySchemaV1_2
+    from cwl_utils.parser.cwl_v1_2 import InputEnumSchema as InputEnumSchemaV1_2
+
     # Copy schema field
     schema_field_item = deepcopy(schema_field_item)
     required = True